@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Local stand-in for the ADS-Python channel module (ads), so the gridded-data
+scripts and interpolation_worker.py can be run and timed without ADS.
+
+It provides the calls the scripts use (Create_Python_ADS_Channel, get,
+Send_to_ADS, send, Close_Python_ADS_Channel) on a default in-memory
+LocalChannel, plus:
+    LocalChannel : request queue and reply list in one process
+    PipeChannel  : the worker side of a binary pipe (pickled frames)
+    WorkerProcess: starts interpolation_worker.py --pipe once and streams
+                   requests to it, the way ADS keeps one channel open
+
+A script selects it with
+    try:
+        import ads
+    except ImportError:
+        import ads_local as ads
+
+"""
+import os
+import pickle
+import subprocess
+import sys
+
+
+class LocalChannel(object):
+    """In-memory channel: post() requests, the worker get()s and send()s"""
+
+    def __init__(self):
+        self.requests=[]
+        self.replies=[]
+
+    def post(self,n,s=''):
+        """Queue one request (matrix n, string s)"""
+        self.requests.append((n,s))
+
+    def get(self):
+        """Next request, or (None,'close') once the queue is empty"""
+        return self.requests.pop(0) if self.requests else (None,'close')
+
+    def send(self,value):
+        self.replies.append(value)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class PipeChannel(object):
+    """Worker side of a pipe: one pickled (n,s) frame in, one list of values out"""
+
+    def __init__(self,rfile=None,wfile=None):
+        self.rfile=rfile or sys.stdin.buffer
+        self.wfile=wfile or sys.stdout.buffer
+        self._pending=[]
+
+    def get(self):
+        try:
+            return pickle.load(self.rfile)
+        except EOFError:
+            return None,'close'
+
+    def send(self,value):
+        self._pending.append(value)
+
+    def flush(self):
+        """Reply to the current request with everything sent since the last flush"""
+        pickle.dump(self._pending,self.wfile,protocol=pickle.HIGHEST_PROTOCOL)
+        self.wfile.flush()
+        self._pending=[]
+
+    def close(self):
+        pass
+
+
+class WorkerProcess(object):
+    """
+    Client of a persistent interpolation worker (ADS side of the channel).
+
+        worker=WorkerProcess()
+        worker.request(n,'load lp1')          # parse data, build interpolant
+        worker.request(gammas,'query lp1')    # values at many load gammas
+        worker.close()
+    """
+
+    def __init__(self,script=None,python=None):
+        script=script or os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                      'interpolation_worker.py')
+        self.proc=subprocess.Popen([python or sys.executable,script,'--pipe'],
+                                   stdin=subprocess.PIPE,stdout=subprocess.PIPE)
+
+    def request(self,n,s):
+        """Send one request and wait for its list of reply values"""
+        pickle.dump((n,s),self.proc.stdin,protocol=pickle.HIGHEST_PROTOCOL)
+        self.proc.stdin.flush()
+        return pickle.load(self.proc.stdout)
+
+    def close(self):
+        if self.proc.poll() is None:
+            pickle.dump((None,'close'),self.proc.stdin)
+            self.proc.stdin.close()
+            self.proc.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
+
+
+#Module-level API of the ads module, on one default channel
+channel=LocalChannel()
+
+
+def Create_Python_ADS_Channel():
+    return channel.get()
+
+
+def get():
+    return channel.get()
+
+
+def Send_to_ADS(value):
+    channel.send(value)
+
+
+def send(value):
+    channel.send(value)
+
+
+def Close_Python_ADS_Channel():
+    channel.close()
@@ -10,9 +10,9 @@ not one of the grid points.
 #Initialize
 import ads
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.interpolate import griddata
-plt.ioff()
+import pa_scripts_path
+pa_scripts_path.add_to_path()  #Shared loadpull_interpolation (reference-manual Scripts)
+from loadpull_interpolation import gamma_to_zload, default_fill_value, get_grid
 
 
 #---------------BEGIN GENERATE CONTOURS SECTION-------------------------------
@@ -20,6 +20,8 @@ plt.ioff()
 #The section below will import and parse raw data from ADS...
 Z0=50
 Use_Max=True
+#Interpolation method: 'linear' (fast), 'cubic', 'natural', 'rbf' (accurate) or 'nearest'
+Method='cubic'
 
 n,s=ads.get()
 GP_ref=n[0,0]
@@ -28,59 +30,18 @@ GP_ref=n[0,0]
 GP_Var=n[-1,::]
 
 #Derive Load Impedance from Gamma
-Gamma=np.abs(GP_Var)
-Phase=np.angle(GP_Var)
+Zload=gamma_to_zload(GP_Var,Z0)
+Zload_ref=gamma_to_zload(GP_ref,Z0)
 
-Gamma_ref=np.abs(GP_ref)
-Phase_ref=np.angle(GP_ref)
+#Stack the metric rows (one column each) to share one triangulation
+ZData=np.real(n[1:-1,::]).T
 
-Load_Gammas=Gamma*np.exp(1j*Phase)
-Zload=(np.conj(Z0)+Z0*Load_Gammas)/(1-Load_Gammas)
+#Value outside the measured impedances, per metric
+fill_value_v=default_fill_value(ZData,Use_Max)
 
-Load_Gamma_Ref=Gamma_ref*np.exp(1j*Phase_ref)
-Zload_ref=(np.conj(Z0)+Z0*Load_Gamma_Ref)/(1-Load_Gamma_Ref)
+#Interpolate all metrics at the reference impedance only
+zref=get_grid(Zload).interpolate(ZData,Zload_ref,method=Method,fill_value=fill_value_v)
 
-xi_ref=np.real(Zload_ref)
-yi_ref=np.imag(Zload_ref)
-#
-#The section below will generate contours based on the input data
-#
-#Split the data into R/I
-xi=np.real(Zload)
-yi=np.imag(Zload)
-#
-
-#find the closest point...
-cidx=0
-errormag=np.zeros((len(Zload),2))
-for i in range(0,len(Zload)):
-    errormag[i,1]=abs(Zload[i]-Zload_ref)
-    errormag[i,0]=i
-#Sort
-errormag=errormag[errormag[:,1].argsort()]
-
-Ax=np.zeros(int(len(Zload)/4))
-Ay=np.zeros(int(len(Zload)/4))
-A=Zload[int(errormag[0,0])]-Zload_ref
-for i in range(0,int(len(Zload)/4)):
-    Arr=(Zload[int(errormag[i,0])]-A)
-    Ax[i]=np.real(Arr)
-    Ay[i]=np.imag(Arr)
-
-xgrid, ygrid = np.meshgrid(Ax, Ay)
-
-for x in range(1,n.shape[0]-1):
-    ZData=np.real(n[x,::])
-    #Generate Contour Level Array
-    if (Use_Max):
-        Min_Value=np.min(ZData)
-        fill_value_v=Min_Value
-    else:
-        Max_Value=np.max(ZData)
-        fill_value_v=Max_Value
-        
-    #Interpolate Z data onto the grid
-    zgrid= griddata((xi,yi),ZData, (xgrid, ygrid),method='cubic',fill_value=fill_value_v)
-    
-    ads.send(zgrid[0,0].real)
+for value in zref:
+    ads.send(value.real)
 
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Long-lived interpolation worker for the ADS-Python channel.
+The channel is opened once and serves any number of requests, so imports,
+data parsing and interpolant setup are paid once per load-pull data set
+instead of once per ADS evaluation.
+
+Requests (n,s=ads.get()), s is a command and a grid data id:
+    'load <id>'  : n in the bulk_interpolate_gridded_data layout
+                   (row 0: reference gamma, rows 1..-2: metrics, last row:
+                   load gammas); keeps the interpolant under <id> and
+                   replies with every metric at the reference gamma
+    'query <id>' : n holds load gammas (any shape); replies with every
+                   metric at every gamma (gamma-major)
+    'error <id>' : as 'query', with the leave-one-out error estimate of
+                   every value instead (see GridInterpolant.error)
+    'unload <id>': drops the interpolant; replies nothing
+    'close'      : ends the worker
+The GRID_CACHE_SIZE most recently used interpolants are kept; older ones
+must be loaded again. A failed request is logged to stderr and replies
+NaN in every place a value was expected (one per metric per gamma;
+one per gamma for an id that was never loaded).
+
+Run from ADS in place of the per-call scripts, or locally with
+    python interpolation_worker.py --pipe     (see ads_local.WorkerProcess)
+The interpolation method is Method below, or --method linear|cubic|nearest|
+rbf|natural on the command line ('linear' for fast optimization loops,
+'rbf' for accuracy).
+
+"""
+import sys
+import traceback
+from collections import OrderedDict
+
+import numpy as np
+import pa_scripts_path
+pa_scripts_path.add_to_path()  #Shared loadpull_interpolation (reference-manual Scripts)
+from loadpull_interpolation import (gamma_to_zload, default_fill_value, get_grid, GridInterpolant,
+                                    GRID_CACHE_SIZE)
+
+Z0=50
+Use_Max=True
+Method='cubic'
+
+
+class InterpolationWorker(object):
+    """Parsed data sets and their interpolants, kept between requests"""
+
+    def __init__(self,z0=Z0,use_max=Use_Max,method=Method,cache_size=GRID_CACHE_SIZE):
+        self.z0=z0
+        self.use_max=use_max
+        self.method=method
+        self.cache_size=cache_size
+        self.interpolants=OrderedDict()
+        self.n_metrics={}  #per id, kept after eviction to size NaN replies
+
+    def load(self,grid_id,n):
+        """Parse one data set (bulk layout) and reply at its reference gamma"""
+        self.n_metrics[grid_id]=n.shape[0]-2
+        zload=gamma_to_zload(n[-1,::],self.z0)
+        zdata=np.real(n[1:-1,::]).T
+        self.interpolants.pop(grid_id,None)
+        self.interpolants[grid_id]=GridInterpolant(get_grid(zload),zdata,self.method,
+                                                   default_fill_value(zdata,self.use_max))
+        while len(self.interpolants)>self.cache_size:
+            self.interpolants.popitem(last=False)
+        return self.query(grid_id,n[0,0])
+
+    def interpolant(self,grid_id):
+        """Loaded interpolant, marked most recently used"""
+        if grid_id not in self.interpolants:
+            raise KeyError("Grid data '%s' is not loaded (or was evicted)" % grid_id)
+        self.interpolants.move_to_end(grid_id)
+        return self.interpolants[grid_id]
+
+    def query(self,grid_id,gammas):
+        """Every metric at every load gamma"""
+        values=self.interpolant(grid_id)(gamma_to_zload(gammas,self.z0))
+        return np.real(values).ravel()
+
+    def error(self,grid_id,gammas):
+        """Error estimate of every metric at every load gamma"""
+        return np.ravel(self.interpolant(grid_id).error(gamma_to_zload(gammas,self.z0)))
+
+    def unload(self,grid_id):
+        self.interpolants.pop(grid_id,None)
+        return []
+
+    def reply_length(self,n,s):
+        """Number of values request (n,s) expects"""
+        command,_,grid_id=str(s).strip().partition(' ')
+        try:
+            if command=='load':
+                return max(np.shape(n)[0]-2,1)
+            if command in ('query','error'):
+                return np.size(n)*self.n_metrics.get(grid_id,1)
+        except Exception:
+            pass
+        return 0 if command=='unload' else 1
+
+    def handle(self,n,s):
+        command,_,grid_id=str(s).strip().partition(' ')
+        if command=='load':
+            return self.load(grid_id,np.asarray(n))
+        if command=='query':
+            return self.query(grid_id,np.asarray(n))
+        if command=='error':
+            return self.error(grid_id,np.asarray(n))
+        if command=='unload':
+            return self.unload(grid_id)
+        raise ValueError("Unknown request '%s'" % s)
+
+    def serve(self,channel):
+        """Answer requests until 'close'; a failed request replies NaN of the expected length"""
+        while True:
+            n,s=channel.get()
+            if n is None or str(s).strip()=='close':
+                break
+            try:
+                values=self.handle(n,s)
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+                values=[np.nan]*self.reply_length(n,s)
+            for value in values:
+                channel.send(value)
+            if hasattr(channel,'flush'):
+                channel.flush()
+
+
+if __name__=='__main__':
+    method=sys.argv[sys.argv.index('--method')+1] if '--method' in sys.argv else Method
+    if '--pipe' in sys.argv:
+        from ads_local import PipeChannel
+        channel=PipeChannel()
+    else:
+        try:
+            import ads as channel
+        except ImportError:
+            import ads_local as channel
+    InterpolationWorker(method=method).serve(channel)
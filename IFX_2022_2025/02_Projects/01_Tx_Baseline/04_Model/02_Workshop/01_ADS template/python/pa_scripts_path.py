@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Puts the PA Design Reference Manual scripts on sys.path, so the scripts in
+this folder import the one shared loadpull_interpolation module from there.
+The folder is PA_SCRIPTS_DIR when set, otherwise the first
+PA_Design_Reference_Manual/Scripts found walking up from this folder (the
+workshop folder can move within the repository). Call it before importing
+loadpull_interpolation:
+    import pa_scripts_path
+    pa_scripts_path.add_to_path()
+    from loadpull_interpolation import gamma_to_zload, interpolate_at
+
+"""
+import os
+import sys
+
+
+def find_scripts_dir(start=None):
+    """Folder holding loadpull_interpolation.py (ImportError if none is found)"""
+    if os.environ.get('PA_SCRIPTS_DIR'):
+        return os.path.abspath(os.environ['PA_SCRIPTS_DIR'])
+    folder=os.path.dirname(os.path.abspath(start or __file__))
+    while True:
+        candidate=os.path.join(folder,'PA_Design_Reference_Manual','Scripts')
+        if os.path.isfile(os.path.join(candidate,'loadpull_interpolation.py')):
+            return candidate
+        parent=os.path.dirname(folder)
+        if parent==folder:
+            raise ImportError("PA_Design_Reference_Manual/Scripts not found above %s; "
+                              "set PA_SCRIPTS_DIR to its location" % os.path.dirname(
+                                  os.path.abspath(start or __file__)))
+        folder=parent
+
+
+def add_to_path():
+    """Append the scripts folder to sys.path (once) and return it"""
+    folder=find_scripts_dir()
+    if folder not in sys.path:
+        sys.path.append(folder)
+    return folder
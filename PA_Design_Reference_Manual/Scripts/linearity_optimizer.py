@@ -16,18 +16,25 @@ Includes:
 - Pareto front analysis
 - Trade-off visualization
 - Manufacturing yield prediction
+- Structured run telemetry (JSON lines or callback)
 
 Author: PA Design Reference Manual Project
 Date: February 1, 2026
 """
 
+import json
+import os
+import sys
+import time
+import tracemalloc
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.optimize import differential_evolution
-from scipy.stats import norm
+from scipy.optimize import OptimizeResult, differential_evolution, minimize
+from scipy.stats import norm, qmc
 import pandas as pd
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Iterable, Protocol, runtime_checkable
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -69,6 +76,62 @@ class PAPerformance:
     cost_usd: float
     yield_percent: float
 
+# Metric names shared by PAPerformance and PAPerformanceBatch (column order)
+PERFORMANCE_METRICS = (
+    'pout_dbm', 'pae_percent', 'im3_dbc', 'acpr_dbc',
+    'gain_db', 'p1db_dbm', 'cost_usd', 'yield_percent',
+)
+
+@dataclass
+class PAPerformanceBatch:
+    """PA Performance Metrics for many designs (one array per metric)"""
+    pout_dbm: np.ndarray
+    pae_percent: np.ndarray
+    im3_dbc: np.ndarray
+    acpr_dbc: np.ndarray
+    gain_db: np.ndarray
+    p1db_dbm: np.ndarray
+    cost_usd: np.ndarray
+    yield_percent: np.ndarray
+    
+    def __len__(self) -> int:
+        return self.pout_dbm.size
+        
+    def __getitem__(self, idx: int) -> PAPerformance:
+        """Return the metrics of a single design as a PAPerformance"""
+        return PAPerformance(**{m: getattr(self, m).flat[idx]
+                                for m in PERFORMANCE_METRICS})
+                                
+    def to_frame(self) -> pd.DataFrame:
+        """Flatten the batch into a DataFrame with one column per metric"""
+        return pd.DataFrame({m: getattr(self, m).ravel()
+                             for m in PERFORMANCE_METRICS})
+
+# ============================================================================
+# SIMULATOR BACKEND PROTOCOL
+# ============================================================================
+
+@runtime_checkable
+class SimulatorBackend(Protocol):
+    """
+    Interface consumed by SweetSpotFinder, ParetoAnalyzer.evaluate and
+    MultiObjectiveOptimizer
+    
+    PASimulator is the analytical implementation; EM/circuit simulators or
+    measured data plug in by providing the same two members. Slow backends
+    that evaluate one point at a time are in pa_backends.py.
+    """
+    specs: PASpecs
+    
+    def simulate_batch(self,
+                       width_um,
+                       bias_iq_ma,
+                       load_z_real_ohm,
+                       load_z_imag_ohm,
+                       harmonic_tuning=False,
+                       vdd_v=None) -> 'PAPerformanceBatch':
+        ...
+
 # ============================================================================
 # PA SIMULATION ENGINE (Simplified Model)
 # ============================================================================
@@ -76,6 +139,9 @@ class PAPerformance:
 class PASimulator:
     """Simplified PA performance simulator for optimization"""
     
+    # Bump whenever the model equations change (invalidates cached results)
+    VERSION = '1.0'
+    
     def __init__(self, specs: PASpecs):
         self.specs = specs
         
@@ -87,11 +153,67 @@ class PASimulator:
         replace with actual EM/circuit simulation or measured data.
         """
         
+        batch = self.simulate_batch(
+            design.transistor_width_um,
+            design.bias_iq_ma,
+            design.load_z_real_ohm,
+            design.load_z_imag_ohm,
+            design.harmonic_tuning
+        )
+        return batch[0]
+        
+    def yield_from_margins(self, pout_dbm, pae_percent, im3_dbc) -> np.ndarray:
+        """Heuristic yield (%) from the margins of Pout, PAE and IM3 to spec"""
+        margin_pout = pout_dbm - self.specs.pout_dbm
+        margin_pae = pae_percent - self.specs.pae_min_percent
+        margin_im3 = im3_dbc - self.specs.im3_max_dbc
+        
+        # Yield drops if margins are small
+        with np.errstate(over='ignore'):
+            yield_pout = np.where(margin_pout > 0,
+                                  1.0 - np.exp(-margin_pout / 2.0), 0.5)
+            yield_pae = np.where(margin_pae > 0,
+                                 1.0 - np.exp(-margin_pae / 5.0), 0.5)
+            yield_im3 = np.where(margin_im3 < 0,
+                                 1.0 - np.exp(-np.abs(margin_im3) / 3.0), 0.5)
+        return 100 * (yield_pout * yield_pae * yield_im3)
+        
+    def simulate_batch(self,
+                       width_um,
+                       bias_iq_ma,
+                       load_z_real_ohm,
+                       load_z_imag_ohm,
+                       harmonic_tuning=False,
+                       vdd_v=None) -> PAPerformanceBatch:
+        """
+        Simulate PA performance for many designs in one vectorized pass
+        
+        All inputs are broadcast against each other with NumPy rules, so
+        column arrays, scalars and open grids (np.ix_) can be mixed freely.
+        
+        Args:
+            width_um: Transistor width (um)
+            bias_iq_ma: Quiescent bias current (mA)
+            load_z_real_ohm: Real part of the load impedance (Ohm)
+            load_z_imag_ohm: Imaginary part of the load impedance (Ohm)
+            harmonic_tuning: Harmonic tuning flags (bool)
+            
+        Returns:
+            PAPerformanceBatch with one array per metric (broadcast shape)
+        """
+        
+        if vdd_v is None:
+            vdd_v = self.specs.vdd_v
+            
         # Extract design parameters
-        W = design.transistor_width_um
-        Iq = design.bias_iq_ma
-        Zr = design.load_z_real_ohm
-        Zi = design.load_z_imag_ohm
+        W, Iq, Zr, Zi, tuned, Vdd = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(width_um, dtype=float)),
+            np.asarray(bias_iq_ma, dtype=float),
+            np.asarray(load_z_real_ohm, dtype=float),
+            np.asarray(load_z_imag_ohm, dtype=float),
+            np.asarray(harmonic_tuning, dtype=bool),
+            np.asarray(vdd_v, dtype=float)
+        )
         
         # Calculate bias class factor (A=1.0, AB=0.7, B=0.5)
         bias_class_factor = Iq / 100.0  # Normalized to 100mA
@@ -99,11 +221,11 @@ class PASimulator:
         # Output Power Model
         # Pout increases with transistor width and optimal load
         Zopt = 50.0  # Optimal load impedance
-        Z_penalty = abs(Zr - Zopt) / Zopt
+        Z_penalty = np.abs(Zr - Zopt) / Zopt
         pout_dbm = (
             10 * np.log10(W / 100) +  # Width contribution
             self.specs.pout_dbm +
-            10 * np.log10(self.specs.vdd_v / 28) -  # Voltage scaling
+            10 * np.log10(Vdd / 28) -  # Voltage scaling
             2 * Z_penalty  # Load mismatch penalty
         )
         
@@ -132,23 +254,13 @@ class PASimulator:
         # Cost Model
         cost_base = 5.0  # Base component cost
         cost_width = W / 100 * 2.0  # Larger transistor = higher cost
-        cost_tuning = 3.0 if design.harmonic_tuning else 0.0
+        cost_tuning = np.where(tuned, 3.0, 0.0)
         cost_usd = cost_base + cost_width + cost_tuning
         
         # Yield Model (simplified - affected by tight specs)
-        margin_pout = pout_dbm - self.specs.pout_dbm
-        margin_pae = pae_percent - self.specs.pae_min_percent
-        margin_im3 = im3_dbc - self.specs.im3_max_dbc
+        yield_percent = self.yield_from_margins(pout_dbm, pae_percent, im3_dbc)
         
-        # Yield drops if margins are small
-        yield_factors = [
-            1.0 - np.exp(-margin_pout / 2.0) if margin_pout > 0 else 0.5,
-            1.0 - np.exp(-margin_pae / 5.0) if margin_pae > 0 else 0.5,
-            1.0 - np.exp(-abs(margin_im3) / 3.0) if margin_im3 < 0 else 0.5,
-        ]
-        yield_percent = 100 * np.prod(yield_factors)
-        
-        return PAPerformance(
+        return PAPerformanceBatch(
             pout_dbm=pout_dbm,
             pae_percent=pae_percent,
             im3_dbc=im3_dbc,
@@ -159,21 +271,590 @@ class PASimulator:
             yield_percent=yield_percent
         )
 
+# ============================================================================
+# RUN TELEMETRY
+# ============================================================================
+
+class RunTelemetry:
+    """
+    Structured progress and performance events of a study
+    
+    Instrumented steps (find_sweet_spot, find_pareto_front, optimize,
+    optimize_pareto) emit one 'stage' event with wall time, evaluations per
+    second, evaluation-cache hits and peak memory; the optimizers also emit
+    one 'generation' event per generation (best score, hypervolume,
+    evaluations so far). Events are kept in .events and optionally
+    appended to a JSON-lines file and/or passed to a callback.
+    
+    Usage:
+        telemetry = RunTelemetry('study.jsonl', quiet=True)
+        SweetSpotFinder(sim, telemetry=telemetry).find_sweet_spot()
+        print(telemetry.frame('stage'))
+    """
+    
+    def __init__(self, path: str = None, callback=None, quiet: bool = False,
+                 run: str = None, trace_memory: bool = False):
+        """
+        Args:
+            path: JSON-lines file the events are appended to
+            callback: Called with every event dict
+            quiet: Suppress the printed reports of instrumented methods
+            run: Label added to every event (e.g. a spec or study name)
+            trace_memory: Also report the per-stage peak of traced
+                          allocations (tracemalloc, slower) next to the
+                          process peak RSS
+        """
+        self.path = path
+        self.callback = callback
+        self.quiet = quiet
+        self.run = run
+        self.trace_memory = trace_memory
+        self.events = []
+        
+    def log(self, *args, **kwargs) -> None:
+        """print() unless quiet"""
+        if not self.quiet:
+            print(*args, **kwargs)
+            
+    def emit(self, event: str, **fields) -> Dict:
+        """Record one event and forward it to the file and callback"""
+        record = {'event': event, 'time': time.time()}
+        if self.run is not None:
+            record['run'] = self.run
+        record.update(fields)
+        self.events.append(record)
+        if self.path is not None:
+            with open(self.path, 'a') as fh:
+                fh.write(json.dumps(record, default=self._json_value) + '\n')
+        if self.callback is not None:
+            self.callback(record)
+        return record
+        
+    @staticmethod
+    def _json_value(value):
+        return value.item() if isinstance(value, np.generic) else str(value)
+        
+    @staticmethod
+    def peak_rss_mb() -> float:
+        """Peak resident memory of this process in MB (None where unavailable)"""
+        try:
+            import resource
+        except ImportError:  # Windows
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1e6 if sys.platform == 'darwin' else peak * 1024 / 1e6
+        
+    @contextmanager
+    def stage(self, name: str, cache=None, **fields):
+        """
+        Time a block and emit its 'stage' event when it ends
+        
+        The block may add fields to the yielded dict, in particular
+        'evaluations' (simulated design points) for the throughput.
+        
+        Args:
+            name: Stage name
+            cache: EvaluationCache whose hit/miss counts during the block
+                   are reported (e.g. CachedSimulator.cache)
+            **fields: Extra fields of the event
+        """
+        info = dict(fields)
+        hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+        tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        t0 = time.perf_counter()
+        try:
+            yield info
+        except BaseException as exc:
+            info['error'] = repr(exc)
+            raise
+        finally:
+            wall = time.perf_counter() - t0
+            record = {'stage': name, 'wall_s': wall, **info}
+            if info.get('evaluations') is not None:
+                record['evals_per_s'] = info['evaluations'] / wall if wall > 0 else None
+            if cache is not None:
+                hits, misses = cache.hits - hits, cache.misses - misses
+                record.update(cache_hits=hits, cache_misses=misses,
+                              cache_hit_rate=hits / (hits + misses) if hits + misses else None)
+            record['peak_rss_mb'] = self.peak_rss_mb()
+            if self.trace_memory:
+                record['peak_traced_mb'] = tracemalloc.get_traced_memory()[1] / 1e6
+                if tracing:
+                    tracemalloc.stop()
+            self.emit('stage', **record)
+            
+    def generation(self, stage: str, generation: int, **fields) -> None:
+        """Emit one optimizer 'generation' event"""
+        self.emit('generation', stage=stage, generation=int(generation), **fields)
+        
+    def frame(self, event: str = 'stage') -> pd.DataFrame:
+        """Recorded events of one kind ('stage' or 'generation') as a DataFrame"""
+        return pd.DataFrame([e for e in self.events if e['event'] == event])
+
 # ============================================================================
 # SWEET SPOT FINDER
 # ============================================================================
 
+# Sweep axis name -> PASimulator.simulate_batch keyword
+SWEEP_AXES = {
+    'width_um': 'width_um',
+    'iq_ma': 'bias_iq_ma',
+    'zl_ohm': 'load_z_real_ohm',
+    'zi_ohm': 'load_z_imag_ohm',
+    'vdd_v': 'vdd_v',
+    'harmonic_tuning': 'harmonic_tuning',
+}
+
+# Values used for axes that are not swept (vdd_v=None -> specs.vdd_v)
+SWEEP_DEFAULTS = {
+    'width_um': 200.0,
+    'iq_ma': 50.0,
+    'zl_ohm': 50.0,
+    'zi_ohm': 0.0,
+    'vdd_v': None,
+    'harmonic_tuning': False,
+}
+
+@dataclass
+class SweepResult:
+    """Labelled N-D sweep result (one grid-shaped array per metric)"""
+    axes: Dict[str, np.ndarray]
+    metrics: Dict[str, np.ndarray]
+    fixed: Dict[str, float]
+    
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(len(v) for v in self.axes.values())
+        
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+        
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self.metrics.values())
+        
+    def __getitem__(self, metric: str) -> np.ndarray:
+        return self.metrics[metric]
+        
+    def argmax(self, metric: str = 'fom') -> Dict[str, float]:
+        """Axis coordinates of the grid point maximizing a metric"""
+        idx = np.unravel_index(np.nanargmax(self.metrics[metric]), self.shape)
+        return {name: vals[i] for (name, vals), i in zip(self.axes.items(), idx)}
+        
+    def design_at(self, point: Dict[str, float]) -> PADesign:
+        """Build a PADesign from axis coordinates (plus fixed values)"""
+        values = {**SWEEP_DEFAULTS, **self.fixed, **point}
+        return PADesign(
+            transistor_width_um=values['width_um'],
+            bias_iq_ma=values['iq_ma'],
+            load_z_real_ohm=values['zl_ohm'],
+            load_z_imag_ohm=values['zi_ohm'],
+            harmonic_tuning=bool(values['harmonic_tuning']),
+            input_match_optimize=True
+        )
+        
+    def to_frame(self) -> pd.DataFrame:
+        """Flatten to a long DataFrame (axes first, C order) for small grids"""
+        grids = np.meshgrid(*self.axes.values(), indexing='ij')
+        columns = {name: g.ravel() for name, g in zip(self.axes, grids)}
+        columns.update({m: a.ravel() for m, a in self.metrics.items()})
+        return pd.DataFrame(columns)
+
+@dataclass
+class RunningStats:
+    """Streaming count/min/max/mean/std of one metric (NaNs skipped)"""
+    count: int = 0
+    min: float = np.inf
+    max: float = -np.inf
+    mean: float = 0.0
+    m2: float = 0.0
+    
+    def update(self, values: np.ndarray) -> None:
+        """Merge a chunk of values (Chan et al. parallel variance update)"""
+        v = values[np.isfinite(values)]
+        n = v.size
+        if n == 0:
+            return
+        mean = v.mean()
+        delta = mean - self.mean
+        total = self.count + n
+        self.m2 += ((v - mean) ** 2).sum() + delta ** 2 * self.count * n / total
+        self.mean += delta * n / total
+        self.count = total
+        self.min = min(self.min, float(v.min()))
+        self.max = max(self.max, float(v.max()))
+        
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / self.count)) if self.count else np.nan
+
+@dataclass
+class SweepSummary:
+    """Bounded-memory digest of a streamed sweep"""
+    axes: Dict[str, np.ndarray]
+    fixed: Dict[str, float]
+    n_points: int
+    top: pd.DataFrame
+    pareto: pd.DataFrame
+    stats: Dict[str, RunningStats]
+    histograms: Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray, np.ndarray]]
+    
+    def stats_frame(self) -> pd.DataFrame:
+        """One row per metric: count, min, max, mean, std"""
+        return pd.DataFrame({
+            m: {'count': st.count, 'min': st.min, 'max': st.max,
+                'mean': st.mean, 'std': st.std}
+            for m, st in self.stats.items()
+        }).T
+
 class SweetSpotFinder:
     """Find optimal operating point for best linearity-efficiency trade-off"""
     
-    def __init__(self, simulator: PASimulator):
+    def __init__(self, simulator: SimulatorBackend, telemetry: RunTelemetry = None):
         self.sim = simulator
+        self.telemetry = telemetry if telemetry is not None else RunTelemetry()
+        
+    @staticmethod
+    def figure_of_merit(im3_dbc, pae_percent, pout_dbm, out=None):
+        """
+        Figure of Merit used to rank sweep points
+        
+        Prioritize: linearity > efficiency > power. When `out` is given the
+        result is accumulated in place into that array.
+        """
+        out = np.multiply(im3_dbc, -2.0, out=out)  # Lower IM3 is better (more negative)
+        out += pae_percent * 0.5  # Higher PAE is better
+        out += pout_dbm * 0.3  # Higher Pout is better
+        return out
+        
+    def sweep(self,
+              axes: Dict[str, np.ndarray],
+              fixed: Dict[str, float] = None,
+              metrics: List[str] = None,
+              dtype=np.float64,
+              chunk_points: int = 2**20) -> SweepResult:
+        """
+        Evaluate the full Cartesian grid of any number of named axes
+        
+        Args:
+            axes: Ordered {axis_name: values}; names from SWEEP_AXES
+            fixed: Values for axes that are not swept (see SWEEP_DEFAULTS)
+            metrics: Metrics to keep (PERFORMANCE_METRICS and/or 'fom');
+                     defaults to all of them
+            dtype: Storage dtype of the result arrays (np.float32 halves memory)
+            chunk_points: Max grid points simulated per vectorized block
+            
+        Returns:
+            SweepResult with one grid-shaped array per kept metric
+        """
+        
+        unknown = set(axes) | set(fixed or {})
+        unknown -= set(SWEEP_AXES)
+        if unknown:
+            raise ValueError(f"Unknown sweep axes: {sorted(unknown)}")
+            
+        axes = {name: np.asarray(vals) for name, vals in axes.items()}
+        fixed = {k: v for k, v in (fixed or {}).items() if k not in axes}
+        metrics = list(metrics or PERFORMANCE_METRICS + ('fom',))
+        shape = tuple(len(v) for v in axes.values())
+        out = {m: np.empty(shape, dtype=dtype) for m in metrics}
+        
+        # Split the grid into an outer loop over the leading axes and a
+        # vectorized block over the trailing axes of at most chunk_points
+        ndim = len(shape)
+        split = ndim
+        while split > 0 and int(np.prod(shape[split - 1:])) <= chunk_points:
+            split -= 1
+        split = min(split, max(ndim - 1, 0))
+        inner_shape = shape[split:]
+        
+        base = {SWEEP_AXES[k]: v for k, v in {**SWEEP_DEFAULTS, **fixed}.items()}
+        names = list(axes)
+        for outer in np.ndindex(*shape[:split]):
+            kwargs = dict(base)
+            for k, i in enumerate(outer):
+                kwargs[SWEEP_AXES[names[k]]] = axes[names[k]][i]
+            for k, name in enumerate(names[split:]):
+                view = [1] * len(inner_shape)
+                view[k] = inner_shape[k]
+                kwargs[SWEEP_AXES[name]] = axes[name].reshape(view)
+                
+            perf = self.sim.simulate_batch(**kwargs)
+            for m in metrics:
+                if m != 'fom':
+                    out[m][outer] = getattr(perf, m).reshape(inner_shape)
+            if 'fom' in out:
+                self.figure_of_merit(perf.im3_dbc.reshape(inner_shape),
+                                     perf.pae_percent.reshape(inner_shape),
+                                     perf.pout_dbm.reshape(inner_shape),
+                                     out=out['fom'][outer])
+                                     
+        return SweepResult(axes=axes, metrics=out, fixed=fixed)
+        
+    def sweep_streaming(self,
+                        axes: Dict[str, np.ndarray],
+                        fixed: Dict[str, float] = None,
+                        metrics: List[str] = None,
+                        top_k: int = 100,
+                        rank_by: str = 'fom',
+                        pareto_objectives: List[str] = None,
+                        pareto_maximize: List[bool] = None,
+                        histograms: Dict[Tuple[str, str], Tuple] = None,
+                        histogram_bins: int = 100,
+                        chunk_points: int = 2**20,
+                        sink=None) -> SweepSummary:
+        """
+        Evaluate a Cartesian grid in constant memory, keeping only summaries
+        
+        The grid is walked in flat chunks of chunk_points; each chunk updates
+        a top-k table, an online Pareto archive, running statistics and 2-D
+        histograms and is then discarded, so memory does not grow with the
+        number of grid points.
+        
+        Args:
+            axes: Ordered {axis_name: values}; names from SWEEP_AXES
+            fixed: Values for axes that are not swept (see SWEEP_DEFAULTS)
+            metrics: Metrics to summarize (PERFORMANCE_METRICS and/or 'fom')
+            top_k: Number of best points (by rank_by, descending) to keep
+            rank_by: Metric used for the top-k table
+            pareto_objectives: Metrics of the online Pareto archive (None = off)
+            pareto_maximize: Direction per Pareto objective (True = maximize)
+            histograms: {(x, y): ((x_min, x_max), (y_min, y_max))} over axis
+                        or metric names; a range of None uses the axis span
+                        (metrics need an explicit range)
+            histogram_bins: Bins per histogram dimension
+            chunk_points: Grid points simulated per vectorized block
+            sink: Optional callable receiving every evaluated chunk as
+                  {column: array}, e.g. ResultStore.append
+            
+        Returns:
+            SweepSummary
+        """
+        
+        unknown = (set(axes) | set(fixed or {})) - set(SWEEP_AXES)
+        if unknown:
+            raise ValueError(f"Unknown sweep axes: {sorted(unknown)}")
+            
+        axes = {name: np.asarray(vals) for name, vals in axes.items()}
+        fixed = {k: v for k, v in (fixed or {}).items() if k not in axes}
+        metrics = list(metrics or PERFORMANCE_METRICS + ('fom',))
+        pareto_objectives = list(pareto_objectives or [])
+        histograms = dict(histograms or {})
+        shape = tuple(len(v) for v in axes.values())
+        n_points = int(np.prod(shape))
+        
+        kept = list(dict.fromkeys(metrics + [rank_by] + pareto_objectives))
+        columns = list(axes) + kept
+        
+        hist_ranges = {}
+        for (x, y), rng in histograms.items():
+            rng = rng or (None, None)
+            for c, r in zip((x, y), rng):
+                if c not in axes and c not in kept:
+                    raise ValueError(f"Histogram column {c!r} is neither a swept axis "
+                                     f"nor one of the metrics {kept}")
+                if c not in axes and r is None:
+                    raise ValueError(f"Histogram of metric {c!r} needs an explicit "
+                                     f"range; only swept axes default to their span")
+            hist_ranges[(x, y)] = tuple(
+                r if r is not None else (float(np.min(axes[c])), float(np.max(axes[c])))
+                for c, r in zip((x, y), rng))
+        hist = {key: np.zeros((histogram_bins, histogram_bins), dtype=np.int64)
+                for key in hist_ranges}
+        stats = {m: RunningStats() for m in metrics}
+        top = None
+        archive = None
+        
+        base = {SWEEP_AXES[k]: v for k, v in {**SWEEP_DEFAULTS, **fixed}.items()}
+        for start in range(0, n_points, chunk_points):
+            flat = np.arange(start, min(start + chunk_points, n_points))
+            index = np.unravel_index(flat, shape)
+            chunk = {name: vals[i] for (name, vals), i in zip(axes.items(), index)}
+            
+            kwargs = dict(base)
+            kwargs.update({SWEEP_AXES[name]: v for name, v in chunk.items()})
+            perf = self.sim.simulate_batch(**kwargs)
+            for m in kept:
+                if m != 'fom':
+                    chunk[m] = getattr(perf, m)
+            if 'fom' in kept:
+                chunk['fom'] = self.figure_of_merit(perf.im3_dbc, perf.pae_percent, perf.pout_dbm)
+                
+            if sink is not None:
+                sink({c: chunk[c] for c in columns})
+            for m in metrics:
+                stats[m].update(chunk[m])
+            for (x, y), rng in hist_ranges.items():
+                hist[(x, y)] += np.histogram2d(chunk[x], chunk[y], bins=histogram_bins,
+                                               range=rng)[0].astype(np.int64)
+                                               
+            # Top-k: best of (previous top-k + best k of this chunk)
+            if top_k:
+                score = np.nan_to_num(chunk[rank_by], nan=-np.inf)
+                if len(score) > top_k:
+                    sel = np.argpartition(-score, top_k)[:top_k]
+                    cand = {c: chunk[c][sel] for c in columns}
+                else:
+                    cand = {c: chunk[c] for c in columns}
+                if top is not None:
+                    cand = {c: np.concatenate([top[c], cand[c]]) for c in columns}
+                score = np.nan_to_num(cand[rank_by], nan=-np.inf)
+                keep = np.argsort(-score, kind='stable')[:top_k]
+                top = {c: cand[c][keep] for c in columns}
+                
+            # Online Pareto archive: front of (archive + chunk)
+            if pareto_objectives:
+                cand = chunk if archive is None else {
+                    c: np.concatenate([archive[c], chunk[c]]) for c in columns}
+                sign = np.where(pareto_maximize, 1.0, -1.0)  # larger is better
+                obj = np.column_stack([cand[m] for m in pareto_objectives]) * sign
+                mask = ParetoAnalyzer.pareto_mask(obj)
+                archive = {c: cand[c][mask] for c in columns}
+                
+        return SweepSummary(
+            axes=axes,
+            fixed=fixed,
+            n_points=n_points,
+            top=pd.DataFrame(top if top is not None else {c: [] for c in columns}),
+            pareto=pd.DataFrame(archive if archive is not None else {c: [] for c in columns}),
+            stats=stats,
+            histograms={key: (h,) + tuple(np.linspace(*r, histogram_bins + 1)
+                                          for r in hist_ranges[key])
+                        for key, h in hist.items()}
+        )
+        
+    def refine(self,
+               ranges: Dict[str, Tuple[float, float]],
+               fixed: Dict[str, float] = None,
+               metrics: List[str] = None,
+               coarse_samples: int = 9,
+               levels: int = 4,
+               n_best: int = None,
+               contour_levels: Dict[str, float] = None,
+               steep_factor: float = 2.0) -> pd.DataFrame:
+        """
+        Adaptive coarse-to-fine search (quadtree in 2-D, octree in 3-D, ...)
+        
+        Starts from a coarse grid and at every level splits only the cells
+        that hold the best FOM, that a spec contour passes through, or whose
+        IM3/PAE span is steep compared with the other cells. All points lie
+        on the lattice of a uniform grid with (coarse_samples-1)*2**levels+1
+        samples per axis, which is the resolution reached near the optimum.
+        
+        Args:
+            ranges: Ordered {axis_name: (min, max)}; names from SWEEP_AXES
+            fixed: Values for axes that are not searched
+            metrics: Metrics to keep (PERFORMANCE_METRICS and/or 'fom')
+            coarse_samples: Samples per axis of the starting grid
+            levels: Number of subdivision levels
+            n_best: Cells refined around the FOM maximum (default 2**ndim)
+            contour_levels: {metric: level} contours to trace
+                            (default: IM3 and PAE specs)
+            steep_factor: Refine cells whose IM3 or PAE span exceeds this
+                          multiple of the median span at that level
+                          
+        Returns:
+            DataFrame of the evaluated points (axes, metrics, 'level')
+        """
+        
+        unknown = (set(ranges) | set(fixed or {})) - set(SWEEP_AXES)
+        if unknown:
+            raise ValueError(f"Unknown sweep axes: {sorted(unknown)}")
+            
+        names = list(ranges)
+        ndim = len(names)
+        fixed = {k: v for k, v in (fixed or {}).items() if k not in ranges}
+        metrics = list(metrics or PERFORMANCE_METRICS + ('fom',))
+        if contour_levels is None:
+            contour_levels = {'im3_dbc': self.sim.specs.im3_max_dbc,
+                              'pae_percent': self.sim.specs.pae_min_percent}
+        n_best = n_best or 2 ** ndim
+        
+        lo = np.array([ranges[n][0] for n in names], dtype=float)
+        hi = np.array([ranges[n][1] for n in names], dtype=float)
+        n_fine = (coarse_samples - 1) * 2 ** levels + 1
+        step = (hi - lo) / (n_fine - 1)
+        dims = (n_fine,) * ndim
+        
+        # Corner offsets of a unit cell, (2**ndim, ndim)
+        corners = np.indices((2,) * ndim).reshape(ndim, -1).T
+        
+        base = {SWEEP_AXES[k]: v for k, v in {**SWEEP_DEFAULTS, **fixed}.items()}
+        needed = set(metrics) - {'fom'} | set(contour_levels) | {'im3_dbc', 'pae_percent', 'pout_dbm'}
+        keys = np.empty(0, dtype=np.int64)
+        points = []
+        values = {m: [] for m in needed | {'fom', 'level'}}
+        
+        def evaluate(idx, level):
+            nonlocal keys
+            k, first = np.unique(np.ravel_multi_index(idx.T, dims), return_index=True)
+            new = ~np.isin(k, keys)
+            if not new.any():
+                return
+            idx = idx[first[new]]
+            coords = lo + idx * step
+            kwargs = dict(base)
+            for j, name in enumerate(names):
+                kwargs[SWEEP_AXES[name]] = coords[:, j]
+            perf = self.sim.simulate_batch(**kwargs)
+            for m in needed:
+                values[m].append(getattr(perf, m))
+            values['fom'].append(self.figure_of_merit(perf.im3_dbc, perf.pae_percent, perf.pout_dbm))
+            values['level'].append(np.full(len(idx), level))
+            points.append(coords)
+            keys = np.concatenate([keys, k[new]])
+            
+        def corner_values(cells, size, metric):
+            """(n_cells, 2**ndim) metric values at the corners of each cell"""
+            flat = np.concatenate(values[metric])
+            order = np.argsort(keys)
+            idx = (cells[:, None, :] + corners[None] * size).reshape(-1, ndim)
+            pos = np.searchsorted(keys, np.ravel_multi_index(idx.T, dims), sorter=order)
+            return flat[order[pos]].reshape(len(cells), -1)
+            
+        # Level 0: the coarse grid and its cells
+        size = 2 ** levels
+        coarse = np.indices((coarse_samples,) * ndim).reshape(ndim, -1).T * size
+        evaluate(coarse, 0)
+        cells = np.indices((coarse_samples - 1,) * ndim).reshape(ndim, -1).T * size
+        
+        for level in range(1, levels + 1):
+            fom = corner_values(cells, size, 'fom').max(axis=1)
+            split = fom >= np.sort(fom)[-min(n_best, len(fom))]  # ties included
+            
+            for metric in ('im3_dbc', 'pae_percent'):
+                v = corner_values(cells, size, metric)
+                span = v.max(axis=1) - v.min(axis=1)
+                split |= span > steep_factor * np.median(span)
+            for metric, value in contour_levels.items():
+                v = corner_values(cells, size, metric)
+                split |= (v.min(axis=1) < value) & (v.max(axis=1) > value)
+                
+            size //= 2
+            cells = (cells[split][:, None, :] + corners[None] * size).reshape(-1, ndim)
+            evaluate((cells[:, None, :] + corners[None] * size).reshape(-1, ndim), level)
+            
+        coords = np.concatenate(points)
+        df = pd.DataFrame({name: coords[:, j] for j, name in enumerate(names)})
+        for m in metrics:
+            df[m] = np.concatenate(values[m])
+        df['level'] = np.concatenate(values['level'])
+        return df
         
     def find_sweet_spot(self, 
                        transistor_width: float = 200.0,
                        iq_range: Tuple[float, float] = (10, 100),
                        zl_range: Tuple[float, float] = (20, 100),
-                       n_samples: int = 50) -> Tuple[PADesign, PAPerformance, pd.DataFrame]:
+                       n_samples: int = 50,
+                       adaptive: bool = False,
+                       coarse_samples: int = 9,
+                       streaming: bool = False,
+                       top_k: int = 1000) -> Tuple[PADesign, PAPerformance, pd.DataFrame]:
         """
         Sweep bias current and load impedance to find IM3 sweet spot
         
@@ -182,60 +863,62 @@ class SweetSpotFinder:
             iq_range: (min, max) bias current range (mA)
             zl_range: (min, max) load impedance range (Ohm)
             n_samples: Number of samples per dimension
+            adaptive: Refine a coarse grid (see refine) until its spacing
+                      near the optimum is at least as fine as n_samples
+            coarse_samples: Samples per dimension of the adaptive start grid
+            streaming: Evaluate the grid in constant memory (see
+                       sweep_streaming) and return only the top_k points
+            top_k: Points kept in streaming mode
             
         Returns:
             optimal_design, optimal_performance, results_dataframe
         """
         
-        print("=" * 60)
-        print("SWEET SPOT FINDER - Linearity Optimization")
-        print("=" * 60)
-        
-        # Create search grid
-        iq_vals = np.linspace(iq_range[0], iq_range[1], n_samples)
-        zl_vals = np.linspace(zl_range[0], zl_range[1], n_samples)
+        log = self.telemetry.log
+        log("=" * 60)
+        log("SWEET SPOT FINDER - Linearity Optimization")
+        log("=" * 60)
         
-        results = []
+        fixed = {'width_um': transistor_width, 'zi_ohm': 0.0,
+                 'harmonic_tuning': False}
+        metrics = ['pout_dbm', 'pae_percent', 'im3_dbc', 'gain_db',
+                   'cost_usd', 'yield_percent', 'fom']
         
-        print(f"\nSearching {n_samples}x{n_samples} = {n_samples**2} design points...")
-        
-        for i, iq in enumerate(iq_vals):
-            for j, zl in enumerate(zl_vals):
-                design = PADesign(
-                    transistor_width_um=transistor_width,
-                    bias_iq_ma=iq,
-                    load_z_real_ohm=zl,
-                    load_z_imag_ohm=0.0,
-                    harmonic_tuning=False,
-                    input_match_optimize=True
+        mode = 'adaptive' if adaptive else 'streaming' if streaming else 'grid'
+        with self.telemetry.stage('sweet_spot', cache=getattr(self.sim, 'cache', None),
+                                  mode=mode) as stage:
+            if adaptive:
+                levels = max(int(np.ceil(np.log2((n_samples - 1) / (coarse_samples - 1)))), 0)
+                n_fine = (coarse_samples - 1) * 2 ** levels + 1
+                df = self.refine(
+                    ranges={'iq_ma': iq_range, 'zl_ohm': zl_range},
+                    fixed=fixed,
+                    metrics=metrics,
+                    coarse_samples=coarse_samples,
+                    levels=levels
                 )
+                log(f"\nAdaptive search: {len(df)} design points "
+                    f"(uniform {n_fine}x{n_fine} = {n_fine**2} at the same resolution)")
+            else:
+                # Create search grid
+                iq_vals = np.linspace(iq_range[0], iq_range[1], n_samples)
+                zl_vals = np.linspace(zl_range[0], zl_range[1], n_samples)
                 
-                perf = self.sim.simulate_performance(design)
-                
-                # Calculate Figure of Merit (FOM)
-                # Prioritize: linearity > efficiency > power
-                fom = (
-                    -perf.im3_dbc * 2.0 +  # Lower IM3 is better (more negative)
-                    perf.pae_percent * 0.5 +  # Higher PAE is better
-                    perf.pout_dbm * 0.3  # Higher Pout is better
-                )
+                log(f"\nSearching {n_samples}x{n_samples} = {n_samples**2} design points...")
                 
-                results.append({
-                    'iq_ma': iq,
-                    'zl_ohm': zl,
-                    'pout_dbm': perf.pout_dbm,
-                    'pae_percent': perf.pae_percent,
-                    'im3_dbc': perf.im3_dbc,
-                    'gain_db': perf.gain_db,
-                    'cost_usd': perf.cost_usd,
-                    'yield_percent': perf.yield_percent,
-                    'fom': fom
-                })
-            
-            if (i + 1) % 10 == 0:
-                print(f"  Progress: {(i+1)*100//n_samples}%")
-        
-        df = pd.DataFrame(results)
+                axes = {'iq_ma': iq_vals, 'zl_ohm': zl_vals}
+                if streaming:
+                    df = self.sweep_streaming(axes, fixed=fixed, metrics=metrics,
+                                              top_k=top_k).top
+                else:
+                    result = self.sweep(
+                        axes=axes,
+                        fixed=fixed,
+                        metrics=metrics
+                    )
+                    df = result.to_frame()
+                    
+            stage['evaluations'] = n_samples**2 if streaming and not adaptive else len(df)
         
         # Find optimal point
         best_idx = df['fom'].idxmax()
@@ -261,16 +944,16 @@ class SweetSpotFinder:
             yield_percent=optimal['yield_percent']
         )
         
-        print("\n" + "=" * 60)
-        print("SWEET SPOT FOUND:")
-        print("=" * 60)
-        print(f"  Bias Current (Iq): {optimal['iq_ma']:.1f} mA")
-        print(f"  Load Impedance:    {optimal['zl_ohm']:.1f} Ω")
-        print(f"  Output Power:      {optimal['pout_dbm']:.2f} dBm")
-        print(f"  PAE:              {optimal['pae_percent']:.1f} %")
-        print(f"  IM3:              {optimal['im3_dbc']:.1f} dBc")
-        print(f"  Figure of Merit:   {optimal['fom']:.2f}")
-        print("=" * 60 + "\n")
+        log("\n" + "=" * 60)
+        log("SWEET SPOT FOUND:")
+        log("=" * 60)
+        log(f"  Bias Current (Iq): {optimal['iq_ma']:.1f} mA")
+        log(f"  Load Impedance:    {optimal['zl_ohm']:.1f} Ω")
+        log(f"  Output Power:      {optimal['pout_dbm']:.2f} dBm")
+        log(f"  PAE:              {optimal['pae_percent']:.1f} %")
+        log(f"  IM3:              {optimal['im3_dbc']:.1f} dBc")
+        log(f"  Figure of Merit:   {optimal['fom']:.2f}")
+        log("=" * 60 + "\n")
         
         return optimal_design, optimal_perf, df
 
@@ -281,66 +964,678 @@ class SweetSpotFinder:
 class ParetoAnalyzer:
     """Identify Pareto-optimal designs for multi-objective optimization"""
     
+    # Max pairwise comparisons materialized at once in dominance checks
+    BLOCK_ELEMENTS = 2**22
+    # Below this size (rows, or rows per side in merges) the
+    # divide-and-conquer recursion compares pairwise
+    LEAF_SIZE = 64
+    # Pre-filtering stops when a filter row removes less than this fraction
+    MIN_FILTER_GAIN = 0.01
+    # Monte Carlo samples of hypervolume for more than 3 objectives
+    HV_SAMPLES = 100_000
+    
+    @staticmethod
+    def objective_matrix(designs: pd.DataFrame,
+                         objectives: List[str],
+                         maximize: List[bool]) -> np.ndarray:
+        """Objective columns as a float matrix, sign-flipped so larger is better"""
+        obj_matrix = designs[objectives].to_numpy(dtype=float, copy=True)
+        
+        # Flip sign for minimization objectives
+        for i, should_max in enumerate(maximize):
+            if not should_max:
+                obj_matrix[:, i] = -obj_matrix[:, i]
+                
+        return obj_matrix
+        
+    @staticmethod
+    def dominates(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+        """Pairwise dominance: result[i, j] is True if p[i] dominates q[j]"""
+        ge = (p[:, None, :] >= q[None, :, :]).all(axis=2)
+        gt = (p[:, None, :] > q[None, :, :]).any(axis=2)
+        return ge & gt
+        
+    @staticmethod
+    def _front_2d(obj: np.ndarray) -> np.ndarray:
+        """Sort-and-scan front for 2 objectives, O(n log n)"""
+        f0, f1 = obj[:, 0], obj[:, 1]
+        order = np.lexsort((-f1, -f0))
+        a0, a1 = f0[order], f1[order]
+        
+        # Group equal f0 values; the first row of each group has its best f1
+        starts = np.flatnonzero(np.r_[True, a0[1:] != a0[:-1]])
+        group = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(a0)]))
+        best_in_group = a1[starts][group]
+        
+        # Best f1 among all groups with strictly larger f0
+        running = np.maximum.accumulate(a1)
+        best_before = np.r_[-np.inf, running[starts[1:] - 1]][group]
+        
+        keep = (a1 == best_in_group) & (a1 > best_before)
+        mask = np.zeros(len(obj), dtype=bool)
+        mask[order[keep]] = True
+        return mask
+        
+    @classmethod
+    def _weakly_dominated(cls, a: np.ndarray, b: np.ndarray, dims: List[int]) -> np.ndarray:
+        """
+        True for each row of b with some row of a at least as large in every
+        objective of dims
+        
+        Jensen-style divide and conquer on the objectives: split both sets at
+        the median of dims[0]; upper rows of a cover lower rows of b in that
+        objective, so that pair recurses on the remaining objectives. Two
+        objectives are a sort-and-scan, one a maximum, giving
+        O((|a| + |b|) log^(len(dims) - 1)) overall.
+        """
+        if len(a) == 0 or len(b) == 0:
+            return np.zeros(len(b), dtype=bool)
+        if len(dims) == 1:
+            return a[:, dims[0]].max() >= b[:, dims[0]]
+        if len(dims) == 2:
+            j, k = dims
+            order = np.argsort(-a[:, j], kind='stable')
+            best_k = np.maximum.accumulate(a[order, k])
+            count = np.searchsorted(-a[order, j], -b[:, j], side='right')
+            return (count > 0) & (best_k[np.maximum(count - 1, 0)] >= b[:, k])
+        if len(a) * len(b) <= cls.LEAF_SIZE**2:
+            cols = list(dims)
+            return (a[:, None, cols] >= b[None, :, cols]).all(axis=2).any(axis=0)
+            
+        j = dims[0]
+        values = np.concatenate([a[:, j], b[:, j]])
+        pivot = np.median(values)
+        if pivot <= values.min():
+            above = values[values > pivot]
+            if len(above) == 0:
+                # All equal in this objective: it never decides dominance
+                return cls._weakly_dominated(a, b, dims[1:])
+            pivot = above.min()
+        a_hi, b_hi = a[:, j] >= pivot, b[:, j] >= pivot
+        
+        dominated = np.zeros(len(b), dtype=bool)
+        dominated[b_hi] = cls._weakly_dominated(a[a_hi], b[b_hi], dims)
+        lo = np.flatnonzero(~b_hi)
+        dominated[lo] = cls._weakly_dominated(a[~a_hi], b[lo], dims)
+        rest = lo[~dominated[lo]]
+        dominated[rest] = cls._weakly_dominated(a[a_hi], b[rest], dims[1:])
+        return dominated
+        
+    @classmethod
+    def _front_kung(cls, obj: np.ndarray) -> np.ndarray:
+        """
+        Kung's divide-and-conquer skyline for 3+ objectives, O(n log^(d-2) n)
+        
+        Duplicate rows are merged first, so among the distinct rows left
+        "dominates" is just "at least as large everywhere". In lexicographic
+        descending order no row is dominated by a later one, and the upper
+        half of any range is at least as good in the first objective, so the
+        merge only asks which lower-half front rows are covered by an
+        upper-half front row in the remaining objectives.
+        """
+        mask = np.zeros(len(obj), dtype=bool)
+        if len(obj) == 0:
+            return mask
+        unique, inverse = np.unique(obj, axis=0, return_inverse=True)
+        order = np.lexsort(tuple(-unique[:, k] for k in reversed(range(unique.shape[1]))))
+        ranked = unique[order]
+        dims = list(range(1, obj.shape[1]))
+        
+        def front(lo: int, hi: int) -> np.ndarray:
+            if hi - lo <= cls.LEAF_SIZE:
+                block = ranked[lo:hi]
+                ge = (block[:, None, :] >= block[None, :, :]).all(axis=2)
+                np.fill_diagonal(ge, False)
+                return lo + np.flatnonzero(~ge.any(axis=0))
+            mid = (lo + hi) // 2
+            top = front(lo, mid)
+            bottom = front(mid, hi)
+            keep = ~cls._weakly_dominated(ranked[top], ranked[bottom], dims)
+            return np.concatenate([top, bottom[keep]])
+            
+        on_front = np.zeros(len(unique), dtype=bool)
+        on_front[order[front(0, len(unique))]] = True
+        return on_front[inverse.ravel()]
+        
+    @classmethod
+    def _front_kung_filtered(cls, obj: np.ndarray, n_filters: int = 256) -> np.ndarray:
+        """
+        Kung front after discarding rows dominated by a few strong filter rows
+        
+        The filter rows are those with the best rank sum; everything they
+        dominate is off the front. Applying them one at a time to a shrinking
+        candidate set usually removes almost all rows in a few linear passes
+        before the divide-and-conquer step. Filtering stops once a pass
+        removes less than MIN_FILTER_GAIN of the candidates (dense sweeps
+        whose fronts are large), where the linear passes no longer pay off.
+        """
+        if len(obj) <= 4 * n_filters:
+            return cls._front_kung(obj)
+        ranks = np.argsort(np.argsort(obj, axis=0), axis=0).sum(axis=1)
+        best = np.argpartition(-ranks, n_filters)[:n_filters]
+        survivors = np.arange(len(obj))
+        for f in obj[best[np.argsort(-ranks[best])]]:
+            cand = obj[survivors]
+            dominated = (f >= cand).all(axis=1) & (f > cand).any(axis=1)
+            survivors = survivors[~dominated]
+            if np.count_nonzero(dominated) < cls.MIN_FILTER_GAIN * len(cand):
+                break
+        mask = np.zeros(len(obj), dtype=bool)
+        mask[survivors[cls._front_kung(obj[survivors])]] = True
+        return mask
+        
+    @classmethod
+    def pareto_mask(cls, obj_matrix: np.ndarray) -> np.ndarray:
+        """
+        Boolean mask of non-dominated rows (all objectives maximized)
+        
+        Rows containing NaN are never Pareto-optimal. Identical rows do not
+        dominate each other, so duplicates of a front point are all kept.
+        """
+        obj_matrix = np.asarray(obj_matrix, dtype=float)
+        valid = ~np.isnan(obj_matrix).any(axis=1)
+        obj = obj_matrix[valid]
+        n_obj = obj.shape[1]
+        
+        if len(obj) == 0:
+            sub = np.zeros(0, dtype=bool)
+        elif n_obj == 1:
+            sub = obj[:, 0] == obj[:, 0].max()
+        elif n_obj == 2:
+            sub = cls._front_2d(obj)
+        else:
+            sub = cls._front_kung_filtered(obj)
+            
+        mask = np.zeros(len(obj_matrix), dtype=bool)
+        mask[valid] = sub
+        return mask
+        
+    @staticmethod
+    def _hypervolume_2d(points: np.ndarray) -> float:
+        """Area dominated by positive 2-D points w.r.t. the origin (sweep in x)"""
+        order = np.argsort(-points[:, 0], kind='stable')
+        y_max = np.maximum.accumulate(points[order, 1])
+        gain = np.diff(y_max, prepend=0.0)
+        return float(np.sum(points[order, 0] * gain))
+        
+    @staticmethod
+    def _hypervolume_3d(points: np.ndarray) -> float:
+        """
+        Sweep in z with an incrementally updated 2-D staircase, O(n log n)
+        plus list moves (fine for fronts of 10^5 points)
+        """
+        from bisect import bisect_left, bisect_right
+        order = np.argsort(-points[:, 2], kind='stable')
+        p = points[order].tolist()
+        depth = -np.diff(points[order, 2], append=0.0)
+        
+        xs, ys = [], []  # 2-D front: x ascending, y descending
+        area = volume = 0.0
+        for (px, py, _), dz in zip(p, depth):
+            i = bisect_left(xs, px)
+            if not (i < len(xs) and ys[i] >= py):
+                # Remove the staircase points the new one dominates and add
+                # the area it covers above the old staircase
+                j = bisect_right(xs, px)
+                k = j
+                while k > 0 and ys[k - 1] <= py:
+                    k -= 1
+                lefts = [xs[k - 1] if k else 0.0] + xs[k:j]
+                rights = xs[k:j] + [px]
+                heights = ys[k:j] + [ys[j] if j < len(ys) else 0.0]
+                area += sum((r - l) * (py - h) for l, r, h in zip(lefts, rights, heights))
+                xs[k:j] = [px]
+                ys[k:j] = [py]
+            volume += area * dz
+        return float(volume)
+        
+    @classmethod
+    def _hypervolume_mc(cls, points: np.ndarray, n_samples: int, seed: int) -> float:
+        """Monte Carlo estimate: dominated fraction of the bounding box"""
+        upper = points.max(axis=0)
+        samples = np.random.default_rng(seed).random((n_samples, points.shape[1])) * upper
+        covered = np.zeros(n_samples, dtype=bool)
+        block = max(1, cls.BLOCK_ELEMENTS // (len(points) * points.shape[1]))
+        for start in range(0, n_samples, block):
+            s = samples[start:start + block]
+            covered[start:start + block] = (points[None] >= s[:, None]).all(axis=2).any(axis=1)
+        return float(np.prod(upper) * covered.mean())
+        
+    @classmethod
+    def hypervolume(cls, obj_matrix: np.ndarray, reference: np.ndarray,
+                    n_samples: int = None, seed: int = 0) -> float:
+        """
+        Hypervolume indicator: volume dominated by the points, bounded by reference
+        
+        Exact for up to 3 objectives (sort-and-sweep in 2-D, a z sweep over
+        a 2-D staircase in 3-D; dominated points simply add nothing), Monte
+        Carlo on the non-dominated subset for more.
+        
+        Args:
+            obj_matrix: Objective matrix, larger is better (see objective_matrix)
+            reference: One value per objective, worse than the designs of
+                       interest; points not better in every objective add nothing
+            n_samples: Monte Carlo samples (default HV_SAMPLES)
+            seed: Monte Carlo seed (fixed, so successive fronts compare fairly)
+            
+        Returns:
+            Hypervolume in the product of the objective units
+        """
+        obj = np.asarray(obj_matrix, dtype=float)
+        obj = obj[~np.isnan(obj).any(axis=1)] - np.asarray(reference, dtype=float)
+        obj = obj[(obj > 0).all(axis=1)]
+        if len(obj) == 0:
+            return 0.0
+            
+        n_obj = obj.shape[1]
+        if n_obj == 1:
+            return float(obj.max())
+        if n_obj == 2:
+            return cls._hypervolume_2d(obj)
+        if n_obj == 3:
+            return cls._hypervolume_3d(obj)
+        # Fewer comparisons per sample against the non-dominated subset
+        obj = obj[cls.pareto_mask(obj)]
+        return cls._hypervolume_mc(obj, n_samples or cls.HV_SAMPLES, seed)
+        
+    @staticmethod
+    def evaluate(backend: SimulatorBackend, designs: pd.DataFrame) -> pd.DataFrame:
+        """
+        Simulate a table of designs and append the performance columns
+        
+        Args:
+            backend: Any SimulatorBackend (analytical, cached, slow/async)
+            designs: DataFrame with width_um, iq_ma, zl_ohm and optionally
+                     zi_ohm, vdd_v, harmonic_tuning columns (SWEEP_AXES names)
+                     
+        Returns:
+            Copy of `designs` with one column per metric, ready for
+            find_pareto_front
+        """
+        
+        missing = {'width_um', 'iq_ma', 'zl_ohm'} - set(designs.columns)
+        if missing:
+            raise ValueError(f"designs is missing columns: {sorted(missing)}")
+            
+        kwargs = {SWEEP_AXES[name]: designs[name].to_numpy()
+                  for name in SWEEP_AXES if name in designs}
+        kwargs.setdefault('load_z_imag_ohm', 0.0)
+        
+        perf = backend.simulate_batch(**kwargs)
+        evaluated = designs.copy()
+        for m in PERFORMANCE_METRICS:
+            evaluated[m] = np.broadcast_to(getattr(perf, m), (len(designs),))
+        return evaluated
+        
     @staticmethod
     def find_pareto_front(designs: pd.DataFrame, 
                           objectives: List[str],
-                          maximize: List[bool]) -> pd.DataFrame:
+                          maximize: List[bool],
+                          telemetry: RunTelemetry = None) -> pd.DataFrame:
         """
         Find Pareto-optimal solutions
         
+        Uses sort-and-scan for 2 objectives and divide-and-conquer for 3+,
+        so large sweeps are handled in sub-quadratic time.
+        
         Args:
             designs: DataFrame with design parameters and objectives
             objectives: List of column names to optimize
             maximize: List of bool (True=maximize, False=minimize) for each objective
+            telemetry: Receives the 'pareto_front' stage event (and
+                       silences the report when quiet)
             
         Returns:
             DataFrame containing only Pareto-optimal designs
         """
         
-        # Convert to numpy array (make a copy to allow modifications)
-        obj_matrix = designs[objectives].values.copy()
+        telemetry = telemetry if telemetry is not None else RunTelemetry()
+        with telemetry.stage('pareto_front', designs=len(designs),
+                             objectives=len(objectives)) as stage:
+            obj_matrix = ParetoAnalyzer.objective_matrix(designs, objectives, maximize)
+            is_pareto = ParetoAnalyzer.pareto_mask(obj_matrix)
+            stage['pareto_optimal'] = int(is_pareto.sum())
         
-        # Flip sign for minimization objectives
-        for i, should_max in enumerate(maximize):
-            if not should_max:
-                obj_matrix[:, i] = -obj_matrix[:, i]
+        pareto_designs = designs[is_pareto].copy()
+        pareto_designs['pareto_optimal'] = True
         
-        # Find Pareto front
-        is_pareto = np.ones(len(obj_matrix), dtype=bool)
+        telemetry.log("\nPareto Front Analysis:")
+        telemetry.log(f"  Total designs: {len(designs)}")
+        telemetry.log(f"  Pareto-optimal: {len(pareto_designs)} ({100*len(pareto_designs)/len(designs):.1f}%)")
         
-        for i, point in enumerate(obj_matrix):
-            if is_pareto[i]:
-                # Check if any other point dominates this one
-                is_pareto[is_pareto] = np.any(
-                    obj_matrix[is_pareto] > point, axis=1
-                )
-                is_pareto[i] = True  # Keep current point
+        return pareto_designs
         
-        pareto_designs = designs[is_pareto].copy()
+    @staticmethod
+    def find_pareto_front_chunked(chunks: Iterable[pd.DataFrame],
+                                  objectives: List[str],
+                                  maximize: List[bool],
+                                  telemetry: RunTelemetry = None) -> pd.DataFrame:
+        """
+        Find Pareto-optimal solutions of a dataset streamed in chunks
+        
+        Only the running front (archive) is kept in memory, so inputs larger
+        than RAM can be processed, e.g. pd.read_csv(path, chunksize=10**6).
+        
+        Args:
+            chunks: Iterable of DataFrames with the same columns
+            objectives: List of column names to optimize
+            maximize: List of bool (True=maximize, False=minimize) for each objective
+            telemetry: Receives the 'pareto_front_chunked' stage event (and
+                       silences the report when quiet)
+            
+        Returns:
+            DataFrame containing only Pareto-optimal designs
+        """
+        
+        telemetry = telemetry if telemetry is not None else RunTelemetry()
+        archive = None
+        total = 0
+        
+        with telemetry.stage('pareto_front_chunked', objectives=len(objectives)) as stage:
+            for chunk in chunks:
+                total += len(chunk)
+                candidates = chunk if archive is None else pd.concat([archive, chunk])
+                obj_matrix = ParetoAnalyzer.objective_matrix(candidates, objectives, maximize)
+                archive = candidates[ParetoAnalyzer.pareto_mask(obj_matrix)]
+            stage['designs'] = total
+            stage['pareto_optimal'] = 0 if archive is None else len(archive)
+            
+        if archive is None:
+            raise ValueError("No chunks to analyze")
+            
+        pareto_designs = archive.copy()
         pareto_designs['pareto_optimal'] = True
         
-        print(f"\nPareto Front Analysis:")
-        print(f"  Total designs: {len(designs)}")
-        print(f"  Pareto-optimal: {len(pareto_designs)} ({100*len(pareto_designs)/len(designs):.1f}%)")
+        telemetry.log("\nPareto Front Analysis (chunked):")
+        telemetry.log(f"  Total designs: {total}")
+        telemetry.log(f"  Pareto-optimal: {len(pareto_designs)} ({100*len(pareto_designs)/max(total, 1):.1f}%)")
         
         return pareto_designs
+        
+    @staticmethod
+    def dominance_report(designs: pd.DataFrame,
+                         pareto_designs: pd.DataFrame,
+                         objectives: List[str],
+                         maximize: List[bool]) -> pd.DataFrame:
+        """
+        Report which Pareto-optimal designs dominate each design
+        
+        Args:
+            designs: DataFrame with all designs
+            pareto_designs: Front returned by find_pareto_front(_chunked)
+            objectives: List of column names to optimize
+            maximize: List of bool (True=maximize, False=minimize) for each objective
+            
+        Returns:
+            DataFrame indexed like `designs` with 'n_dominators' (number of
+            front designs dominating the row) and 'dominated_by' (index label
+            of the first dominating front design, missing if non-dominated)
+        """
+        
+        points = ParetoAnalyzer.objective_matrix(designs, objectives, maximize)
+        front = ParetoAnalyzer.objective_matrix(pareto_designs, objectives, maximize)
+        
+        n_dominators = np.zeros(len(points), dtype=np.int64)
+        first = np.full(len(points), -1, dtype=np.int64)
+        
+        if len(front):
+            block = max(1, ParetoAnalyzer.BLOCK_ELEMENTS // (len(front) * points.shape[1]))
+            for start in range(0, len(points), block):
+                dom = ParetoAnalyzer.dominates(front, points[start:start + block])
+                n_dominators[start:start + block] = dom.sum(axis=0)
+                first[start:start + block] = np.where(dom.any(axis=0), dom.argmax(axis=0), -1)
+                
+        labels = pareto_designs.index.to_numpy()
+        dominated_by = [labels[i] if i >= 0 else None for i in first]
+        
+        return pd.DataFrame({'n_dominators': n_dominators,
+                             'dominated_by': dominated_by},
+                            index=designs.index)
 
 # ============================================================================
 # MULTI-OBJECTIVE GENETIC ALGORITHM
 # ============================================================================
 
+class WeightedFitness:
+    """
+    Weighted-score fitness for Differential Evolution (to minimize)
+    
+    Accepts one candidate (shape (4,)) or a whole population in scipy's
+    vectorized layout (shape (4, S)) and scores it with one simulate_batch
+    call. Being a plain module-level class it pickles, so scipy can also
+    ship it to a process pool (workers=N). After record_objectives, the
+    objective matrix of every simulated design is kept for take_found.
+    """
+    
+    def __init__(self, simulator: SimulatorBackend, specs: PASpecs, weights: Dict[str, float]):
+        self.sim = simulator
+        self.specs = specs
+        self.weights = weights
+        self.evaluations = 0  # designs scored in this process
+        self.known = None  # (designs, fitness) answered without simulating
+        self.objectives = None  # (metrics, sign) kept for take_found
+        self.found = []
+        
+    def __call__(self, x: np.ndarray):
+        x = np.asarray(x, dtype=float)
+        single = x.ndim == 1
+        cols = x.reshape(x.shape[0], -1)
+        fitness = np.empty(cols.shape[1])
+        todo = np.ones(cols.shape[1], dtype=bool)
+        
+        if self.known is not None:
+            designs, energies = self.known
+            match = np.isclose(cols.T[:, None, :], designs[None],
+                               rtol=0.0, atol=1e-9).all(axis=2)
+            todo = ~match.any(axis=1)
+            fitness[~todo] = energies[match.argmax(axis=1)[~todo]]
+            
+        if todo.any():
+            new = cols[:, todo]
+            self.evaluations += new.shape[1]
+            perf = self.sim.simulate_batch(new[0], new[1], new[2], new[3], False)
+            # Negative score (since we minimize)
+            fitness[todo] = -(self.score(perf) - self.penalty(perf))
+            if self.objectives is not None:
+                metrics, sign = self.objectives
+                self.found.append(np.column_stack([getattr(perf, m) for m in metrics]) * sign)
+        return float(fitness[0]) if single else fitness
+        
+    def record_objectives(self, metrics: List[str], maximize: List[bool]):
+        """Keep the larger-is-better objectives of every design simulated from now on"""
+        self.objectives = (list(metrics), np.where(maximize, 1.0, -1.0))
+        self.found = []
+        
+    def take_found(self) -> np.ndarray:
+        """Objective matrix recorded since the last call (None if nothing was)"""
+        found, self.found = self.found, []
+        return np.vstack(found) if found else None
+        
+    def preload(self, designs: np.ndarray = None, fitness: np.ndarray = None):
+        """
+        Answer these already-scored designs without simulating them
+        
+        differential_evolution scores its init population before the first
+        generation; a resumed or continued run passes the fitness it saved
+        for that population here instead. The 1e-9 tolerance absorbs
+        scipy's rescaling round trip but not finite-difference steps.
+        Call without arguments to forget them.
+        """
+        self.known = None if designs is None else (np.atleast_2d(designs).astype(float),
+                                                    np.ravel(fitness).astype(float))
+        
+    def penalty(self, perf) -> np.ndarray:
+        """Penalties for not meeting specs (any object with metric arrays)"""
+        penalty = 0.0
+        penalty = penalty + 1000 * np.maximum(perf.im3_dbc - self.specs.im3_max_dbc, 0.0)
+        penalty = penalty + 1000 * np.maximum(self.specs.pout_dbm - perf.pout_dbm, 0.0)
+        penalty = penalty + 500 * np.maximum(self.specs.pae_min_percent - perf.pae_percent, 0.0)
+        return penalty
+        
+    def score(self, perf) -> np.ndarray:
+        """Weighted multi-objective score (to maximize)"""
+        weights = self.weights
+        return (
+            weights.get('pae', 0.3) * perf.pae_percent / 70.0 +  # Normalized to max PAE
+            weights.get('im3', 0.4) * (-perf.im3_dbc) / 60.0 +  # Normalized to best IM3
+            weights.get('pout', 0.2) * (perf.pout_dbm - 30) / 20.0 +  # Normalized range
+            weights.get('cost', 0.1) * (1 - perf.cost_usd / 20.0)  # Normalized cost
+        )
+
+@dataclass
+class HypervolumeTracker:
+    """
+    Hypervolume of everything found so far, with a stall counter
+    
+    Each generation is merged into a non-dominated archive, so the
+    hypervolume never decreases even when the population contracts
+    around a weighted optimum. The reference point is the nadir of the
+    first update, moved back by 10 % of its range, and stays fixed.
+    With tol set, a generation stalls when the hypervolume grows by less
+    than tol relative to the best so far; patience stalled generations in
+    a row set stopped.
+    """
+    tol: float = None
+    patience: int = 10
+    reference: np.ndarray = None
+    archive: np.ndarray = None
+    best: float = 0.0
+    stall: int = 0
+    stopped: bool = False
+    
+    def update(self, obj_matrix: np.ndarray) -> float:
+        """Merge one generation (larger-is-better objectives), return the hypervolume"""
+        obj = np.asarray(obj_matrix, dtype=float)
+        if self.reference is None:
+            lo, hi = np.nanmin(obj, axis=0), np.nanmax(obj, axis=0)
+            self.reference = lo - 0.1 * np.where(hi > lo, hi - lo, 1.0)
+        if self.archive is not None:
+            obj = np.vstack([self.archive, obj])
+        self.archive = obj[ParetoAnalyzer.pareto_mask(obj)]
+        hv = ParetoAnalyzer.hypervolume(self.archive, self.reference)
+        if self.tol is not None:
+            improved = hv > self.best * (1 + self.tol) if self.best > 0 else hv > 0
+            self.stall = 0 if improved else self.stall + 1
+            self.stopped = self.stall >= self.patience
+        self.best = max(self.best, hv)
+        return hv
+        
+    def state(self) -> Dict:
+        """JSON-serializable state (stored in optimizer checkpoints)"""
+        arrays = {k: None if v is None else v.tolist()
+                  for k, v in (('reference', self.reference), ('archive', self.archive))}
+        return {**arrays, 'best': self.best, 'stall': self.stall, 'stopped': self.stopped}
+        
+    def restore(self, state: Dict) -> None:
+        for k in ('reference', 'archive'):
+            setattr(self, k, None if state[k] is None else np.asarray(state[k], dtype=float))
+        self.best, self.stall, self.stopped = state['best'], state['stall'], state['stopped']
+
+class GenerationMonitor:
+    """
+    differential_evolution callback emitting one telemetry 'generation'
+    event per generation (best weighted score, evaluations so far and,
+    when objectives is given, the hypervolume of the designs found so far)
+    
+    The hypervolume is fed with the objectives the fitness recorded while
+    scoring the generation (see WeightedFitness.record_objectives), so it
+    costs no simulations. Parallel workers score copies of the fitness
+    that record nothing here; the population is then simulated through
+    objectives and counted in 'evaluations'.
+    
+    Returns True, which stops differential_evolution, once the tracker
+    reports a stall (see HypervolumeTracker).
+    """
+    
+    def __init__(self, telemetry: RunTelemetry, fitness: WeightedFitness,
+                 stage: str = 'optimize', generation: int = 0,
+                 objectives=None, tracker: HypervolumeTracker = None):
+        """
+        Args:
+            telemetry: Receives the events
+            fitness: The run's WeightedFitness (evaluation count)
+            stage: Stage name of the events
+            generation: Generations already run (resumed runs)
+            objectives: Callable mapping a (n, 4) population to its
+                        larger-is-better objective matrix, used when the
+                        fitness recorded nothing; None skips the hypervolume
+            tracker: Hypervolume state and early-stopping settings
+        """
+        self.telemetry = telemetry
+        self.fitness = fitness
+        self.stage = stage
+        self.generation = generation
+        self.objectives = objectives
+        self.tracker = tracker if tracker is not None else HypervolumeTracker()
+        self.extra_evaluations = 0  # simulations made only for the hypervolume
+        self.history = []
+        
+    def __call__(self, intermediate_result: OptimizeResult) -> bool:
+        self.generation += 1
+        hypervolume = None
+        if self.objectives is not None:
+            found = self.fitness.take_found()
+            if found is None:
+                found = self.objectives(intermediate_result.population)
+                self.extra_evaluations += len(found)
+            hypervolume = self.tracker.update(found)
+        record = {
+            'best_score': -float(intermediate_result.fun),
+            'convergence': float(intermediate_result.convergence),
+            # Parallel workers score copies of the fitness: fall back to nfev
+            'evaluations': ((self.fitness.evaluations or int(intermediate_result.nfev))
+                            + self.extra_evaluations),
+        }
+        if hypervolume is not None:
+            record['hypervolume'] = hypervolume
+        self.history.append({'generation': self.generation, **record})
+        self.telemetry.generation(self.stage, self.generation, **record)
+        return self.tracker.stopped
+        
+    def state(self) -> Dict:
+        return {'generation': self.generation, 'tracker': self.tracker.state()}
+        
+    def restore(self, state: Dict) -> None:
+        self.generation = state['generation']
+        self.tracker.restore(state['tracker'])
+
 class MultiObjectiveOptimizer:
     """Genetic Algorithm for PA design optimization"""
     
-    def __init__(self, simulator: PASimulator, specs: PASpecs):
+    # Design variables and their bounds (names match SWEEP_AXES)
+    DESIGN_VARIABLES = ('width_um', 'iq_ma', 'zl_ohm', 'zi_ohm')
+    BOUNDS = [
+        (50, 500),    # transistor_width_um
+        (10, 100),    # bias_iq_ma
+        (20, 100),    # load_z_real_ohm
+        (-20, 20),    # load_z_imag_ohm
+    ]
+    
+    # Objectives of the per-generation hypervolume in optimize (3 = exact)
+    HYPERVOLUME_OBJECTIVES = ('pae_percent', 'im3_dbc', 'pout_dbm')
+    HYPERVOLUME_MAXIMIZE = (True, False, True)
+    
+    def __init__(self, simulator: SimulatorBackend, specs: PASpecs,
+                 telemetry: RunTelemetry = None):
         self.sim = simulator
         self.specs = specs
+        self.telemetry = telemetry if telemetry is not None else RunTelemetry()
         
     def optimize(self, 
                  weights: Dict[str, float],
                  generations: int = 100,
                  population: int = 50,
-                 verbose: bool = True) -> Tuple[PADesign, PAPerformance]:
+                 verbose: bool = True,
+                 vectorized: bool = True,
+                 workers=1,
+                 seed: int = 42,
+                 initial_designs=None,
+                 checkpoint_path: str = None,
+                 checkpoint_every: int = 10,
+                 resume: bool = True,
+                 track_hypervolume: bool = None,
+                 early_stop_tol: float = None,
+                 early_stop_patience: int = 10) -> Tuple[PADesign, PAPerformance]:
         """
         Multi-objective optimization using Differential Evolution
         
@@ -349,12 +1644,49 @@ class MultiObjectiveOptimizer:
                      e.g., {'pae': 0.3, 'im3': 0.5, 'pout': 0.2}
             generations: Number of generations
             population: Population size
-            verbose: Print progress
+            verbose: Print progress (unless the telemetry is quiet)
+            vectorized: Score each whole population with one simulate_batch
+                        call (best for fast analytic models)
+            workers: Process count (or map-like callable) used to score
+                     candidates in parallel, for slow simulator backends;
+                     takes precedence over `vectorized` when != 1
+            seed: Random seed
+            initial_designs: Earlier results to warm-start from (see
+                             warm_start_population)
+            checkpoint_path: Save population, RNG state and best-so-far to
+                             this .npz file every checkpoint_every generations
+            checkpoint_every: Generations between checkpoints
+            resume: Continue from checkpoint_path if it exists
+            track_hypervolume: Record, every generation, the hypervolume over
+                               HYPERVOLUME_OBJECTIVES of all designs found
+                               so far (see HypervolumeTracker). Free when
+                               workers == 1; with workers it simulates each
+                               population once more in this process. None:
+                               only when free
+            early_stop_tol: Stop once the hypervolume has grown by less than
+                            this fraction for early_stop_patience
+                            generations in a row (None: run all generations)
+            early_stop_patience: Stalled generations before stopping
             
         Returns:
             optimal_design, optimal_performance
+            
+        Vectorized and parallel runs both use deferred population updates,
+        so for a fixed seed they return the same design whatever the number
+        of workers. The serial mode (vectorized=False, workers=1) keeps the
+        original immediate-update behaviour.
+        
+        Checkpointed runs evolve in segments of checkpoint_every generations
+        and polish once at the end, so an interrupted and resumed run gives
+        the same result as an uninterrupted one with the same settings.
+        
+        Per-generation best scores and hypervolumes and the run's
+        'optimize' stage event go to self.telemetry; self.convergence holds
+        the same curve as a DataFrame. Early stopping ends the evolution,
+        the result is still polished.
         """
         
+        verbose = verbose and not self.telemetry.quiet
         if verbose:
             print("\n" + "=" * 60)
             print("MULTI-OBJECTIVE GENETIC ALGORITHM")
@@ -365,59 +1697,66 @@ class MultiObjectiveOptimizer:
             print("=" * 60 + "\n")
         
         # Define bounds for design variables
-        bounds = [
-            (50, 500),    # transistor_width_um
-            (10, 100),    # bias_iq_ma
-            (20, 100),    # load_z_real_ohm
-            (-20, 20),    # load_z_imag_ohm
-        ]
-        
-        def objective_function(x):
-            """Fitness function to minimize (negative of weighted score)"""
-            design = PADesign(
-                transistor_width_um=x[0],
-                bias_iq_ma=x[1],
-                load_z_real_ohm=x[2],
-                load_z_imag_ohm=x[3],
-                harmonic_tuning=False,
-                input_match_optimize=True
-            )
-            
-            perf = self.sim.simulate_performance(design)
-            
-            # Calculate penalties for not meeting specs
-            penalty = 0.0
-            
-            if perf.im3_dbc > self.specs.im3_max_dbc:
-                penalty += 1000 * (perf.im3_dbc - self.specs.im3_max_dbc)
-            
-            if perf.pout_dbm < self.specs.pout_dbm:
-                penalty += 1000 * (self.specs.pout_dbm - perf.pout_dbm)
-            
-            if perf.pae_percent < self.specs.pae_min_percent:
-                penalty += 500 * (self.specs.pae_min_percent - perf.pae_percent)
+        bounds = list(self.BOUNDS)
+        
+        # Fitness function to minimize (negative of weighted score)
+        objective_function = WeightedFitness(self.sim, self.specs, weights)
             
-            # Weighted multi-objective score (to maximize)
-            score = (
-                weights.get('pae', 0.3) * perf.pae_percent / 70.0 +  # Normalized to max PAE
-                weights.get('im3', 0.4) * (-perf.im3_dbc) / 60.0 +  # Normalized to best IM3
-                weights.get('pout', 0.2) * (perf.pout_dbm - 30) / 20.0 +  # Normalized range
-                weights.get('cost', 0.1) * (1 - perf.cost_usd / 20.0)  # Normalized cost
+        parallel = workers != 1
+        batched = vectorized and not parallel
+        
+        if track_hypervolume is None:
+            track_hypervolume = not parallel
+        track = track_hypervolume or early_stop_tol is not None
+        monitor = GenerationMonitor(
+            self.telemetry, objective_function,
+            objectives=self.population_objectives if track else None,
+            tracker=HypervolumeTracker(tol=early_stop_tol, patience=early_stop_patience))
+        with self.telemetry.stage('optimize', cache=getattr(self.sim, 'cache', None),
+                                  generations=generations, population=population) as stage:
+            if initial_designs is None:
+                init = 'latinhypercube'
+            else:
+                init = self.warm_start_population(initial_designs, objective_function,
+                                                  population, seed)
+            if track:
+                objective_function.record_objectives(self.HYPERVOLUME_OBJECTIVES,
+                                                     self.HYPERVOLUME_MAXIMIZE)
+            de_options = dict(
+                disp=verbose,
+                vectorized=batched,
+                workers=workers,
+                updating='deferred' if (batched or parallel) else 'immediate',
+                callback=monitor
             )
             
-            # Return negative score (since we minimize)
-            return -(score - penalty)
-        
-        # Run differential evolution
-        result = differential_evolution(
-            objective_function,
-            bounds,
-            maxiter=generations,
-            popsize=population,
-            seed=42,
-            disp=verbose,
-            polish=True
-        )
+            if checkpoint_path is not None:
+                result = self._optimize_checkpointed(
+                    objective_function, weights, generations, population, seed,
+                    init, checkpoint_path, checkpoint_every, resume, de_options, verbose,
+                    monitor)
+            else:
+                # Run differential evolution
+                result = differential_evolution(
+                    objective_function,
+                    bounds,
+                    maxiter=generations,
+                    popsize=population,
+                    seed=seed,
+                    polish=True,
+                    init=init,
+                    **de_options
+                )
+                
+            stage['evaluations'] = ((objective_function.evaluations or int(result.get('nfev', 0)))
+                                    + monitor.extra_evaluations)
+            stage['generations_run'] = int(result.nit)
+            stage['best_score'] = -float(result.fun)
+            if track:
+                stage['hypervolume'] = monitor.tracker.best
+                stage['stopped_early'] = monitor.tracker.stopped
+                
+        self.convergence = pd.DataFrame(monitor.history)
         
         # Extract optimal design
         optimal_design = PADesign(
@@ -429,7 +1768,8 @@ class MultiObjectiveOptimizer:
             input_match_optimize=True
         )
         
-        optimal_perf = self.sim.simulate_performance(optimal_design)
+        # Through simulate_batch: the only evaluation call SimulatorBackend requires
+        optimal_perf = self.evaluate_population(result.x[None])[0]
         
         if verbose:
             print("\n" + "=" * 60)
@@ -438,7 +1778,7 @@ class MultiObjectiveOptimizer:
             print(f"  Transistor Width:  {optimal_design.transistor_width_um:.1f} μm")
             print(f"  Bias Current:      {optimal_design.bias_iq_ma:.1f} mA")
             print(f"  Load Impedance:    {optimal_design.load_z_real_ohm:.1f} + j{optimal_design.load_z_imag_ohm:.1f} Ω")
-            print(f"\n  Performance:")
+            print("\n  Performance:")
             print(f"    Pout:  {optimal_perf.pout_dbm:.2f} dBm")
             print(f"    PAE:   {optimal_perf.pae_percent:.1f} %")
             print(f"    IM3:   {optimal_perf.im3_dbc:.1f} dBc")
@@ -447,6 +1787,367 @@ class MultiObjectiveOptimizer:
             print("=" * 60 + "\n")
         
         return optimal_design, optimal_perf
+        
+    def warm_start_population(self,
+                              designs,
+                              objective_function,
+                              population: int,
+                              seed: int = 42) -> np.ndarray:
+        """
+        Initial DE population seeded from earlier sweep or optimizer results
+        
+        The best earlier designs under this run's fitness fill up to half of
+        the population; Latin hypercube samples keep the rest diverse.
+        
+        Args:
+            designs: DataFrame with DESIGN_VARIABLES columns (missing ones
+                     take SWEEP_DEFAULTS), e.g. from find_sweet_spot or
+                     optimize_pareto, or an (n, 4) array such as a
+                     checkpoint population
+            objective_function: Fitness used to rank the earlier designs
+            population: DE popsize (population = popsize * 4 members)
+            seed: Seed for the Latin hypercube fill
+            
+        Returns:
+            (population * 4, 4) initial population within BOUNDS
+        """
+        if isinstance(designs, pd.DataFrame):
+            x = np.column_stack([
+                designs[name].to_numpy(dtype=float) if name in designs
+                else np.full(len(designs), SWEEP_DEFAULTS[name])
+                for name in self.DESIGN_VARIABLES
+            ])
+        else:
+            x = np.atleast_2d(np.asarray(designs, dtype=float))
+            
+        lo, hi = np.array(self.BOUNDS, dtype=float).T
+        x = np.unique(np.clip(x, lo, hi), axis=0)
+        
+        n_members = population * len(self.BOUNDS)
+        fitness = np.atleast_1d(objective_function(x.T))
+        seeded = x[np.argsort(fitness)[:n_members // 2]]
+        
+        fill = qmc.LatinHypercube(len(self.BOUNDS), seed=seed).random(n_members - len(seeded))
+        return np.vstack([seeded, qmc.scale(fill, lo, hi)])
+        
+    @staticmethod
+    def save_checkpoint(path: str, state: Dict) -> None:
+        """Atomically write an optimizer checkpoint (.npz)"""
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as fh:
+            np.savez(fh, **state)
+        os.replace(tmp, path)
+        
+    @staticmethod
+    def load_checkpoint(path: str) -> Dict:
+        """Read a checkpoint written by save_checkpoint"""
+        with np.load(path) as data:
+            return {k: data[k] for k in data.files}
+            
+    def _optimize_checkpointed(self, objective_function, weights, generations,
+                               population, seed, init, checkpoint_path,
+                               checkpoint_every, resume, de_options, verbose,
+                               monitor=None):
+        """Differential evolution in segments with a checkpoint after each"""
+        bounds = list(self.BOUNDS)
+        # Everything that changes the evolved population. vectorized and
+        # workers only matter through the update mode: deferred runs agree
+        # whatever the worker count, so a resume may change it.
+        tracker = monitor.tracker if monitor is not None else None
+        settings = json.dumps({'weights': weights, 'bounds': bounds,
+                               'population': population, 'seed': seed,
+                               'updating': de_options.get('updating'),
+                               'checkpoint_every': checkpoint_every,
+                               'early_stop': None if tracker is None or tracker.tol is None
+                                             else [tracker.tol, tracker.patience]},
+                              sort_keys=True)
+        rng = np.random.default_rng(seed)
+        
+        if resume and os.path.exists(checkpoint_path):
+            state = self.load_checkpoint(checkpoint_path)
+            if str(state['settings']) != settings:
+                raise ValueError(f"Checkpoint {checkpoint_path} was written with "
+                                 f"different settings: {state['settings']}")
+            pop = state['population']
+            energies = state.get('population_energies')
+            generation = int(state['generation'])
+            converged = bool(state['converged'])
+            best_x, best_fun = state['best_x'], float(state['best_fun'])
+            rng.bit_generator.state = json.loads(str(state['rng_state']))
+            saved = json.loads(str(state['monitor'])) if 'monitor' in state else None
+            if monitor is not None and saved is not None:
+                monitor.restore(saved)
+            if verbose:
+                print(f"  Resuming from {checkpoint_path} at generation {generation}")
+        else:
+            pop = init
+            energies = None
+            generation = 0
+            converged = False
+            best_x, best_fun = None, np.inf
+            
+        while (generation < generations and not converged
+               and not (monitor is not None and monitor.tracker.stopped)):
+            n = min(checkpoint_every, generations - generation)
+            # The population carried over was scored by the previous segment
+            objective_function.preload(*((pop, energies) if energies is not None else ()))
+            result = differential_evolution(
+                objective_function,
+                bounds,
+                maxiter=n,
+                popsize=population,
+                seed=int(rng.integers(2**32)),
+                polish=False,
+                init=pop,
+                **de_options
+            )
+            generation += result.nit
+            converged = result.success
+            pop, energies = result.population, result.population_energies
+            best_x, best_fun = result.x, float(result.fun)
+            
+            self.save_checkpoint(checkpoint_path, {
+                'settings': np.array(settings),
+                'generation': np.array(generation),
+                'converged': np.array(converged),
+                'population': pop,
+                'population_energies': energies,
+                'best_x': best_x,
+                'best_fun': np.array(best_fun),
+                'rng_state': np.array(json.dumps(rng.bit_generator.state)),
+                'monitor': np.array(json.dumps(monitor.state() if monitor else None)),
+            })
+            if verbose:
+                print(f"  Checkpoint: generation {generation}, "
+                      f"best fitness {best_fun:.4f} -> {checkpoint_path}")
+                      
+        if best_x is None:
+            raise ValueError("generations must be at least 1")
+            
+        # Final local polish, as differential_evolution(polish=True) does
+        objective_function.preload()
+        polished = minimize(lambda v: float(objective_function(v)), best_x,
+                            method='L-BFGS-B', bounds=bounds)
+        if polished.fun < best_fun:
+            best_x, best_fun = polished.x, float(polished.fun)
+        return OptimizeResult(x=best_x, fun=best_fun, nit=generation, success=converged)
+        
+    def evaluate_population(self, x: np.ndarray) -> PAPerformanceBatch:
+        """Simulate a (n, 4) population matrix of design variables in one batch"""
+        x = np.atleast_2d(x)
+        return self.sim.simulate_batch(x[:, 0], x[:, 1], x[:, 2], x[:, 3], False)
+        
+    def population_objectives(self, x: np.ndarray, objectives: List[str] = None,
+                              maximize: List[bool] = None) -> np.ndarray:
+        """
+        Larger-is-better objective matrix of a (n, 4) population
+        
+        Defaults to HYPERVOLUME_OBJECTIVES / HYPERVOLUME_MAXIMIZE.
+        """
+        if objectives is None:
+            objectives, maximize = self.HYPERVOLUME_OBJECTIVES, self.HYPERVOLUME_MAXIMIZE
+        perf = self.evaluate_population(x)
+        sign = np.where(maximize, 1.0, -1.0)
+        return np.column_stack([getattr(perf, m) for m in objectives]) * sign
+        
+    def constraint_violation(self, perf: PAPerformanceBatch) -> np.ndarray:
+        """Total spec violation per design (0 = all specs met)"""
+        violation = np.maximum(perf.im3_dbc - self.specs.im3_max_dbc, 0.0)
+        violation = violation + np.maximum(self.specs.pout_dbm - perf.pout_dbm, 0.0)
+        violation = violation + 0.5 * np.maximum(self.specs.pae_min_percent - perf.pae_percent, 0.0)
+        return violation
+        
+    @staticmethod
+    def non_dominated_sort(F: np.ndarray, violation: np.ndarray = None) -> np.ndarray:
+        """
+        Fast non-dominated sorting (all objectives minimized)
+        
+        With `violation` given, Deb's constrained domination is used:
+        feasible designs dominate infeasible ones, and infeasible designs
+        are ranked by their total violation.
+        
+        Returns:
+            Front rank per row (0 = first front)
+        """
+        dom = ParetoAnalyzer.dominates(-F, -F)
+        if violation is not None:
+            feasible = violation <= 0
+            both_feasible = feasible[:, None] & feasible[None, :]
+            dom = np.where(both_feasible, dom,
+                           feasible[:, None] & ~feasible[None, :] |
+                           (~feasible[:, None] & ~feasible[None, :] &
+                            (violation[:, None] < violation[None, :])))
+                            
+        n_dominators = dom.sum(axis=0)
+        rank = np.full(len(F), -1, dtype=int)
+        current = np.flatnonzero(n_dominators == 0)
+        level = 0
+        while current.size:
+            rank[current] = level
+            n_dominators = n_dominators - dom[current].sum(axis=0)
+            n_dominators[rank >= 0] = -1
+            current = np.flatnonzero(n_dominators == 0)
+            level += 1
+        return rank
+        
+    @staticmethod
+    def crowding_distance(F: np.ndarray, rank: np.ndarray) -> np.ndarray:
+        """Crowding distance of each row within its own front"""
+        distance = np.zeros(len(F))
+        for level in np.unique(rank):
+            members = np.flatnonzero(rank == level)
+            if len(members) <= 2:
+                distance[members] = np.inf
+                continue
+            front = F[members]
+            order = np.argsort(front, axis=0)
+            sorted_f = np.take_along_axis(front, order, axis=0)
+            span = sorted_f[-1] - sorted_f[0]
+            span[span == 0] = 1.0
+            gaps = np.zeros_like(front)
+            gaps[1:-1] = (sorted_f[2:] - sorted_f[:-2]) / span
+            gaps[0] = gaps[-1] = np.inf
+            contrib = np.zeros_like(front)
+            np.put_along_axis(contrib, order, gaps, axis=0)
+            distance[members] = contrib.sum(axis=1)
+        return distance
+        
+    def optimize_pareto(self,
+                        objectives: List[str] = None,
+                        maximize: List[bool] = None,
+                        generations: int = 100,
+                        population: int = 100,
+                        crossover_eta: float = 15.0,
+                        mutation_eta: float = 20.0,
+                        seed: int = 42,
+                        verbose: bool = True) -> pd.DataFrame:
+        """
+        Multi-objective optimization using NSGA-II
+        
+        Returns the whole Pareto set from one run instead of a single
+        weighted optimum. Each generation is evaluated with one
+        simulate_batch call.
+        
+        Args:
+            objectives: Metric names (default PAE, IM3, Pout, cost)
+            maximize: List of bool (True=maximize, False=minimize) for each objective
+            generations: Number of generations
+            population: Population size
+            crossover_eta: SBX crossover distribution index
+            mutation_eta: Polynomial mutation distribution index
+            seed: Random seed
+            verbose: Print progress (unless the telemetry is quiet)
+            
+        Returns:
+            DataFrame of Pareto-optimal designs (design variables and metrics)
+        """
+        
+        if objectives is None:
+            objectives = ['pae_percent', 'im3_dbc', 'pout_dbm', 'cost_usd']
+            maximize = [True, False, True, False]
+        if maximize is None or len(maximize) != len(objectives):
+            raise ValueError("maximize must give one flag per objective")
+            
+        verbose = verbose and not self.telemetry.quiet
+        if verbose:
+            print("\n" + "=" * 60)
+            print("MULTI-OBJECTIVE GENETIC ALGORITHM (NSGA-II)")
+            print("=" * 60)
+            print(f"  Generations: {generations}")
+            print(f"  Population:  {population}")
+            print(f"  Objectives:  {objectives}")
+            print("=" * 60 + "\n")
+            
+        rng = np.random.default_rng(seed)
+        lower, upper = np.array(self.BOUNDS, dtype=float).T
+        n_var = len(lower)
+        sign = np.where(maximize, -1.0, 1.0)
+        
+        def evaluate(x):
+            perf = self.evaluate_population(x)
+            F = np.column_stack([getattr(perf, m) for m in objectives]) * sign
+            return perf, F, self.constraint_violation(perf)
+            
+        def variation(parents):
+            # Simulated binary crossover (SBX) on consecutive parent pairs
+            p1, p2 = parents[0::2], parents[1::2]
+            u = rng.random(p1.shape)
+            beta = np.where(u <= 0.5,
+                            (2 * u) ** (1 / (crossover_eta + 1)),
+                            (1 / (2 * (1 - u))) ** (1 / (crossover_eta + 1)))
+            beta[rng.random(len(p1)) > 0.9] = 1.0  # pairs left uncrossed
+            c1 = 0.5 * ((1 + beta) * p1 + (1 - beta) * p2)
+            c2 = 0.5 * ((1 - beta) * p1 + (1 + beta) * p2)
+            children = np.vstack([c1, c2])
+            
+            # Polynomial mutation
+            mutate = rng.random(children.shape) < 1.0 / n_var
+            u = rng.random(children.shape)
+            delta = np.where(u < 0.5,
+                             (2 * u) ** (1 / (mutation_eta + 1)) - 1,
+                             1 - (2 * (1 - u)) ** (1 / (mutation_eta + 1)))
+            children = children + mutate * delta * (upper - lower)
+            return np.clip(children, lower, upper)
+            
+        def tournament(rank, crowding, n):
+            a, b = rng.integers(0, len(rank), (2, n))
+            a_wins = (rank[a] < rank[b]) | ((rank[a] == rank[b]) & (crowding[a] >= crowding[b]))
+            return np.where(a_wins, a, b)
+            
+        with self.telemetry.stage('optimize_pareto', cache=getattr(self.sim, 'cache', None),
+                                  generations=generations, population=population,
+                                  objectives=len(objectives)) as stage:
+            n_pop = population + population % 2
+            x = lower + rng.random((n_pop, n_var)) * (upper - lower)
+            perf, F, violation = evaluate(x)
+            rank = self.non_dominated_sort(F, violation)
+            crowding = self.crowding_distance(F, rank)
+            
+            for gen in range(generations):
+                offspring = variation(x[tournament(rank, crowding, n_pop)])
+                _, F_off, v_off = evaluate(offspring)
+                
+                # Elitist (mu + lambda) survival by rank, then crowding distance
+                x_all = np.vstack([x, offspring])
+                F_all = np.vstack([F, F_off])
+                v_all = np.concatenate([violation, v_off])
+                rank_all = self.non_dominated_sort(F_all, v_all)
+                crowd_all = self.crowding_distance(F_all, rank_all)
+                survivors = np.lexsort((-crowd_all, rank_all))[:n_pop]
+                
+                x, F, violation = x_all[survivors], F_all[survivors], v_all[survivors]
+                rank, crowding = rank_all[survivors], crowd_all[survivors]
+                self.telemetry.generation('optimize_pareto', gen + 1,
+                                          first_front=int(np.sum(rank == 0)),
+                                          feasible=int(np.sum(violation <= 0)),
+                                          evaluations=n_pop * (gen + 2))
+                                          
+                if verbose and (gen + 1) % 10 == 0:
+                    print(f"  Generation {gen+1}: {np.sum(rank == 0)} designs on first front, "
+                          f"{np.sum(violation <= 0)} feasible")
+                          
+            stage['evaluations'] = n_pop * (generations + 1)
+                      
+        # Report the first front of the final population
+        front = rank == 0
+        perf = self.evaluate_population(x[front])
+        pareto_df = pd.DataFrame(x[front], columns=self.DESIGN_VARIABLES)
+        pareto_df = pd.concat([pareto_df, perf.to_frame()], axis=1)
+        pareto_df['constraint_violation'] = violation[front]
+        pareto_df['crowding_distance'] = crowding[front]
+        pareto_df['pareto_optimal'] = True
+        
+        if verbose:
+            print("\n" + "=" * 60)
+            print("OPTIMIZATION COMPLETE")
+            print("=" * 60)
+            print(f"  Pareto-optimal designs: {len(pareto_df)}")
+            print(f"  Feasible:               {np.sum(violation[front] <= 0)}")
+            for m in objectives:
+                print(f"  {m:<22}[{pareto_df[m].min():.2f}, {pareto_df[m].max():.2f}]")
+            print("=" * 60 + "\n")
+            
+        return pareto_df
 
 # ============================================================================
 # VISUALIZATION TOOLS
@@ -455,24 +2156,224 @@ class MultiObjectiveOptimizer:
 class PAVisualizer:
     """Generate trade-off plots and visualizations"""
     
+    # Scatter layers with more points than this are pre-rasterized to an image
+    RASTERIZE_THRESHOLD = 50_000
+    RASTER_RESOLUTION = 400  # pixels per axis of a pre-rasterized layer
+    
+    # Density aggregation (aggregate=...): per-bin reduction of a scatter layer
+    AGGREGATES = ('count', 'mean', 'max')
+    CONTOUR_RESOLUTION = 200  # bins per axis when scattered points feed a contour
+    
+    # Trade-off panel name -> drawing method (2x3 layout order)
+    TRADEOFF_PANELS = ('linearity_efficiency', 'power_linearity', 'performance_triangle',
+                       'im3_design_space', 'pae_design_space', 'yield_margin')
+                       
     @staticmethod
-    def plot_tradeoffs(df: pd.DataFrame, specs: PASpecs, save_path: str = None):
+    def _new_figure(figsize, headless: bool):
+        """pyplot figure, or a bare Agg figure that never touches the GUI backend"""
+        if not headless:
+            return plt.figure(figsize=figsize)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig
+        
+    @classmethod
+    def _rasterize(cls, df: pd.DataFrame) -> bool:
+        return len(df) > cls.RASTERIZE_THRESHOLD
+        
+    @staticmethod
+    def bin_points(x, y, values=None, bins: int = 400,
+                   extent: Tuple[float, float, float, float] = None) -> Dict:
         """
-        Generate comprehensive trade-off analysis plots
+        Aggregate scattered points onto a fixed bins x bins grid
         
         Args:
-            df: DataFrame with design sweep results
-            specs: PA specifications
-            save_path: Optional path to save figure
+            x, y: Point coordinates
+            values: Optional metric reduced per bin (mean and max)
+            bins: Grid resolution per axis
+            extent: (x0, x1, y0, y1); default is the range of the finite
+                    points, points outside a given extent are dropped
+                    
+        Returns:
+            {'count': (bins, bins) int array, 'mean'/'max': (bins, bins)
+            float arrays, NaN in empty bins (only with values),
+            'extent': (x0, x1, y0, y1)}; rows follow y, columns follow x
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        ok = np.isfinite(x) & np.isfinite(y)
+        if values is not None:
+            values = np.asarray(values, dtype=float)
+            ok &= np.isfinite(values)
+        if not ok.any():
+            raise ValueError("No finite points to bin")
+            
+        if extent is None:
+            extent = (x[ok].min(), x[ok].max(), y[ok].min(), y[ok].max())
+        x0, x1, y0, y1 = extent
+        ok &= (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
+        ix = np.minimum(((x[ok] - x0) / ((x1 - x0) or 1) * bins).astype(int), bins - 1)
+        iy = np.minimum(((y[ok] - y0) / ((y1 - y0) or 1) * bins).astype(int), bins - 1)
+        flat = iy * bins + ix
+        
+        count = np.bincount(flat, minlength=bins * bins)
+        grids = {'count': count.reshape(bins, bins), 'extent': (x0, x1, y0, y1)}
+        if values is not None:
+            v = values[ok]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = np.bincount(flat, weights=v, minlength=bins * bins) / count
+            vmax = np.full(bins * bins, -np.inf)
+            np.maximum.at(vmax, flat, v)
+            vmax[count == 0] = np.nan
+            grids['mean'] = mean.reshape(bins, bins)
+            grids['max'] = vmax.reshape(bins, bins)
+        return grids
+        
+    @staticmethod
+    def design_space_grids(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        IM3 and PAE gridded over (Iq, ZL) for the design-space contour panels
+        
+        Computed once per figure (or once per batch, see render_panels) and
+        passed to the panels as grids=...; grids['im3_dbc'] is the table
+        indexed by zl_ohm with iq_ma columns.
+        """
+        return df.pivot_table(values=['im3_dbc', 'pae_percent'],
+                              index='zl_ohm',
+                              columns='iq_ma')
+                              
+    @classmethod
+    def _scatter(cls, ax, x, y, c=None, cmap=None, alpha=1.0, rasterized=False,
+                 label=None, aggregate=None, **kwargs):
+        """
+        ax.scatter, or for dense layers an image of the points
+        
+        Dense layers are binned to RASTER_RESOLUTION pixels, the last point in
+        each pixel wins (as in overplotting), and the result is drawn with
+        imshow, which costs the same for 10^3 or 10^7 points. With aggregate
+        set the layer is drawn from bin_points instead (see _aggregate).
+        
+        Returns:
+            Mappable for colorbars
+        """
+        if aggregate is not None:
+            return cls._aggregate(ax, x, y, c, cmap, aggregate, alpha, label,
+                                  kwargs.get('s'))
+        if not rasterized:
+            return ax.scatter(x, y, c=c, cmap=cmap, alpha=alpha, label=label, **kwargs)
+        
+        from matplotlib import cm, colors
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        colored = c is not None and not isinstance(c, str)
+        values = np.asarray(c, dtype=float) if colored else None
+        ok = np.isfinite(x) & np.isfinite(y)
+        if colored:
+            ok &= np.isfinite(values)
+        
+        res = cls.RASTER_RESOLUTION
+        x0, x1 = x[ok].min(), x[ok].max()
+        y0, y1 = y[ok].min(), y[ok].max()
+        ix = np.minimum(((x[ok] - x0) / ((x1 - x0) or 1) * res).astype(int), res - 1)
+        iy = np.minimum(((y[ok] - y0) / ((y1 - y0) or 1) * res).astype(int), res - 1)
+        
+        color_norm = None
+        if colored:
+            color_norm = colors.Normalize(values[ok].min(), values[ok].max())
+            rgba = plt.get_cmap(cmap)(color_norm(values[ok]))
+        else:
+            rgba = np.tile(colors.to_rgba(c or 'C0'), (ok.sum(), 1))
+        rgba[:, 3] = alpha
+        
+        image = np.zeros((res, res, 4))
+        image[iy, ix] = rgba
+        ax.imshow(image, origin='lower', extent=(x0, x1, y0, y1), aspect='auto',
+                  interpolation='nearest')
+        ax.margins(0.05)
+        if label is not None:
+            # Empty proxy so the layer still appears in the legend
+            ax.scatter([], [], c=None if colored else c, alpha=alpha, label=label,
+                       s=kwargs.get('s'))
+        return cm.ScalarMappable(norm=color_norm, cmap=cmap)
+        
+    @classmethod
+    def _aggregate(cls, ax, x, y, c, cmap, how: str, alpha=1.0, label=None, s=None):
         """
+        Draw a scatter layer as a density image (datashader-style)
         
-        fig = plt.figure(figsize=(16, 12))
+        how='count' shows designs per bin on a log scale; 'mean' and 'max'
+        reduce the colour metric c per bin. Layers with a fixed colour
+        (c a string) always show counts, in greys. Empty bins stay
+        transparent.
         
+        Returns:
+            The AxesImage (mappable for colorbars)
+        """
+        from matplotlib import colors
+        if how not in cls.AGGREGATES:
+            raise ValueError(f"aggregate must be one of {cls.AGGREGATES}, got '{how}'")
+        colored = c is not None and not isinstance(c, str)
+        grid = cls.bin_points(x, y, c if colored else None, bins=cls.RASTER_RESOLUTION)
+        
+        if how == 'count' or not colored:
+            image = np.ma.masked_equal(grid['count'], 0)
+            color_norm = colors.LogNorm(1, max(image.max(), 2))
+            cmap = cmap if colored else 'Greys'
+        else:
+            image = np.ma.masked_invalid(grid[how])
+            color_norm = colors.Normalize(image.min(), image.max())
+        mappable = ax.imshow(image, origin='lower', extent=grid['extent'], aspect='auto',
+                             interpolation='nearest', cmap=cmap, norm=color_norm,
+                             alpha=None if colored else alpha)
+        ax.margins(0.05)
+        if label is not None:
+            ax.scatter([], [], c='gray', alpha=alpha, label=label, s=s)
+        return mappable
+        
+    @staticmethod
+    def _colorbar(fig, mappable, ax, label: str, aggregate: str = None):
+        """Colorbar whose label names the per-bin reduction, if any"""
+        if aggregate == 'count':
+            label = 'Designs per bin'
+        elif aggregate is not None:
+            label = f"{aggregate.capitalize()} {label}"
+        return fig.colorbar(mappable, ax=ax, label=label)
+        
+    @staticmethod
+    def _design_space_contour(ax, df, value, grids, aggregate, cmap):
+        """contourf of one metric over (Iq, ZL), reusing grids when given"""
+        pivot = (grids[value] if grids is not None else
+                 df.pivot_table(values=value, index='zl_ohm', columns='iq_ma'))
+        if not pivot.isna().values.any():
+            if aggregate is not None:
+                # Fine sweeps: contour every n-th grid line, bounded cost
+                step = -(-max(pivot.shape) // PAVisualizer.CONTOUR_RESOLUTION)
+                pivot = pivot.iloc[::step, ::step]
+            return ax.contourf(pivot.columns, pivot.index, pivot.values, 
+                               levels=20, cmap=cmap)
+        # Scattered (adaptive) points: triangulate instead of gridding
+        if aggregate is None:
+            return ax.tricontourf(df['iq_ma'], df['zl_ohm'], df[value],
+                                  levels=20, cmap=cmap)
+        # ... the per-bin means, so the triangulation size is bounded
+        res = PAVisualizer.CONTOUR_RESOLUTION
+        grid = PAVisualizer.bin_points(df['iq_ma'], df['zl_ohm'], df[value], bins=res)
+        x0, x1, y0, y1 = grid['extent']
+        iy, ix = np.nonzero(grid['count'])
+        return ax.tricontourf(x0 + (ix + 0.5) * (x1 - x0) / res,
+                              y0 + (iy + 0.5) * (y1 - y0) / res,
+                              grid['mean'][iy, ix], levels=20, cmap=cmap)
+                              
+    @staticmethod
+    def _panel_linearity_efficiency(fig, ax1, df, specs, rasterized,
+                                    aggregate=None, grids=None):
         # Plot 1: PAE vs IM3 (Linearity-Efficiency Trade-off)
-        ax1 = plt.subplot(2, 3, 1)
-        scatter1 = ax1.scatter(df['im3_dbc'], df['pae_percent'], 
-                              c=df['pout_dbm'], cmap='viridis', 
-                              alpha=0.6, s=50)
+        scatter1 = PAVisualizer._scatter(ax1, df['im3_dbc'], df['pae_percent'], 
+                                         c=df['pout_dbm'], cmap='viridis', 
+                                         alpha=0.6, s=50, rasterized=rasterized,
+                                         aggregate=aggregate)
         ax1.axvline(specs.im3_max_dbc, color='r', linestyle='--', 
                    linewidth=2, label='IM3 Spec')
         ax1.axhline(specs.pae_min_percent, color='orange', linestyle='--', 
@@ -483,13 +2384,16 @@ class PAVisualizer:
                      fontsize=14, fontweight='bold')
         ax1.grid(True, alpha=0.3)
         ax1.legend()
-        plt.colorbar(scatter1, ax=ax1, label='Pout (dBm)')
+        PAVisualizer._colorbar(fig, scatter1, ax1, 'Pout (dBm)', aggregate)
         
+    @staticmethod
+    def _panel_power_linearity(fig, ax2, df, specs, rasterized,
+                               aggregate=None, grids=None):
         # Plot 2: Pout vs IM3 (Power-Linearity Trade-off)
-        ax2 = plt.subplot(2, 3, 2)
-        scatter2 = ax2.scatter(df['pout_dbm'], df['im3_dbc'], 
-                              c=df['iq_ma'], cmap='plasma', 
-                              alpha=0.6, s=50)
+        scatter2 = PAVisualizer._scatter(ax2, df['pout_dbm'], df['im3_dbc'], 
+                                         c=df['iq_ma'], cmap='plasma', 
+                                         alpha=0.6, s=50, rasterized=rasterized,
+                                         aggregate=aggregate)
         ax2.axvline(specs.pout_dbm, color='r', linestyle='--', 
                    linewidth=2, label='Pout Spec')
         ax2.axhline(specs.im3_max_dbc, color='orange', linestyle='--', 
@@ -500,57 +2404,61 @@ class PAVisualizer:
                      fontsize=14, fontweight='bold')
         ax2.grid(True, alpha=0.3)
         ax2.legend()
-        plt.colorbar(scatter2, ax=ax2, label='Iq (mA)')
+        PAVisualizer._colorbar(fig, scatter2, ax2, 'Iq (mA)', aggregate)
         
+    @staticmethod
+    def _panel_performance_triangle(fig, ax3, df, specs, rasterized,
+                                    aggregate=None, grids=None):
         # Plot 3: 3D Performance Triangle
-        ax3 = plt.subplot(2, 3, 3)
         # Normalize to 0-1 for triangle plot
         pae_norm = df['pae_percent'] / df['pae_percent'].max()
         im3_norm = -df['im3_dbc'] / -df['im3_dbc'].min()
         pout_norm = df['pout_dbm'] / df['pout_dbm'].max()
         
-        scatter3 = ax3.scatter(im3_norm, pae_norm, 
-                              c=pout_norm, cmap='RdYlGn', 
-                              alpha=0.6, s=50)
+        scatter3 = PAVisualizer._scatter(ax3, im3_norm, pae_norm, 
+                                         c=pout_norm, cmap='RdYlGn', 
+                                         alpha=0.6, s=50, rasterized=rasterized,
+                                         aggregate=aggregate)
         ax3.set_xlabel('Linearity (normalized)', fontsize=12, fontweight='bold')
         ax3.set_ylabel('Efficiency (normalized)', fontsize=12, fontweight='bold')
         ax3.set_title('Performance Triangle', 
                      fontsize=14, fontweight='bold')
         ax3.grid(True, alpha=0.3)
-        plt.colorbar(scatter3, ax=ax3, label='Power (norm)')
+        PAVisualizer._colorbar(fig, scatter3, ax3, 'Power (norm)', aggregate)
         
+    @staticmethod
+    def _panel_im3_design_space(fig, ax4, df, specs, rasterized,
+                                aggregate=None, grids=None):
         # Plot 4: IM3 Contour Map (vs Iq and ZL)
-        ax4 = plt.subplot(2, 3, 4)
-        pivot = df.pivot_table(values='im3_dbc', 
-                               index='zl_ohm', 
-                               columns='iq_ma')
-        contour = ax4.contourf(pivot.columns, pivot.index, pivot.values, 
-                               levels=20, cmap='RdYlGn_r')
+        contour = PAVisualizer._design_space_contour(ax4, df, 'im3_dbc', grids,
+                                                     aggregate, 'RdYlGn_r')
         ax4.set_xlabel('Bias Current (mA)', fontsize=12, fontweight='bold')
         ax4.set_ylabel('Load Impedance (Ω)', fontsize=12, fontweight='bold')
         ax4.set_title('IM3 Design Space (dBc)', 
                      fontsize=14, fontweight='bold')
-        plt.colorbar(contour, ax=ax4, label='IM3 (dBc)')
+        fig.colorbar(contour, ax=ax4, label='IM3 (dBc)')
         
+    @staticmethod
+    def _panel_pae_design_space(fig, ax5, df, specs, rasterized,
+                                aggregate=None, grids=None):
         # Plot 5: PAE Contour Map (vs Iq and ZL)
-        ax5 = plt.subplot(2, 3, 5)
-        pivot_pae = df.pivot_table(values='pae_percent', 
-                                    index='zl_ohm', 
-                                    columns='iq_ma')
-        contour2 = ax5.contourf(pivot_pae.columns, pivot_pae.index, pivot_pae.values, 
-                                levels=20, cmap='viridis')
+        contour2 = PAVisualizer._design_space_contour(ax5, df, 'pae_percent', grids,
+                                                      aggregate, 'viridis')
         ax5.set_xlabel('Bias Current (mA)', fontsize=12, fontweight='bold')
         ax5.set_ylabel('Load Impedance (Ω)', fontsize=12, fontweight='bold')
         ax5.set_title('PAE Design Space (%)', 
                      fontsize=14, fontweight='bold')
-        plt.colorbar(contour2, ax=ax5, label='PAE (%)')
+        fig.colorbar(contour2, ax=ax5, label='PAE (%)')
         
+    @staticmethod
+    def _panel_yield_margin(fig, ax6, df, specs, rasterized,
+                            aggregate=None, grids=None):
         # Plot 6: Yield vs Performance Margin
-        ax6 = plt.subplot(2, 3, 6)
         df['im3_margin'] = df['im3_dbc'] - specs.im3_max_dbc
-        scatter6 = ax6.scatter(df['im3_margin'], df['yield_percent'], 
-                              c=df['pae_percent'], cmap='coolwarm', 
-                              alpha=0.6, s=50)
+        scatter6 = PAVisualizer._scatter(ax6, df['im3_margin'], df['yield_percent'], 
+                                         c=df['pae_percent'], cmap='coolwarm', 
+                                         alpha=0.6, s=50, rasterized=rasterized,
+                                         aggregate=aggregate)
         ax6.axvline(0, color='r', linestyle='--', linewidth=2, label='Spec Limit')
         ax6.set_xlabel('IM3 Margin (dB)', fontsize=12, fontweight='bold')
         ax6.set_ylabel('Predicted Yield (%)', fontsize=12, fontweight='bold')
@@ -558,31 +2466,92 @@ class PAVisualizer:
                      fontsize=14, fontweight='bold')
         ax6.grid(True, alpha=0.3)
         ax6.legend()
-        plt.colorbar(scatter6, ax=ax6, label='PAE (%)')
+        PAVisualizer._colorbar(fig, scatter6, ax6, 'PAE (%)', aggregate)
+        
+    @staticmethod
+    def plot_tradeoffs(df: pd.DataFrame, specs: PASpecs, save_path: str = None,
+                       headless: bool = False, dpi: int = 300,
+                       aggregate: str = None, grids: pd.DataFrame = None):
+        """
+        Generate comprehensive trade-off analysis plots
+        
+        Args:
+            df: DataFrame with design sweep results
+            specs: PA specifications
+            save_path: Optional path to save figure
+            headless: Draw on an Agg canvas and skip plt.show() (batch jobs)
+            dpi: Resolution of the saved figure
+            aggregate: None (one marker per design) or 'count', 'mean' or
+                       'max' to draw the scatter panels as binned density
+                       images; render time is then independent of len(df)
+            grids: Output of design_space_grids(df), to reuse across figures
+            
+        Returns:
+            The matplotlib Figure
+        """
         
-        plt.tight_layout()
+        fig = PAVisualizer._new_figure((16, 12), headless)
+        rasterized = PAVisualizer._rasterize(df)
+        if grids is None:
+            grids = PAVisualizer.design_space_grids(df)
+        
+        for i, panel in enumerate(PAVisualizer.TRADEOFF_PANELS):
+            ax = fig.add_subplot(2, 3, i + 1)
+            getattr(PAVisualizer, '_panel_' + panel)(fig, ax, df, specs, rasterized,
+                                                     aggregate=aggregate, grids=grids)
+            
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
             print(f"\nTrade-off plots saved to: {save_path}")
         
-        plt.show()
+        if not headless:
+            plt.show()
+        return fig
     
     @staticmethod
-    def plot_pareto_front(df: pd.DataFrame, pareto_df: pd.DataFrame):
+    def plot_tradeoff_panel(panel: str, df: pd.DataFrame, specs: PASpecs,
+                            save_path: str, dpi: int = 150, aggregate: str = None,
+                            grids: pd.DataFrame = None) -> str:
+        """Render one trade-off panel to its own file (headless)"""
+        fig = PAVisualizer._new_figure((16 / 3, 6), headless=True)
+        ax = fig.add_subplot(1, 1, 1)
+        getattr(PAVisualizer, '_panel_' + panel)(fig, ax, df, specs,
+                                                 PAVisualizer._rasterize(df),
+                                                 aggregate=aggregate, grids=grids)
+        fig.tight_layout()
+        fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
+        return save_path
+        
+    @staticmethod
+    def plot_pareto_front(df: pd.DataFrame, pareto_df: pd.DataFrame,
+                          save_path: str = None, headless: bool = False,
+                          dpi: int = 300, aggregate: str = None):
         """
         Visualize Pareto front for PAE vs IM3
         
         Args:
             df: All designs
             pareto_df: Pareto-optimal designs only
+            save_path: Optional path to save figure
+            headless: Draw on an Agg canvas and skip plt.show() (batch jobs)
+            dpi: Resolution of the saved figure
+            aggregate: Any of PAVisualizer.AGGREGATES to draw the 2-D
+                       background as a design-count image
+            
+        Returns:
+            The matplotlib Figure
         """
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig = PAVisualizer._new_figure((14, 6), headless)
+        rasterized = PAVisualizer._rasterize(df)
         
         # Plot 1: PAE vs IM3 with Pareto front
-        ax1.scatter(df['im3_dbc'], df['pae_percent'], 
-                   c='lightgray', alpha=0.4, s=30, label='All Designs')
+        ax1 = fig.add_subplot(1, 2, 1)
+        PAVisualizer._scatter(ax1, df['im3_dbc'], df['pae_percent'], 
+                              c='lightgray', alpha=0.4, s=30, label='All Designs',
+                              rasterized=rasterized, aggregate=aggregate)
         ax1.scatter(pareto_df['im3_dbc'], pareto_df['pae_percent'], 
                    c='red', marker='*', s=200, 
                    edgecolors='darkred', linewidths=2,
@@ -596,9 +2565,14 @@ class PAVisualizer:
         
         # Plot 2: 3D scatter (Pout, PAE, IM3)
         from mpl_toolkits.mplot3d import Axes3D
-        ax2 = fig.add_subplot(122, projection='3d')
-        ax2.scatter(df['pout_dbm'], df['pae_percent'], -df['im3_dbc'], 
-                   c='lightgray', alpha=0.3, s=20, label='All Designs')
+        ax2 = fig.add_subplot(1, 2, 2, projection='3d')
+        # 3-D axes cannot show an image layer: thin dense backgrounds instead
+        background = df
+        if rasterized:
+            background = df.sample(PAVisualizer.RASTERIZE_THRESHOLD, random_state=0)
+        ax2.scatter(background['pout_dbm'], background['pae_percent'], -background['im3_dbc'], 
+                   c='lightgray', alpha=0.3, s=20, label='All Designs',
+                   rasterized=rasterized)
         ax2.scatter(pareto_df['pout_dbm'], pareto_df['pae_percent'], 
                    -pareto_df['im3_dbc'], 
                    c='red', marker='*', s=200, 
@@ -610,8 +2584,82 @@ class PAVisualizer:
         ax2.set_title('3D Pareto Front', fontsize=14, fontweight='bold')
         ax2.legend()
         
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
+        
+        if save_path:
+            fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
+            print(f"\nPareto front plots saved to: {save_path}")
+            
+        if not headless:
+            plt.show()
+        return fig
+        
+    @staticmethod
+    def render_panels(df: pd.DataFrame, specs: PASpecs, out_dir: str,
+                      fmt: str = 'png', dpi: int = 150,
+                      max_workers: int = None, aggregate: str = None) -> List[str]:
+        """
+        Headless: render the six trade-off panels to separate files in parallel
+        
+        Args:
+            df: DataFrame with design sweep results
+            specs: PA specifications
+            out_dir: Output directory (created if missing)
+            fmt: File format ('png', 'pdf', 'svg', ...)
+            dpi: Resolution of raster output
+            max_workers: Process count (default: one per panel, up to CPUs)
+            aggregate: Density mode of the scatter panels (see plot_tradeoffs)
+            
+        Returns:
+            Paths of the written files, in TRADEOFF_PANELS order
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        columns = [c for c in ('iq_ma', 'zl_ohm', 'pout_dbm', 'pae_percent',
+                               'im3_dbc', 'yield_percent') if c in df]
+        # Contour grids are built once here, not once per worker
+        grids = PAVisualizer.design_space_grids(df)
+        jobs = [('tradeoff_panel',
+                 dict(panel=panel, df=df[columns], specs=specs, dpi=dpi,
+                      aggregate=aggregate,
+                      grids=grids if panel.endswith('design_space') else None,
+                      save_path=os.path.join(out_dir, f"{i + 1}_{panel}.{fmt}")))
+                for i, panel in enumerate(PAVisualizer.TRADEOFF_PANELS)]
+        return PAVisualizer.render_figures(jobs, max_workers)
+        
+    @staticmethod
+    def render_figures(jobs: List[Tuple[str, Dict]], max_workers: int = None) -> List[str]:
+        """
+        Headless: render figures in a process pool
+        
+        Args:
+            jobs: [(kind, kwargs)] with kind in 'tradeoffs', 'pareto_front'
+                  or 'tradeoff_panel' and kwargs of the matching plot method
+                  (save_path required)
+            max_workers: Process count (default: min(len(jobs), CPUs))
+            
+        Returns:
+            save_path of every job, in order
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        max_workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+        if max_workers <= 1:
+            return [_render_job(kind, kwargs) for kind, kwargs in jobs]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_render_job, kind, kwargs) for kind, kwargs in jobs]
+            return [f.result() for f in futures]
+
+
+def _render_job(kind: str, kwargs: Dict) -> str:
+    """Process-pool entry point for PAVisualizer.render_figures"""
+    if kind == 'tradeoff_panel':
+        return PAVisualizer.plot_tradeoff_panel(**kwargs)
+    if kind == 'tradeoffs':
+        PAVisualizer.plot_tradeoffs(headless=True, **kwargs)
+    elif kind == 'pareto_front':
+        PAVisualizer.plot_pareto_front(headless=True, **kwargs)
+    else:
+        raise ValueError(f"Unknown figure kind '{kind}'")
+    return kwargs['save_path']
 
 # ============================================================================
 # MAIN EXECUTION
@@ -0,0 +1,718 @@
+#!/usr/bin/env python3
+"""
+Measurement-Driven PA Simulator (Load-Pull Backend)
+===================================================
+
+SimulatorBackend for linearity_optimizer.py that answers simulate_batch
+queries from measured load-pull data instead of the analytical model.
+
+Includes:
+- Parsers for Focus power-sweep plans (.spl), Focus wave files (.lpcwave)
+  and Mestech/Auriga wave-quantity files (.cst)
+- LoadPullIndex: KD-tree over (gamma_load, Pin, frequency, Idq, Vdd) with
+  vectorized nearest-k inverse-distance interpolation, or linear
+  interpolation in the gamma plane and along each power sweep
+- LoadPullSimulator: drop-in replacement for PASimulator, warning (or
+  raising) when queries leave the measured operating range
+
+Each query costs O(log n) in the number of measured points, so sweeps and
+optimizers can run thousands of generations directly on measured data.
+
+Metrics that load-pull files do not contain (IM3, cost) still come from
+the analytical PASimulator; measured Pout, PAE and gain replace the model
+values, and ACPR, P1dB and yield are re-derived from them.
+
+Coordinates the data do not resolve are left out of the index: with
+single-bias data (one Idq, as in the bundled .spl files) the bias axis
+has no effect on the measured metrics. LoadPullSimulator reports such
+queries, and queries outside the measured range, with a
+LoadPullCoverageWarning.
+
+Usage:
+    data = read_loadpull('PA design App/LP_data/...P42_All.spl')
+    sim = LoadPullSimulator(specs, data, pin_dbm=20.0)
+    SweetSpotFinder(sim).find_sweet_spot(...)
+
+Author: PA Design Reference Manual Project
+Date: February 1, 2026
+"""
+
+import hashlib
+import os
+import re
+import warnings
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import Delaunay, QhullError, cKDTree
+
+from linearity_optimizer import (PADesign, PAPerformance, PAPerformanceBatch,
+                                 PASimulator, PASpecs)
+
+# Canonical columns of a parsed load-pull table
+LOADPULL_COLUMNS = ['gl_r', 'gl_i', 'z0_ohm', 'pin_dbm', 'freq_ghz', 'idq_ma',
+                    'vdd_v', 'pout_dbm', 'gain_db', 'pae_percent', 'de_percent']
+
+# Index coordinates and their default scales (one scale unit ~ equal weight)
+INDEX_COORDS = ('gl_r', 'gl_i', 'pin_dbm', 'freq_ghz', 'idq_ma', 'vdd_v')
+DEFAULT_SCALES = {'gl_r': 0.1, 'gl_i': 0.1, 'pin_dbm': 1.0,
+                  'freq_ghz': 0.05, 'idq_ma': 50.0, 'vdd_v': 2.0}
+
+# A coordinate spread below this fraction of its scale counts as constant
+CONSTANT_SPREAD = 0.1
+
+# 'linear' interpolation (in scale units): rows whose gamma agrees within
+# SITE_RESOLUTION form one load site (a power sweep); sites whose frequency,
+# Idq and Vdd agree within SETTING_RESOLUTION share one gamma-plane slice
+SITE_RESOLUTION = 0.01
+SETTING_RESOLUTION = 0.1
+SLICE_NEIGHBORS = 2     # Nearest settings blended per query
+
+
+class LoadPullCoverageWarning(UserWarning):
+    """Query outside what the measured load-pull data resolve"""
+
+
+# linearity_optimizer silences all warnings; these stay visible
+warnings.simplefilter('always', LoadPullCoverageWarning)
+
+# ============================================================================
+# FILE PARSERS
+# ============================================================================
+
+def _first_float(text: str) -> float:
+    match = re.search(r'[-+]?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?', text)
+    return float(match.group()) if match else np.nan
+
+
+def _to_float(token: str) -> float:
+    try:
+        return float(token)
+    except ValueError:
+        return np.nan  # N/A and similar placeholders
+
+
+def _filename_bias(path: str) -> Dict[str, float]:
+    """Idq / Vdd encoded in bench file names, e.g. Idq_96mA_Vdd_28V, Idq1p8"""
+    name = os.path.basename(path)
+    bias = {}
+    match = re.search(r'Idq_?(\d+(?:p\d+)?)(mA|A)?', name, re.IGNORECASE)
+    if match:
+        value = float(match.group(1).replace('p', '.'))
+        bias['idq_ma'] = value if (match.group(2) or '').lower() == 'ma' else value * 1000
+    match = re.search(r'Vdd_?(\d+(?:p\d+)?)V', name, re.IGNORECASE)
+    if match:
+        bias['vdd_v'] = float(match.group(1).replace('p', '.'))
+    return bias
+
+
+def _finish(df: pd.DataFrame, path: str) -> pd.DataFrame:
+    for col in LOADPULL_COLUMNS:
+        if col not in df:
+            df[col] = np.nan
+    df = df[LOADPULL_COLUMNS].astype(float)
+    df['source'] = os.path.basename(path)
+    return df.reset_index(drop=True)
+
+
+def read_spl(path: str) -> pd.DataFrame:
+    """Focus power sweep plan (.spl): one block per frequency"""
+    rows = []
+    header = None
+    with open(path, encoding='latin-1') as fh:
+        for line in fh:
+            tokens = line.split()
+            if not tokens or line.startswith('!'):
+                continue
+            if tokens[0] == 'valid':
+                # gamma_* columns hold two numbers (real, imaginary)
+                header = []
+                for name in tokens:
+                    header += [name + '_re', name + '_im'] if name.startswith('gamma_') else [name]
+                continue
+            if header is None or len(tokens) != len(header):
+                continue
+            try:
+                values = [float(t) for t in tokens]
+            except ValueError:
+                continue
+            rows.append(dict(zip(header, values)))
+            
+    raw = pd.DataFrame(rows)
+    if raw.empty:
+        raise ValueError(f"No data rows found in {path}")
+    raw = raw[raw['valid'] == 1]
+    
+    df = pd.DataFrame({
+        'gl_r': raw['gamma_ld1_re'],
+        'gl_i': raw['gamma_ld1_im'],
+        'z0_ohm': 50.0,
+        'pin_dbm': raw['Pin_avail_dBm'],
+        'freq_ghz': raw['Freq'],
+        'idq_ma': raw['Iq_out_mA'],
+        'vdd_v': raw['Vout_v'],
+        'pout_dbm': raw['Pout_dBm'],
+        'gain_db': raw['Gt_dB'],
+        'pae_percent': raw['Eff_%'],
+        'de_percent': raw['Eff_col'],
+    })
+    return _finish(df, path)
+
+
+def read_lpcwave(path: str) -> pd.DataFrame:
+    """Focus power-sweep wave file (.lpcwave): '# NNN |G| phase' load points"""
+    meta = {'z0_ohm': 50.0, 'freq_ghz': np.nan}
+    columns = None
+    gamma = (np.nan, np.nan)
+    rows = []
+    with open(path, encoding='latin-1') as fh:
+        for line in fh:
+            text = line.strip()
+            body = text.lstrip('!').strip()
+            if body.startswith('Point') and 'Gamma' in body:
+                columns = body.split()[3:]  # drop Point, Gamma, Phase
+                continue
+            if text.startswith('!'):
+                if body.startswith('Frequency ='):
+                    meta['freq_ghz'] = _first_float(body.split('=', 1)[1])
+                elif body.startswith('Char.Impedances') and 'Load:' in body:
+                    meta['z0_ohm'] = _first_float(body.split('Load:', 1)[1])
+                continue
+            if text.startswith('#'):
+                parts = text.lstrip('#').split()
+                if len(parts) >= 3:
+                    mag, ang = float(parts[1]), np.deg2rad(float(parts[2]))
+                    gamma = (mag * np.cos(ang), mag * np.sin(ang))
+                continue
+            if columns is None or not text:
+                continue
+            values = text.split()
+            if len(values) < len(columns):
+                continue
+            row = dict(zip(columns, map(_to_float, values)))
+            row['gl_r'], row['gl_i'] = gamma
+            rows.append(row)
+            
+    raw = pd.DataFrame(rows)
+    if raw.empty:
+        raise ValueError(f"No data rows found in {path}")
+        
+    gain_db = raw['GainWavesTrd[dB]']
+    power_gain = 10 ** (raw.get('GainWavesPwr[dB]', gain_db) / 10)
+    de = raw['DE_VNA_PA_ScopeEQN[%]']
+    bias = _filename_bias(path)
+    df = pd.DataFrame({
+        'gl_r': raw['gl_r'],
+        'gl_i': raw['gl_i'],
+        'z0_ohm': meta['z0_ohm'],
+        'pin_dbm': raw['PinWaves[dBm]'],
+        'freq_ghz': meta['freq_ghz'],
+        'idq_ma': bias.get('idq_ma', np.nan),
+        'vdd_v': raw['V2[V]'],
+        'pout_dbm': raw['PoutWaves[dBm]'],
+        'gain_db': gain_db,
+        'pae_percent': de * (1 - 1 / power_gain),
+        'de_percent': de,
+    })
+    return _finish(df, path)
+
+
+def read_cst(path: str) -> pd.DataFrame:
+    """Mestech/Auriga wave-quantity file (.cst): #BEGIN/#END blocks"""
+    blocks = []
+    block = None
+    meta = {'z0_ohm': 50.0, 'freq_ghz': np.nan, 'gl_r': np.nan, 'gl_i': np.nan,
+            'idq_ma': np.nan}
+    with open(path, encoding='latin-1') as fh:
+        for line in fh:
+            text = line.strip()
+            upper = text.upper()
+            if upper == '#BEGIN':
+                block = []
+            elif upper == '#END':
+                if block:
+                    data = np.array(block)
+                    blocks.append((dict(meta), data))
+                block = None
+            elif upper.startswith('#FUNDAMENTAL FREQUENCY'):
+                value = _first_float(text.split(':', 1)[1])
+                meta['freq_ghz'] = value / 1e9 if value > 1e6 else value
+            elif upper.startswith('#Z0LOAD'):
+                meta['z0_ohm'] = _first_float(text.split(':', 1)[1])
+            elif upper.startswith('#GAMMALOAD'):
+                mag, ang = map(float, text.split(':', 1)[1].split()[:2])
+                meta['gl_r'] = mag * np.cos(np.deg2rad(ang))
+                meta['gl_i'] = mag * np.sin(np.deg2rad(ang))
+            elif upper.startswith('#QUIESCENT BIAS POINT'):
+                parts = text.split(':', 1)[1].split()
+                meta['idq_ma'] = float(parts[3]) * 1000  # Vg Ig Vd Id
+            elif block is not None and text and not text.startswith('#'):
+                try:
+                    values = [float(t) for t in text.split()]
+                except ValueError:
+                    continue
+                if len(values) >= 13:
+                    block.append(values[:13])
+                    
+    if not blocks:
+        raise ValueError(f"No data blocks found in {path}")
+        
+    frames = []
+    for meta_b, data in blocks:
+        z0 = meta_b['z0_ohm'] if meta_b['z0_ohm'] > 0 else 50.0
+        a1 = data[:, 5] ** 2 + data[:, 6] ** 2
+        b1 = data[:, 7] ** 2 + data[:, 8] ** 2
+        a2 = data[:, 9] ** 2 + data[:, 10] ** 2
+        b2 = data[:, 11] ** 2 + data[:, 12] ** 2
+        pin_w = np.maximum((a1 - b1) / (2 * z0), 1e-15)
+        pout_w = np.maximum((b2 - a2) / (2 * z0), 1e-15)
+        pdc_w = data[:, 3] * data[:, 4]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            de = np.where(pdc_w > 1e-20, pout_w / pdc_w * 100, np.nan)
+            pae = np.where(pdc_w > 1e-20, (pout_w - pin_w) / pdc_w * 100, np.nan)
+        frames.append(pd.DataFrame({
+            'gl_r': meta_b['gl_r'],
+            'gl_i': meta_b['gl_i'],
+            'z0_ohm': z0,
+            'pin_dbm': 10 * np.log10(pin_w / 1e-3),
+            'freq_ghz': meta_b['freq_ghz'],
+            'idq_ma': meta_b['idq_ma'],
+            'vdd_v': data[:, 3],
+            'pout_dbm': 10 * np.log10(pout_w / 1e-3),
+            'gain_db': 10 * np.log10(pout_w / pin_w),
+            'pae_percent': pae,
+            'de_percent': de,
+        }))
+    return _finish(pd.concat(frames, ignore_index=True), path)
+
+
+LOADPULL_READERS = {
+    '.spl': read_spl,
+    '.lpcwave': read_lpcwave,
+    '.cst': read_cst,
+}
+
+
+def read_loadpull(paths) -> pd.DataFrame:
+    """
+    Parse one or more load-pull files into the canonical table
+    
+    Args:
+        paths: File path or list of paths (.spl, .lpcwave, .cst)
+        
+    Returns:
+        DataFrame with LOADPULL_COLUMNS plus 'source'
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    frames = []
+    for path in paths:
+        ext = os.path.splitext(str(path))[1].lower()
+        if ext not in LOADPULL_READERS:
+            raise ValueError(f"Unsupported load-pull format '{ext}': {path}")
+        frames.append(LOADPULL_READERS[ext](path))
+    return pd.concat(frames, ignore_index=True)
+
+# ============================================================================
+# SPATIAL INDEX
+# ============================================================================
+
+class LoadPullIndex:
+    """KD-tree over measured operating points with vectorized interpolation"""
+    
+    def __init__(self, data: pd.DataFrame,
+                 metrics: Sequence[str] = ('pout_dbm', 'gain_db', 'pae_percent'),
+                 scales: Dict[str, float] = None,
+                 z0_ohm: float = None):
+        """
+        Args:
+            data: Table from read_loadpull
+            metrics: Columns to interpolate
+            scales: Per-coordinate distance scale (see DEFAULT_SCALES)
+            z0_ohm: Reference impedance of the index gamma plane
+                    (default: that of the first file)
+        """
+        data = data.dropna(subset=list(metrics) + ['gl_r', 'gl_i', 'pin_dbm'])
+        if data.empty:
+            raise ValueError("No complete load-pull rows to index")
+            
+        self.metrics = list(metrics)
+        self.scales = {**DEFAULT_SCALES, **(scales or {})}
+        self.z0_ohm = float(z0_ohm or data['z0_ohm'].iloc[0])
+        
+        # Re-reference every file's gammas to the common z0 via impedance
+        zl = self.gamma_to_z(data['gl_r'].to_numpy() + 1j * data['gl_i'].to_numpy(),
+                             data['z0_ohm'].to_numpy())
+        gamma = self.z_to_gamma(zl, self.z0_ohm)
+        coords = {'gl_r': gamma.real, 'gl_i': gamma.imag}
+        for name in INDEX_COORDS[2:]:
+            coords[name] = data[name].to_numpy(dtype=float)
+            
+        # Only coordinates that vary (and are known) span the index. The
+        # rest are kept as a constant (their median, when every recorded
+        # value agrees within CONSTANT_SPREAD scales) or as unresolved
+        self.coords, self.constant, self.unresolved = [], {}, []
+        for c in INDEX_COORDS:
+            finite = coords[c][np.isfinite(coords[c])]
+            spread = np.ptp(finite) if len(finite) else np.nan
+            if len(finite) == len(data) and spread >= CONSTANT_SPREAD * self.scales[c]:
+                self.coords.append(c)
+            elif len(finite) and spread < CONSTANT_SPREAD * self.scales[c]:
+                self.constant[c] = float(np.median(finite))
+            else:
+                self.unresolved.append(c)
+        self.ranges = {c: (float(np.min(coords[c])), float(np.max(coords[c])))
+                       for c in self.coords}
+        self.points = np.column_stack([coords[c] / self.scales[c] for c in self.coords])
+        self.values = data[self.metrics].to_numpy(dtype=float)
+        self.tree = cKDTree(self.points)
+        
+        # Column layout of 'linear': gamma plane, Pin, setting (the rest)
+        self._layout = ([self.coords.index(c) for c in ('gl_r', 'gl_i') if c in self.coords],
+                        self.coords.index('pin_dbm') if 'pin_dbm' in self.coords else None,
+                        [i for i, c in enumerate(self.coords)
+                         if c not in ('gl_r', 'gl_i', 'pin_dbm')])
+        self._slices = None
+        
+    @staticmethod
+    def gamma_to_z(gamma, z0):
+        return z0 * (1 + gamma) / (1 - gamma)
+        
+    @staticmethod
+    def z_to_gamma(z, z0):
+        return (z - z0) / (z + z0)
+        
+    def __len__(self) -> int:
+        return len(self.points)
+        
+    def scaled_query(self, query: Dict[str, np.ndarray]) -> np.ndarray:
+        """Stack query coordinates (broadcast) into scaled index space"""
+        arrays = np.broadcast_arrays(*(np.asarray(query[c], dtype=float) for c in self.coords))
+        return np.column_stack([a.ravel() / self.scales[c] for a, c in zip(arrays, self.coords)])
+        
+    def coverage(self, query: Dict[str, np.ndarray]) -> Dict[str, str]:
+        """
+        Query coordinates the data do not resolve, with the reason
+        
+        Flags a constant coordinate queried more than one scale away from
+        its measured value, an indexed coordinate queried outside its
+        measured range, and any query of an unresolved coordinate.
+        """
+        problems = {}
+        for c, value in self.constant.items():
+            if c in query:
+                off = np.abs(np.asarray(query[c], dtype=float) - value)
+                if np.nanmax(off) > self.scales[c]:
+                    problems[c] = (f"measured at {value:g} only, queried up to "
+                                   f"{np.nanmax(off):g} away (ignored)")
+        for c in self.coords:
+            lo, hi = self.ranges[c]
+            q = np.asarray(query[c], dtype=float)
+            outside = np.count_nonzero((q < lo) | (q > hi))
+            if outside:
+                problems[c] = (f"{outside} of {q.size} queries outside the measured "
+                               f"range {lo:g}..{hi:g} (extrapolated)")
+        for c in self.unresolved:
+            if c in query:
+                problems[c] = "not recorded for every measured point (ignored)"
+        return problems
+        
+    def interpolate(self, query: Dict[str, np.ndarray], method: str = 'idw',
+                    k: int = 8, power: float = 2.0) -> np.ndarray:
+        """
+        Interpolate all metrics at the query points
+        
+        Args:
+            query: {coordinate: values}; gl_r/gl_i refer to z0_ohm
+            method: 'idw' (nearest-k inverse distance) or 'linear' (linear
+                    in the gamma plane and along Pin, inverse distance
+                    across the SLICE_NEIGHBORS nearest frequency/Idq/Vdd
+                    settings; IDW outside the measured gamma hull)
+            k: Neighbours used by IDW
+            power: IDW distance exponent
+            
+        Returns:
+            (n_queries, n_metrics) array
+        """
+        x = self.scaled_query(query)
+        
+        if method == 'linear':
+            out = self._linear(x, power)
+            outside = np.isnan(out).any(axis=1)
+            if outside.any():
+                out[outside] = self._idw(x[outside], k, power)
+            return out
+        if method == 'idw':
+            return self._idw(x, k, power)
+        raise ValueError(f"Unknown interpolation method '{method}'")
+        
+    @property
+    def slices(self) -> List[Dict]:
+        """
+        Gamma-plane triangulations for 'linear', one per measured setting
+        
+        Each slice holds its setting, a Delaunay triangulation of its load
+        sites (None with fewer than three, or collinear, sites) and per
+        site the power sweep sorted by Pin. Built on first use; costs
+        milliseconds, as no triangulation has more than two dimensions.
+        """
+        if self._slices is None:
+            gamma, pin, setting = self._layout
+            key = np.column_stack([np.round(self.points[:, gamma] / SITE_RESOLUTION),
+                                   np.round(self.points[:, setting] / SETTING_RESOLUTION)])
+            _, site_of = np.unique(key, axis=0, return_inverse=True)
+            site_of = site_of.ravel()
+            
+            sites = []
+            for rows in np.split(np.argsort(site_of, kind='stable'),
+                                 np.cumsum(np.bincount(site_of))[:-1]):
+                pins = self.points[rows, pin] if pin is not None else np.zeros(len(rows))
+                order = np.argsort(pins)
+                sites.append({'gamma': self.points[rows][:, gamma].mean(axis=0),
+                              'setting': self.points[rows][:, setting].mean(axis=0),
+                              'pin': pins[order], 'values': self.values[rows[order]]})
+                              
+            settings = np.array([site['setting'] for site in sites]).reshape(len(sites), -1)
+            _, slice_of = np.unique(np.round(settings / SETTING_RESOLUTION), axis=0,
+                                    return_inverse=True)
+            slice_of = slice_of.ravel()
+            self._slices = []
+            for s in range(slice_of.max() + 1):
+                members = [sites[i] for i in np.flatnonzero(slice_of == s)]
+                try:
+                    tri = (Delaunay(np.array([m['gamma'] for m in members]))
+                           if len(gamma) == 2 and len(members) >= 3 else None)
+                except QhullError:
+                    tri = None
+                self._slices.append({'setting': np.mean([m['setting'] for m in members], axis=0),
+                                     'tri': tri, 'sites': members})
+        return self._slices
+        
+    def _linear(self, x: np.ndarray, power: float) -> np.ndarray:
+        """'linear' interpolation; NaN rows where no nearby slice covers the query"""
+        gamma, pin, setting = self._layout
+        if len(gamma) < 2:
+            return np.full((len(x), len(self.metrics)), np.nan)
+        slices = self.slices
+        k = min(SLICE_NEIGHBORS, len(slices))
+        if setting:
+            dist, nearest = cKDTree([s['setting'] for s in slices]).query(x[:, setting], k=k)
+            dist, nearest = dist.reshape(len(x), k), nearest.reshape(len(x), k)
+        else:
+            dist, nearest = np.zeros((len(x), 1)), np.zeros((len(x), 1), dtype=int)
+            
+        total = np.zeros((len(x), len(self.metrics)))
+        weight = np.zeros(len(x))
+        for j in range(nearest.shape[1]):
+            for s in np.unique(nearest[:, j]):
+                rows = np.flatnonzero(nearest[:, j] == s)
+                values = self._slice_values(slices[s], x[rows][:, gamma],
+                                            x[rows, pin] if pin is not None else None)
+                ok = np.isfinite(values).all(axis=1)
+                w = 1.0 / np.maximum(dist[rows[ok], j], 1e-12) ** power
+                total[rows[ok]] += w[:, None] * values[ok]
+                weight[rows[ok]] += w
+        with np.errstate(invalid='ignore'):
+            return total / weight[:, None]
+            
+    @staticmethod
+    def _slice_values(layer: Dict, gamma: np.ndarray, pin: np.ndarray) -> np.ndarray:
+        """Barycentric in the gamma plane over each corner site's sweep at pin"""
+        out = np.full((len(gamma), layer['sites'][0]['values'].shape[1]), np.nan)
+        tri = layer['tri']
+        if tri is None:
+            return out
+        simplex = tri.find_simplex(gamma, tol=1e-9)  # Hull vertices and edges count as inside
+        inside = np.flatnonzero(simplex >= 0)
+        T = tri.transform[simplex[inside]]
+        bary = np.einsum('ijk,ik->ij', T[:, :2], gamma[inside] - T[:, 2])
+        bary = np.column_stack((bary, 1 - bary.sum(axis=1)))
+        corners = tri.simplices[simplex[inside]]
+        
+        acc = np.zeros((len(inside), out.shape[1]))
+        for site_id in np.unique(corners):
+            site = layer['sites'][site_id]
+            hit, corner = np.nonzero(corners == site_id)
+            at = pin[inside[hit]] if pin is not None else np.zeros(len(hit))
+            swept = np.column_stack([np.interp(at, site['pin'], v) for v in site['values'].T])
+            acc[hit] += bary[hit, corner][:, None] * swept
+        out[inside] = acc
+        return out
+        
+    def _idw(self, x: np.ndarray, k: int, power: float) -> np.ndarray:
+        k = min(k, len(self.points))
+        dist, idx = self.tree.query(x, k=k, workers=-1)
+        dist = dist.reshape(len(x), k)
+        idx = idx.reshape(len(x), k)
+        with np.errstate(divide='ignore'):
+            weights = 1.0 / dist ** power
+        exact = np.isinf(weights)
+        weights = np.where(exact.any(axis=1, keepdims=True), exact.astype(float), weights)
+        weights /= weights.sum(axis=1, keepdims=True)
+        return np.einsum('nk,nkm->nm', weights, self.values[idx])
+
+# ============================================================================
+# LOAD-PULL SIMULATOR BACKEND
+# ============================================================================
+
+class LoadPullSimulator:
+    """PASimulator replacement answering queries from measured load-pull data"""
+    
+    VERSION = '1.1'
+    
+    def __init__(self, specs: PASpecs, data: pd.DataFrame,
+                 pin_dbm: float = None,
+                 method: str = 'idw',
+                 k: int = 8,
+                 reference_width_um: float = None,
+                 scales: Dict[str, float] = None,
+                 off_data: str = 'warn'):
+        """
+        Args:
+            specs: PA specifications (freq_ghz selects the measured band)
+            data: Table from read_loadpull
+            pin_dbm: Drive level of the operating point (default: median Pin)
+            method: Interpolation method ('idw' or 'linear')
+            k: Neighbours for IDW
+            reference_width_um: Width of the measured device; if given,
+                                queries are scaled to other widths
+                                (Pout + 10log10(W/Wref), Zload * W/Wref)
+            scales: Per-coordinate distance scales for the index
+            off_data: 'warn' (once per coordinate), 'raise' or 'ignore'
+                      for queries the data do not resolve (see
+                      LoadPullIndex.coverage), e.g. a bias or frequency
+                      the data were not measured at
+        """
+        if off_data not in ('warn', 'raise', 'ignore'):
+            raise ValueError(f"off_data must be 'warn', 'raise' or 'ignore', not '{off_data}'")
+        self.specs = specs
+        self.index = LoadPullIndex(data, scales=scales)
+        if method == 'linear':
+            self.index.slices  # Triangulate up front, not inside the first query
+        self.pin_dbm = float(np.nanmedian(data['pin_dbm']) if pin_dbm is None else pin_dbm)
+        self.method = method
+        self.k = k
+        self.reference_width_um = reference_width_um
+        self.model = PASimulator(specs)
+        self.off_data = off_data
+        self._warned = set()
+        self.data_hash = hashlib.sha256(
+            pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes()).hexdigest()
+            
+    def cache_key(self) -> Dict[str, object]:
+        """Measured data content plus query settings (cache namespace)"""
+        return {'data': self.data_hash, 'pin_dbm': self.pin_dbm, 'method': self.method,
+                'k': self.k, 'reference_width_um': self.reference_width_um,
+                'scales': self.index.scales}
+                
+    def check_coverage(self, query: Dict[str, np.ndarray]) -> None:
+        """Apply the off_data policy to the problems LoadPullIndex.coverage finds"""
+        if self.off_data == 'ignore':
+            return
+        problems = self.index.coverage(query)
+        if problems and self.off_data == 'raise':
+            raise ValueError("Query outside the load-pull data: " +
+                             "; ".join(f"{c} {why}" for c, why in problems.items()))
+        for c in problems.keys() - self._warned:
+            warnings.warn(f"Load-pull data: {c} {problems[c]}",
+                          LoadPullCoverageWarning, stacklevel=3)
+            self._warned.add(c)
+        
+    def simulate_performance(self, design: PADesign) -> PAPerformance:
+        batch = self.simulate_batch(
+            design.transistor_width_um,
+            design.bias_iq_ma,
+            design.load_z_real_ohm,
+            design.load_z_imag_ohm,
+            design.harmonic_tuning
+        )
+        return batch[0]
+        
+    def simulate_batch(self,
+                       width_um,
+                       bias_iq_ma,
+                       load_z_real_ohm,
+                       load_z_imag_ohm,
+                       harmonic_tuning=False,
+                       vdd_v=None) -> PAPerformanceBatch:
+        """Same contract as PASimulator.simulate_batch, from measured data"""
+        
+        if vdd_v is None:
+            vdd_v = self.specs.vdd_v
+            
+        W, Iq, Zr, Zi, tuned, Vdd = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(width_um, dtype=float)),
+            np.asarray(bias_iq_ma, dtype=float),
+            np.asarray(load_z_real_ohm, dtype=float),
+            np.asarray(load_z_imag_ohm, dtype=float),
+            np.asarray(harmonic_tuning, dtype=bool),
+            np.asarray(vdd_v, dtype=float)
+        )
+        shape = W.shape
+        
+        # Analytical model supplies IM3 and cost (not in load-pull files)
+        base = self.model.simulate_batch(W, Iq, Zr, Zi, tuned, Vdd)
+        
+        width_ratio = W / self.reference_width_um if self.reference_width_um else 1.0
+        zl = (Zr + 1j * Zi) * width_ratio
+        gamma = self.index.z_to_gamma(zl, self.index.z0_ohm)
+        query = {
+            'gl_r': gamma.real,
+            'gl_i': gamma.imag,
+            'pin_dbm': self.pin_dbm,
+            'freq_ghz': self.specs.freq_ghz,
+            'idq_ma': Iq,
+            'vdd_v': Vdd,
+        }
+        self.check_coverage(query)
+        measured = self.index.interpolate(query, method=self.method, k=self.k)
+        
+        columns = dict(zip(self.index.metrics, measured.T))
+        pout_dbm = columns['pout_dbm'].reshape(shape) + 10 * np.log10(width_ratio)
+        pae_percent = columns['pae_percent'].reshape(shape)
+        gain_db = columns['gain_db'].reshape(shape)
+        
+        return PAPerformanceBatch(
+            pout_dbm=pout_dbm,
+            pae_percent=pae_percent,
+            im3_dbc=base.im3_dbc,
+            acpr_dbc=base.acpr_dbc,
+            gain_db=gain_db,
+            p1db_dbm=pout_dbm + 1.0,
+            cost_usd=base.cost_usd,
+            yield_percent=self.model.yield_from_margins(pout_dbm, pae_percent, base.im3_dbc)
+        )
+
+
+def main():
+    """Index the bundled LP_data files and time a batch of queries"""
+    import time
+    
+    lp_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          '..', '..', 'PA design App', 'LP_data')
+    paths = sorted(os.path.join(lp_dir, f) for f in os.listdir(lp_dir)
+                   if os.path.splitext(f)[1].lower() in LOADPULL_READERS)
+                   
+    for path in paths:
+        data = read_loadpull(path)
+        print(f"{os.path.basename(path)[:60]:<60} {len(data):>6} points, "
+              f"{data['freq_ghz'].nunique()} freq(s), "
+              f"Pout {data['pout_dbm'].min():.1f}..{data['pout_dbm'].max():.1f} dBm")
+              
+    data = read_loadpull([p for p in paths if p.endswith('.spl')])
+    specs = PASpecs(freq_ghz=1.88, pout_dbm=50.0, pae_min_percent=45.0,
+                    im3_max_dbc=-40.0, vdd_v=30.0)
+    sim = LoadPullSimulator(specs, data, pin_dbm=35.0)
+    
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    t0 = time.time()
+    perf = sim.simulate_batch(200.0, 1800.0, rng.uniform(1, 5, n), rng.uniform(-3, 1, n))
+    print(f"\n{n} queries on {len(sim.index)} measured points: {time.time() - t0:.2f} s")
+    print(f"  Pout {np.nanmin(perf.pout_dbm):.1f}..{np.nanmax(perf.pout_dbm):.1f} dBm, "
+          f"PAE {np.nanmin(perf.pae_percent):.1f}..{np.nanmax(perf.pae_percent):.1f} %")
+
+
+if __name__ == "__main__":
+    main()
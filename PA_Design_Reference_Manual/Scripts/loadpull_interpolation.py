@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+Load-Pull Point-Query Interpolation
+===================================
+
+Interpolation engine shared by the reference-manual scripts
+(pa_interpolation, plot_pa_figures) and the ADS gridded-data scripts.
+The Z-axis values are given at scattered load impedances (one per load-pull
+point); the interpolant is evaluated only at the requested target
+impedances, one or many per call, instead of on a full meshgrid.
+
+Includes:
+- LoadPullGrid: Delaunay triangulation and KD-tree of the impedances,
+  built once and shared by any number of metrics (stacked as columns);
+  k-nearest and radius queries for many reference impedances at once
+- GridInterpolant with methods
+    'nearest' : value of the closest measured impedance
+    'linear'  : barycentric on the Delaunay triangles (C0); the fast choice
+                for optimization inner loops
+    'cubic'   : Clough-Tocher, as scipy griddata (C1)
+    'natural' : Sibson natural-neighbour coordinates (C1 away from the data)
+    'rbf'     : thin-plate spline on the RBF_NEIGHBORS closest impedances;
+                the accurate choice for smooth responses and sign-off plots
+  and a per-query error estimate from its leave-one-out residuals
+  (GridInterpolant.error)
+- compare_methods: the speed/accuracy trade-off measured on the data at hand
+- get_grid: recently used grids, so a process that sees the same load-pull
+  points again skips both setups
+
+This is the only copy. The ADS workshop scripts (IFX_2022_2025/.../
+01_ADS template/python) import it through their pa_scripts_path module;
+keep it free of dependencies beyond numpy and scipy.
+
+Usage (as in the ADS scripts):
+    Zload = gamma_to_zload(GP_Var, Z0)
+    value = interpolate_at(Zload, ZData, gamma_to_zload(GP_ref, Z0), fill_value=...)
+    values = get_grid(Zload).interpolate(np.column_stack(rows), Zload_ref)
+    dist, idx = get_grid(Zload).nearest(Zload_ref, k=len(Zload)//4)
+    value, err = interpolate_at(Zload, ZData, Zload_ref, method='rbf', return_error=True)
+
+Author: PA Design Reference Manual Project
+Date: February 1, 2026
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+import numpy as np
+from scipy.interpolate import CloughTocher2DInterpolator, LinearNDInterpolator, RBFInterpolator
+from scipy.sparse import coo_matrix
+from scipy.spatial import Delaunay, QhullError, cKDTree
+
+# Number of point sets kept by get_grid
+GRID_CACHE_SIZE = 8
+_grid_cache = OrderedDict()
+
+# Measured impedances used by each thin-plate 'rbf' evaluation
+RBF_NEIGHBORS = 24
+# Measured impedances in each leave-one-out refit
+LOO_NEIGHBORS = 24
+# Leave-one-out residuals pooled into one error estimate
+ERROR_NEIGHBORS = 6
+# Query/triangle pairs tested at once for natural-neighbour cavities
+_CAVITY_CHUNK = 2**22
+
+
+def gamma_to_zload(gamma, z0=50):
+    """Load impedance(s) for reflection coefficient(s) gamma (reference z0)"""
+    gamma = np.asarray(gamma)
+    return (np.conj(z0) + z0 * gamma) / (1 - gamma)
+
+
+def default_fill_value(zdata, use_max=True):
+    """
+    Value returned outside the measured impedances: the minimum of the data
+    when larger values are better (Use_Max), the maximum otherwise.
+    Stacked (n,k) data gives one fill value per metric.
+    """
+    return np.min(zdata, axis=0) if use_max else np.max(zdata, axis=0)
+
+
+def _circumcentres(a, b, c):
+    """Circumcentres of the triangles with corners a, b, c (each (m,2)); inf if degenerate"""
+    b, c = b - a, c - a
+    bb, cc = np.sum(b**2, axis=1), np.sum(c**2, axis=1)
+    d = 2 * (b[:, 0] * c[:, 1] - b[:, 1] * c[:, 0])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return a + np.column_stack(((c[:, 1] * bb - b[:, 1] * cc) / d,
+                                    (b[:, 0] * cc - c[:, 0] * bb) / d))
+
+
+class LoadPullGrid:
+    """
+    Delaunay triangulation of the load-pull impedances, built once and
+    shared by every metric interpolated on them.
+    """
+    
+    METHODS = ('linear', 'cubic', 'nearest', 'rbf', 'natural')
+    
+    def __init__(self, zload):
+        self.zload = np.asarray(zload).ravel()
+        self.points = self._xy(self.zload)
+        self.tri = Delaunay(self.points)
+        self._tree = None
+        self._circles = None
+        
+    @staticmethod
+    def _xy(z):
+        """(m,2) array of real and imaginary parts of the impedance(s) z"""
+        return np.column_stack((np.real(z).ravel(), np.imag(z).ravel()))
+        
+    @property
+    def tree(self):
+        """KD-tree over the impedances (built on first use)"""
+        if self._tree is None:
+            self._tree = cKDTree(self.points)
+        return self._tree
+        
+    def _unit(self, xy):
+        """Coordinates centred and scaled to the point set (well-conditioned geometry)"""
+        lo, hi = self.points.min(axis=0), self.points.max(axis=0)
+        return (xy - (lo + hi) / 2) / max(np.max(hi - lo), 1e-300)
+        
+    @property
+    def circles(self):
+        """
+        Counter-clockwise triangles with their circumcentres, squared
+        circumradii and |centre|^2-radius^2 (unit coordinates)
+        """
+        if self._circles is None:
+            simplices = self.tri.simplices.copy()
+            corners = self._unit(self.points)[simplices]
+            b, c = corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]
+            cw = b[:, 0] * c[:, 1] - b[:, 1] * c[:, 0] < 0
+            simplices[cw] = simplices[cw][:, ::-1]
+            corners[cw] = corners[cw][:, ::-1]
+            centres = _circumcentres(corners[:, 0], corners[:, 1], corners[:, 2])
+            radii2 = np.sum((corners[:, 0] - centres)**2, axis=1)
+            self._circles = (simplices, centres, radii2, np.sum(centres**2, axis=1) - radii2)
+        return self._circles
+        
+    def natural_weights(self, xi):
+        """
+        Sibson natural-neighbour coordinates of the points xi, (m,2) inside
+        the convex hull, as a sparse (m,n) matrix with rows summing to 1.
+        
+        Watson's construction: inserting x removes the triangles whose
+        circumcircle contains it; each removed triangle gives each of its
+        corners the signed area between its circumcentre and the
+        circumcentres of x with the corner's two edges. On or next to a
+        triangle edge one of those circumcentres runs off to infinity and
+        the areas cancel; such queries take the stolen areas instead (see
+        _stolen_areas), which use no interior edge. A query on a measured
+        impedance takes that point's value, one on the hull the barycentric
+        weights of its hull edge (the limit of Sibson's).
+        """
+        xi = np.asarray(xi, dtype=float).reshape(-1, 2)
+        dist, idx = self.tree.query(xi)
+        on_point = dist <= 1e-12 * np.ptp(self.points, axis=0).max()
+        rows = [np.flatnonzero(on_point)]
+        cols = [idx[on_point]]
+        vals = [np.ones(len(rows[0]))]
+        
+        todo = np.flatnonzero(~on_point)
+        x = self._unit(xi[todo])
+        q, c, v = self._sibson(x)
+        # Cancellation between the signed areas loses more than 1e4 ulps
+        with np.errstate(invalid='ignore'):
+            bad = ~(np.bincount(q, np.abs(v), len(x)) < 1e4 * np.abs(np.bincount(q, v, len(x))))
+        keep = ~bad[q]
+        rows.append(todo[q[keep]])
+        cols.append(c[keep])
+        vals.append(v[keep])
+        todo, x = todo[bad], x[bad]
+        
+        # On a hull edge: its two corners, linearly
+        a, b = self._unit(self.points)[self.tri.convex_hull.T]
+        ab = b - a
+        t = np.clip(np.einsum('qhk,hk->qh', x[:, None] - a, ab) / np.sum(ab**2, axis=1), 0, 1)
+        gap = np.linalg.norm(x[:, None] - a - t[..., None] * ab, axis=2)
+        edge = gap.argmin(axis=1) if len(x) else np.zeros(0, dtype=int)
+        hull = gap[np.arange(len(x)), edge] <= 1e-10 if len(x) else np.zeros(0, dtype=bool)
+        t = t[np.arange(len(x)), edge]
+        rows.append(np.repeat(todo[hull], 2))
+        cols.append(self.tri.convex_hull[edge[hull]].ravel())
+        vals.append(np.column_stack((1 - t[hull], t[hull])).ravel())
+        
+        q, c, v = self._stolen_areas(x[~hull])
+        rows.append(todo[~hull][q])
+        cols.append(c)
+        vals.append(v)
+        
+        w = coo_matrix((np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+                       shape=(len(xi), len(self.points))).tocsr()
+        total = np.asarray(w.sum(axis=1)).ravel()
+        total[total == 0] = np.nan
+        return coo_matrix(w.multiply(1 / total[:, None])).tocsr()
+        
+    def _sibson(self, x):
+        """Unnormalised Sibson weights of unit-coordinate points x as (query, point, weight)"""
+        corners = self._unit(self.points)
+        simplices, centres, _, offset = self.circles
+        rows, cols, vals = [], [], []
+        step = max(1, _CAVITY_CHUNK // len(simplices))
+        for start in range(0, len(x), step):
+            chunk = x[start:start + step]
+            # Cavity of each query: the triangles whose circumcircle contains it
+            # (|x-c|^2<r^2 as 2x.c>|x|^2+|c|^2-r^2, one matrix product)
+            q, t = np.nonzero(2 * chunk @ centres.T
+                              > np.sum(chunk**2, axis=1)[:, None] + offset[None, :])
+            tri = simplices[t]
+            g = [_circumcentres(chunk[q], corners[tri[:, i]], corners[tri[:, (i + 1) % 3]])
+                 for i in range(3)]
+            with np.errstate(invalid='ignore'):
+                for i in range(3):
+                    a, b = g[i] - centres[t], g[i - 1] - centres[t]
+                    rows.append(start + q)
+                    cols.append(tri[:, i])
+                    vals.append((a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]) / 2)
+        if not rows:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int), np.zeros(0)
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(vals)
+        
+    def _stolen_areas(self, x):
+        """
+        Unnormalised Sibson weights of unit-coordinate points x strictly
+        inside the hull, one query at a time, as (query,point,weight)
+        triplets. Each natural neighbour p loses the convex polygon spanned
+        by the circumcentres of the cavity triangles at p and those of x
+        with p's two edges on the cavity boundary. Only boundary edges take
+        part, so a query on an interior triangle edge is exact.
+        """
+        corners = self._unit(self.points)
+        simplices, centres, _, offset = self.circles
+        n = len(self.points)
+        rows, cols, vals = [], [], []
+        for i, xq in enumerate(x):
+            t = np.flatnonzero(2 * centres @ xq > xq @ xq + offset)
+            tri = simplices[t]
+            # Directed edges of the (counter-clockwise) cavity triangles; an
+            # edge whose reverse is missing lies on the cavity boundary
+            head, tail = tri.ravel(), np.roll(tri, -1, axis=1).ravel()
+            boundary = ~np.isin(head * n + tail, tail * n + head)
+            head, tail = head[boundary], tail[boundary]
+            g = _circumcentres(np.broadcast_to(xq, (len(head), 2)), corners[head], corners[tail])
+            incoming = dict(zip(tail, g))
+            for p, g_out in zip(head, g):
+                polygon = np.vstack((incoming[p], g_out, centres[t[np.any(tri == p, axis=1)]]))
+                d = polygon - polygon.mean(axis=0)
+                polygon = polygon[np.argsort(np.arctan2(d[:, 1], d[:, 0]))]
+                u, w = polygon, np.roll(polygon, -1, axis=0)
+                rows.append(i)
+                cols.append(p)
+                vals.append(abs(np.sum(u[:, 0] * w[:, 1] - u[:, 1] * w[:, 0])) / 2)
+        return (np.asarray(rows, dtype=int), np.asarray(cols, dtype=int),
+                np.asarray(vals, dtype=float))
+                
+    def nearest(self, zref, k=1):
+        """
+        The k measured impedances closest to each reference impedance.
+        
+        Returns (distances, indices), sorted by distance, with the shape of
+        zref (plus (k,) for k>1).
+        """
+        zref = np.asarray(zref)
+        dist, idx = self.tree.query(self._xy(zref), k=k)
+        shape = zref.shape + dist.shape[1:]
+        return dist.reshape(shape), idx.reshape(shape)
+        
+    def within(self, zref, radius):
+        """
+        Indices of the measured impedances within radius (Ohm) of each
+        reference impedance: one sorted index array per reference, a single
+        array for a scalar zref.
+        """
+        zref = np.asarray(zref)
+        found = self.tree.query_ball_point(self._xy(zref), radius, return_sorted=True)
+        found = [np.asarray(f, dtype=int) for f in found]
+        return found[0] if zref.ndim == 0 else found
+        
+    def interpolate(self, zdata, zquery, method='cubic', fill_value=np.nan,
+                    neighbors=RBF_NEIGHBORS, return_error=False):
+        """
+        Interpolate one or many metrics at the query impedances.
+        
+        zdata        : values at zload, shape (n,) or (n,k) for k metrics;
+                       cubic (Clough-Tocher) gradients of all k columns are
+                       estimated in one pass
+        zquery       : target impedance(s), complex scalar or array
+        method       : 'linear', 'cubic', 'nearest' (as scipy griddata),
+                       'rbf' or 'natural'
+        fill_value   : value outside the convex hull, scalar or one per metric
+        neighbors    : measured impedances per 'rbf' evaluation
+        return_error : also return the error estimate (GridInterpolant.error)
+        
+        Returns the values with the shape of zquery (plus (k,) for stacked
+        metrics); a scalar for a scalar query of one metric. With
+        return_error, (values, errors) of the same shape.
+        """
+        interp = GridInterpolant(self, zdata, method, fill_value, neighbors)
+        if return_error:
+            return interp(zquery), interp.error(zquery)
+        return interp(zquery)
+
+
+class GridInterpolant:
+    """
+    Interpolant of fixed data on a LoadPullGrid. The setup (cubic gradient
+    estimation, RBF neighbourhoods) runs once; every call only evaluates the
+    query impedances, so long-lived processes keep it for repeated queries.
+    """
+    
+    def __init__(self, grid, zdata, method='cubic', fill_value=np.nan, neighbors=RBF_NEIGHBORS):
+        """Arguments as in LoadPullGrid.interpolate"""
+        if method not in LoadPullGrid.METHODS:
+            raise ValueError("method must be one of %s" % (LoadPullGrid.METHODS,))
+        self.grid = grid
+        self.zdata = np.asarray(zdata)
+        self.method = method
+        self.fill_value = fill_value
+        self.neighbors = neighbors
+        self._residuals = None
+        if method == 'cubic':
+            self._interp = CloughTocher2DInterpolator(grid.tri, self.zdata)
+        elif method == 'linear':
+            self._interp = LinearNDInterpolator(grid.tri, self.zdata)
+        elif method == 'rbf':
+            k = neighbors if neighbors and neighbors < len(grid.points) else None
+            self._interp = RBFInterpolator(grid.points, self.zdata, neighbors=k,
+                                           kernel='thin_plate_spline')
+                                           
+    def __call__(self, zquery):
+        zquery = np.asarray(zquery)
+        xi = self.grid._xy(zquery)
+        
+        if self.method == 'nearest':
+            values = self.zdata[self.grid.tree.query(xi)[1]]
+        else:
+            inside = self.grid.tri.find_simplex(xi) >= 0
+            if self.method == 'natural':
+                values = np.empty((len(xi),) + self.zdata.shape[1:],
+                                  dtype=np.result_type(self.zdata, float))
+                values[inside] = self.grid.natural_weights(xi[inside]) @ self.zdata
+            else:
+                values = self._interp(xi)
+            values[~inside] = self.fill_value
+            
+        values = values.reshape(zquery.shape + self.zdata.shape[1:])
+        return values[()] if values.ndim == 0 else values
+        
+    @property
+    def residuals(self):
+        """
+        Leave-one-out residuals at the measured impedances: each point's
+        value minus the same method's prediction from its LOO_NEIGHBORS
+        nearest other points. NaN where a point lies outside the hull of its
+        neighbours (edge of the data), or for too few points.
+        """
+        if self._residuals is None:
+            zload, n = self.grid.zload, len(self.grid.points)
+            residuals = np.full(self.zdata.shape, np.nan, dtype=np.result_type(self.zdata, float))
+            k = min(LOO_NEIGHBORS + 1, n)
+            _, near = self.grid.tree.query(self.grid.points, k=k)
+            for i in range(n if k > 3 else 0):
+                others = near[i][near[i] != i][:k - 1]
+                try:
+                    local = GridInterpolant(LoadPullGrid(zload[others]), self.zdata[others],
+                                            self.method, np.nan, self.neighbors)
+                except (QhullError, ValueError):
+                    continue  # Degenerate (collinear) neighbourhood
+                residuals[i] = self.zdata[i] - local(zload[i])
+            self._residuals = residuals
+        return self._residuals
+        
+    @property
+    def loo_rms(self):
+        """RMS leave-one-out residual over the data (per metric)"""
+        return np.sqrt(np.nanmean(np.abs(self.residuals)**2, axis=0))
+        
+    def error(self, zquery, k=ERROR_NEIGHBORS):
+        """
+        Error estimate at the query impedances: RMS of the leave-one-out
+        residuals of the k closest measured impedances, weighted by inverse
+        squared distance. Large where the data are sparse or the response
+        bends faster than the method follows; NaN where fill_value is
+        returned.
+        """
+        zquery = np.asarray(zquery)
+        xi = self.grid._xy(zquery)
+        k = min(k, len(self.grid.points))
+        dist, idx = self.grid.tree.query(xi, k=k)
+        dist, idx = dist.reshape(len(xi), k), idx.reshape(len(xi), k)
+        
+        r2 = np.abs(self.residuals[idx])**2
+        w = 1 / np.maximum(dist, 1e-12 * np.ptp(self.grid.points, axis=0).max())**2
+        w = w.reshape(w.shape + (1,) * (r2.ndim - 2)) * np.isfinite(r2)
+        with np.errstate(invalid='ignore'):
+            errors = np.sqrt(np.sum(w * np.nan_to_num(r2), axis=1) / np.sum(w, axis=1))
+        if self.method != 'nearest':
+            errors[self.grid.tri.find_simplex(xi) < 0] = np.nan
+            
+        errors = errors.reshape(zquery.shape + self.zdata.shape[1:])
+        return errors[()] if errors.ndim == 0 else errors
+
+
+def interpolate_at(zload, zdata, zquery, method='cubic', fill_value=np.nan,
+                   neighbors=RBF_NEIGHBORS, return_error=False):
+    """
+    Interpolate load-pull data at the query impedances only.
+    
+    zload        : measured load impedances (complex, shape (n,))
+    zdata        : values at zload, shape (n,) or (n,k) for k metrics
+    zquery       : target impedance(s), complex scalar or array
+    method       : 'linear', 'cubic', 'nearest' (scipy griddata), 'rbf'
+                   or 'natural'
+    fill_value   : value outside the convex hull of zload
+    neighbors    : measured impedances per 'rbf' evaluation
+    return_error : also return the per-query error estimate
+    
+    Returns the values with the shape of zquery (plus (k,) for stacked
+    metrics); a scalar for a scalar query of one metric. With return_error,
+    (values, errors) of the same shape.
+    """
+    return get_grid(zload).interpolate(zdata, zquery, method, fill_value, neighbors, return_error)
+
+
+def compare_methods(zload, zdata, zquery, methods=LoadPullGrid.METHODS, neighbors=RBF_NEIGHBORS):
+    """
+    Measured speed/accuracy trade-off of the interpolation methods on one
+    data set: per method the setup and query times (s) for zquery and the
+    leave-one-out RMS error (per metric).
+    
+    Returns an OrderedDict method -> dict(setup,query,loo_rms).
+    """
+    grid = get_grid(zload)
+    report = OrderedDict()
+    for method in methods:
+        start = time.perf_counter()
+        interp = GridInterpolant(grid, zdata, method, np.nan, neighbors)
+        setup = time.perf_counter() - start
+        start = time.perf_counter()
+        interp(zquery)
+        query = time.perf_counter() - start
+        report[method] = dict(setup=setup, query=query, loo_rms=interp.loo_rms)
+    return report
+
+
+def get_grid(zload):
+    """
+    LoadPullGrid of the impedances zload, reused while the same point set
+    comes back (keyed by its contents; the GRID_CACHE_SIZE most recently
+    used sets are kept).
+    """
+    zload = np.ascontiguousarray(zload, dtype=complex).ravel()
+    key = hashlib.sha1(zload.tobytes()).hexdigest()
+    grid = _grid_cache.pop(key, None)
+    if grid is None:
+        grid = LoadPullGrid(zload)
+    _grid_cache[key] = grid
+    while len(_grid_cache) > GRID_CACHE_SIZE:
+        _grid_cache.popitem(last=False)
+    return grid
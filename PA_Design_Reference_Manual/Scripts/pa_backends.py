@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+PA Simulator Backends
+=====================
+
+Execution backends implementing the SimulatorBackend protocol from
+linearity_optimizer.py for simulators that evaluate one design point at a
+time (EM/circuit simulation, wrapped ADS netlist runs, lab automation).
+
+A batch request is fanned out as N concurrent point evaluations, bounded by
+`max_concurrency`, so sweeps and optimizer generations no longer wait for
+slow points one after another.
+
+Includes:
+- PointBackend: asyncio base class (simulate_batch / simulate_batch_async)
+- SubprocessBackend: one external process per point (JSON in/out)
+- ProcessPoolBackend: picklable point function run in a process pool
+- FakeSlowBackend: local stand-in with artificial latency for testing
+
+Running this file as a script acts as a fake external simulator for
+SubprocessBackend: it reads one design point as JSON on stdin and writes
+the PASimulator metrics as JSON on stdout.
+
+Author: PA Design Reference Manual Project
+Date: February 1, 2026
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from linearity_optimizer import (PADesign, PAPerformance, PAPerformanceBatch,
+                                 PASimulator, PASpecs, PERFORMANCE_METRICS)
+
+# Keys of one design point (same names as PASimulator.simulate_batch)
+POINT_FIELDS = ('width_um', 'bias_iq_ma', 'load_z_real_ohm',
+                'load_z_imag_ohm', 'harmonic_tuning', 'vdd_v')
+
+
+def run_coroutine(coro):
+    """Run a coroutine to completion, also from inside a running event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    # Already inside a loop (e.g. Jupyter): run on a helper thread
+    result = {}
+    
+    def runner():
+        try:
+            result['value'] = asyncio.run(coro)
+        except BaseException as exc:
+            result['error'] = exc
+    
+    thread = threading.Thread(target=runner)
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+# ============================================================================
+# BASE CLASS
+# ============================================================================
+
+class PointBackend:
+    """Base class for backends that evaluate one design point per call"""
+    
+    VERSION = '1.0'
+    
+    def __init__(self, specs: PASpecs, max_concurrency: int = 8):
+        """
+        Args:
+            specs: PA specifications
+            max_concurrency: Max point evaluations in flight at once
+        """
+        self.specs = specs
+        self.max_concurrency = max_concurrency
+        self.evaluations = 0
+    
+    async def evaluate_point(self, point: Dict[str, float]) -> Dict[str, float]:
+        """Evaluate one design point; return {metric: value} for all metrics"""
+        raise NotImplementedError
+    
+    async def simulate_batch_async(self,
+                                   width_um,
+                                   bias_iq_ma,
+                                   load_z_real_ohm,
+                                   load_z_imag_ohm,
+                                   harmonic_tuning=False,
+                                   vdd_v=None) -> PAPerformanceBatch:
+        """Evaluate all broadcast design points concurrently"""
+        
+        if vdd_v is None:
+            vdd_v = self.specs.vdd_v
+        
+        inputs = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(width_um, dtype=float)),
+            np.asarray(bias_iq_ma, dtype=float),
+            np.asarray(load_z_real_ohm, dtype=float),
+            np.asarray(load_z_imag_ohm, dtype=float),
+            np.asarray(harmonic_tuning, dtype=bool),
+            np.asarray(vdd_v, dtype=float)
+        )
+        shape = inputs[0].shape
+        columns = [a.ravel().tolist() for a in inputs]
+        points = [dict(zip(POINT_FIELDS, row)) for row in zip(*columns)]
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def bounded(point):
+            async with semaphore:
+                return await self.evaluate_point(point)
+        
+        results = await asyncio.gather(*(bounded(p) for p in points))
+        self.evaluations += len(points)
+        
+        return PAPerformanceBatch(**{
+            m: np.array([r[m] for r in results], dtype=float).reshape(shape)
+            for m in PERFORMANCE_METRICS
+        })
+    
+    def simulate_batch(self, *args, **kwargs) -> PAPerformanceBatch:
+        """Blocking wrapper around simulate_batch_async"""
+        return run_coroutine(self.simulate_batch_async(*args, **kwargs))
+    
+    def simulate_performance(self, design: PADesign) -> PAPerformance:
+        batch = self.simulate_batch(
+            design.transistor_width_um,
+            design.bias_iq_ma,
+            design.load_z_real_ohm,
+            design.load_z_imag_ohm,
+            design.harmonic_tuning
+        )
+        return batch[0]
+
+# ============================================================================
+# SUBPROCESS BACKEND
+# ============================================================================
+
+class SubprocessBackend(PointBackend):
+    """
+    Run an external command once per design point
+    
+    The command receives the point (plus the specs) as a JSON object on
+    stdin and must print a JSON object with all PERFORMANCE_METRICS on
+    stdout, e.g. a wrapper script that patches an ADS netlist, runs the
+    simulator and post-processes the dataset.
+    """
+    
+    def __init__(self, specs: PASpecs, command: List[str],
+                 max_concurrency: int = 4, timeout_s: float = None):
+        super().__init__(specs, max_concurrency)
+        self.command = list(command)
+        self.timeout_s = timeout_s
+    
+    def cache_key(self) -> Dict[str, object]:
+        """Command line plus size and mtime of every file argument (cache namespace)"""
+        files = {}
+        for arg in self.command:
+            if os.path.isfile(arg):
+                stat = os.stat(arg)
+                files[os.path.abspath(arg)] = [stat.st_size, stat.st_mtime_ns]
+        return {'command': self.command, 'files': files}
+        
+    async def evaluate_point(self, point: Dict[str, float]) -> Dict[str, float]:
+        request = json.dumps({'specs': asdict(self.specs), 'point': point})
+        proc = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(request.encode()), self.timeout_s)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise RuntimeError(f"Simulator timed out after {self.timeout_s} s: {point}")
+        
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"Simulator exited with code {proc.returncode}: "
+                f"{stderr.decode(errors='replace').strip()}"
+            )
+        return json.loads(stdout)
+
+# ============================================================================
+# PROCESS POOL BACKEND
+# ============================================================================
+
+class ProcessPoolBackend(PointBackend):
+    """Run a picklable point function in a bounded process pool"""
+    
+    def __init__(self, specs: PASpecs,
+                 point_function: Callable[[PASpecs, Dict[str, float]], Dict[str, float]],
+                 max_workers: int = None):
+        """
+        Args:
+            specs: PA specifications
+            point_function: Module-level function (specs, point) -> metrics
+            max_workers: Pool size (default: number of CPUs)
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        super().__init__(specs, max_concurrency=max_workers)
+        self.executor = ProcessPoolExecutor(max_workers=max_workers)
+        self.point_function = point_function
+        
+    def cache_key(self) -> Dict[str, object]:
+        """Identity of the point function (cache namespace)"""
+        return {'point_function': f"{self.point_function.__module__}."
+                                  f"{getattr(self.point_function, '__qualname__', repr(self.point_function))}"}
+    
+    async def evaluate_point(self, point: Dict[str, float]) -> Dict[str, float]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.point_function, self.specs, point)
+    
+    def close(self):
+        self.executor.shutdown()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+# ============================================================================
+# FAKE SLOW BACKEND (TESTING)
+# ============================================================================
+
+def analytic_point(specs: PASpecs, point: Dict[str, float]) -> Dict[str, float]:
+    """Evaluate one point with the analytical PASimulator (picklable)"""
+    perf = PASimulator(specs).simulate_batch(**point)[0]
+    return {m: float(getattr(perf, m)) for m in PERFORMANCE_METRICS}
+
+
+def slow_analytic_point(specs: PASpecs, point: Dict[str, float],
+                        delay_s: float = 0.05) -> Dict[str, float]:
+    """Blocking analytic_point with artificial latency (for process pools)"""
+    time.sleep(delay_s)
+    return analytic_point(specs, point)
+
+
+class FakeSlowBackend(PointBackend):
+    """
+    Analytical model with a fixed per-point latency
+    
+    Stands in for a slow circuit simulator so the concurrency of sweeps and
+    optimizers can be tested locally: N points take about
+    ceil(N / max_concurrency) * delay_s instead of N * delay_s.
+    """
+    
+    def __init__(self, specs: PASpecs, delay_s: float = 0.05, max_concurrency: int = 8):
+        super().__init__(specs, max_concurrency)
+        self.delay_s = delay_s
+    
+    async def evaluate_point(self, point: Dict[str, float]) -> Dict[str, float]:
+        await asyncio.sleep(self.delay_s)
+        return analytic_point(self.specs, point)
+
+
+def main():
+    """Fake external simulator: JSON request on stdin -> metrics on stdout"""
+    request = json.load(sys.stdin)
+    specs = PASpecs(**request['specs'])
+    json.dump(analytic_point(specs, request['point']), sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+PA Evaluation Cache
+===================
+
+Content-addressed cache of simulator results shared by sweeps and
+optimizers, so repeated studies only pay for design points that are new.
+
+Includes:
+- EvaluationCache: in-memory LRU tier in front of an on-disk SQLite store
+- CachedSimulator: drop-in wrapper for PASimulator (or any backend with
+  simulate_batch) used by SweetSpotFinder and MultiObjectiveOptimizer
+
+Keys are the quantized design point (width, Iq, Zr, Zi, harmonic tuning,
+Vdd) inside a namespace derived from the PASpecs, the simulator class and
+version and the backend's own settings (its optional cache_key()), so
+results never leak between specs, model revisions or differently
+configured backends of one class.
+
+Usage:
+    cache = EvaluationCache('pa_eval_cache.sqlite')
+    sim = CachedSimulator(PASimulator(specs), cache)
+    SweetSpotFinder(sim).find_sweet_spot(...)
+    print(cache.stats())
+
+Author: PA Design Reference Manual Project
+Date: February 1, 2026
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Dict, Tuple
+
+import numpy as np
+
+from linearity_optimizer import (PADesign, PAPerformance, PAPerformanceBatch,
+                                 PASpecs, PERFORMANCE_METRICS)
+
+# Order of the design inputs in a cache key
+KEY_FIELDS = ('width_um', 'bias_iq_ma', 'load_z_real_ohm',
+              'load_z_imag_ohm', 'harmonic_tuning', 'vdd_v')
+
+# ============================================================================
+# EVALUATION CACHE
+# ============================================================================
+
+class EvaluationCache:
+    """Two-tier (memory LRU + SQLite) store of simulated performance rows"""
+    
+    def __init__(self, path: str = None, max_memory_entries: int = 1_000_000):
+        """
+        Args:
+            path: SQLite file for the persistent tier (None = memory only)
+            max_memory_entries: Capacity of the in-memory LRU tier
+        """
+        self.path = path
+        self.max_memory_entries = max_memory_entries
+        self._memory = OrderedDict()
+        self._conn = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        
+    # ------------------------------------------------------------------
+    # Persistent tier
+    # ------------------------------------------------------------------
+    
+    @property
+    def conn(self):
+        if self._conn is None and self.path is not None:
+            self._conn = sqlite3.connect(self.path)
+            columns = ', '.join(f'{m} REAL' for m in PERFORMANCE_METRICS)
+            self._conn.execute(
+                f'CREATE TABLE IF NOT EXISTS evaluations ('
+                f'namespace TEXT, key BLOB, {columns}, '
+                f'PRIMARY KEY (namespace, key))'
+            )
+            self._conn.commit()
+        return self._conn
+        
+    def __getstate__(self):
+        # Connections do not pickle; worker processes reopen the file lazily
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        state['_memory'] = OrderedDict()
+        return state
+        
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+    
+    def get_many(self, namespace: str, keys: list) -> Dict[bytes, np.ndarray]:
+        """Look up keys in memory, then on disk; returns {key: metric row}"""
+        found = {}
+        missing = []
+        for key in keys:
+            row = self._memory.get((namespace, key))
+            if row is None:
+                missing.append(key)
+            else:
+                self._memory.move_to_end((namespace, key))
+                found[key] = row
+        self.memory_hits += len(found)
+        
+        if missing and self.conn is not None:
+            columns = ', '.join(PERFORMANCE_METRICS)
+            for start in range(0, len(missing), 500):
+                block = missing[start:start + 500]
+                marks = ', '.join('?' * len(block))
+                rows = self.conn.execute(
+                    f'SELECT key, {columns} FROM evaluations '
+                    f'WHERE namespace = ? AND key IN ({marks})',
+                    [namespace, *block]
+                ).fetchall()
+                for key, *values in rows:
+                    row = np.array(values, dtype=float)
+                    found[key] = row
+                    self._remember(namespace, key, row)
+                    self.disk_hits += 1
+                    
+        self.misses += len(keys) - len(found)
+        return found
+        
+    def put_many(self, namespace: str, keys: list, rows: np.ndarray):
+        """Store metric rows (len(keys) x len(PERFORMANCE_METRICS))"""
+        for key, row in zip(keys, rows):
+            self._remember(namespace, key, row)
+        if self.conn is not None:
+            marks = ', '.join('?' * (len(PERFORMANCE_METRICS) + 2))
+            self.conn.executemany(
+                f'INSERT OR REPLACE INTO evaluations VALUES ({marks})',
+                [(namespace, key, *map(float, row)) for key, row in zip(keys, rows)]
+            )
+            self.conn.commit()
+            
+    def _remember(self, namespace: str, key: bytes, row: np.ndarray):
+        self._memory[(namespace, key)] = row
+        self._memory.move_to_end((namespace, key))
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+    
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+        
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+        
+    def stats(self) -> Dict[str, float]:
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'memory_entries': len(self._memory),
+        }
+        
+    def reset_stats(self):
+        self.memory_hits = self.disk_hits = self.misses = 0
+
+# ============================================================================
+# CACHED SIMULATOR
+# ============================================================================
+
+class CachedSimulator:
+    """PASimulator wrapper that serves repeated design points from a cache"""
+    
+    def __init__(self, simulator, cache: EvaluationCache, resolution: float = 1e-12):
+        """
+        Args:
+            simulator: Backend with .specs and .simulate_batch (e.g. PASimulator)
+            cache: Shared EvaluationCache
+            resolution: Quantization step applied to every key field; points
+                        closer than this share one cached result
+        """
+        self.sim = simulator
+        self.cache = cache
+        self.resolution = resolution
+        self.namespace = self.make_namespace(simulator)
+        
+    @property
+    def specs(self) -> PASpecs:
+        return self.sim.specs
+        
+    @staticmethod
+    def make_namespace(simulator) -> str:
+        """
+        Hash of the specs, the simulator class and version, and the
+        backend fingerprint
+        
+        Backends whose results depend on settings beyond the specs (command,
+        data set, interpolation options) implement cache_key() returning a
+        JSON-serializable description of them.
+        """
+        payload = {
+            'specs': asdict(simulator.specs),
+            'simulator': type(simulator).__qualname__,
+            'version': getattr(simulator, 'VERSION', None),
+        }
+        if callable(getattr(simulator, 'cache_key', None)):
+            payload['backend'] = simulator.cache_key()
+        payload = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+        
+    def make_keys(self, columns: Tuple[np.ndarray, ...]) -> list:
+        """Quantized byte keys, one per row of the broadcast inputs"""
+        quantized = np.column_stack([
+            np.round(np.asarray(c, dtype=float) / self.resolution).astype(np.int64)
+            for c in columns
+        ])
+        return [row.tobytes() for row in quantized]
+        
+    def simulate_performance(self, design: PADesign) -> PAPerformance:
+        batch = self.simulate_batch(
+            design.transistor_width_um,
+            design.bias_iq_ma,
+            design.load_z_real_ohm,
+            design.load_z_imag_ohm,
+            design.harmonic_tuning
+        )
+        return batch[0]
+        
+    def simulate_batch(self,
+                       width_um,
+                       bias_iq_ma,
+                       load_z_real_ohm,
+                       load_z_imag_ohm,
+                       harmonic_tuning=False,
+                       vdd_v=None) -> PAPerformanceBatch:
+        """Same contract as PASimulator.simulate_batch, evaluating only misses"""
+        
+        if vdd_v is None:
+            vdd_v = self.specs.vdd_v
+            
+        inputs = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(width_um, dtype=float)),
+            np.asarray(bias_iq_ma, dtype=float),
+            np.asarray(load_z_real_ohm, dtype=float),
+            np.asarray(load_z_imag_ohm, dtype=float),
+            np.asarray(harmonic_tuning, dtype=bool),
+            np.asarray(vdd_v, dtype=float)
+        )
+        shape = inputs[0].shape
+        flat = [a.ravel() for a in inputs]
+        keys = self.make_keys(flat)
+        
+        # Unique keys only: duplicates inside one batch are simulated once
+        unique = list(dict.fromkeys(keys))
+        found = self.cache.get_many(self.namespace, unique)
+        
+        todo = [k for k in unique if k not in found]
+        if todo:
+            first = {}
+            for i, k in enumerate(keys):
+                first.setdefault(k, i)
+            idx = np.array([first[k] for k in todo])
+            perf = self.sim.simulate_batch(*(f[idx] for f in flat))
+            rows = np.column_stack([getattr(perf, m).ravel() for m in PERFORMANCE_METRICS])
+            self.cache.put_many(self.namespace, todo, rows)
+            found.update(zip(todo, rows))
+            
+        table = np.array([found[k] for k in keys]).reshape(len(keys), len(PERFORMANCE_METRICS))
+        return PAPerformanceBatch(**{
+            m: table[:, j].reshape(shape) for j, m in enumerate(PERFORMANCE_METRICS)
+        })
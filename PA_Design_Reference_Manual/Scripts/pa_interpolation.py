@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Load-Pull Interpolation Modes
+=============================
+
+Scattered-data interpolation of load-pull metrics over the Γ plane with a
+selectable speed/accuracy mode and a per-query error estimate, so the
+choice between a fast interpolant (optimization inner loops) and an
+accurate one (sign-off contour plots) is measured rather than guessed.
+
+Includes:
+- ScatteredInterpolator with methods
+    'nearest' : value of the closest measured point
+    'linear'  : barycentric on the Delaunay triangles (C0)
+    'cubic'   : Clough-Tocher, as scipy griddata (C1)
+    'natural' : Sibson natural-neighbour coordinates (C1 away from the data)
+    'rbf'     : thin-plate spline over the RBF_NEIGHBORS nearest points
+- Leave-one-out residuals at the measured points and a local error
+  estimate at any query point (ScatteredInterpolator.error)
+- compare_methods: setup/query time and LOO RMS error of every method on
+  one data set
+
+The interpolation itself lives in one place, loadpull_interpolation.py in
+this folder (also used by the ADS gridded-data scripts); this module
+adapts it to real/imaginary Γ coordinates.
+
+Usage:
+    interp = ScatteredInterpolator(gamma_real, gamma_imag, pout, method='rbf')
+    pout_grid = interp(grid_X, grid_Y)
+    pout_err = interp.error(grid_X, grid_Y)
+    for report in compare_methods(gamma_real, gamma_imag, pout, grid_X, grid_Y):
+        print(report)
+
+Author: PA Design Reference Manual Project
+Date: February 1, 2026
+"""
+
+import time
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+
+from loadpull_interpolation import ERROR_NEIGHBORS, RBF_NEIGHBORS, GridInterpolant, LoadPullGrid
+
+METHODS = ('nearest', 'linear', 'cubic', 'natural', 'rbf')  # Roughly by query cost
+
+# ============================================================================
+# INTERPOLATOR
+# ============================================================================
+
+class ScatteredInterpolator:
+    """Interpolant of one metric over scattered Γ points with an error estimate"""
+    
+    def __init__(self, x: np.ndarray, y: np.ndarray, values: np.ndarray,
+                 method: str = 'cubic', fill_value: float = np.nan,
+                 neighbors: int = RBF_NEIGHBORS):
+        """
+        Args:
+            x, y: Measured point coordinates (e.g. Re Γ, Im Γ)
+            values: Metric at each point
+            method: One of METHODS
+            fill_value: Value outside the convex hull (all methods but 'nearest')
+            neighbors: Measured points per 'rbf' evaluation
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown interpolation method '{method}', use one of {METHODS}")
+        self.method = method
+        self.grid = LoadPullGrid(np.ravel(x) + 1j * np.ravel(y))
+        self._interp = GridInterpolant(self.grid, np.ravel(values).astype(float), method,
+                                       fill_value, neighbors)
+                                       
+    @property
+    def points(self) -> np.ndarray:
+        """(n, 2) measured point coordinates"""
+        return self.grid.points
+        
+    @staticmethod
+    def _complex(xq, yq) -> np.ndarray:
+        xq, yq = np.broadcast_arrays(np.asarray(xq, dtype=float), np.asarray(yq, dtype=float))
+        return xq + 1j * yq
+                                           
+    def __call__(self, xq, yq) -> np.ndarray:
+        """Interpolated values at the query points (shape of xq, yq broadcast)"""
+        return np.asarray(self._interp(self._complex(xq, yq)), dtype=float)
+        
+    @property
+    def residuals(self) -> np.ndarray:
+        """
+        Leave-one-out residuals at the measured points
+        
+        Each point's value minus the same method's prediction from its
+        LOO_NEIGHBORS nearest other points; NaN where the point lies outside
+        the hull of those neighbours (edge of the data).
+        """
+        return self._interp.residuals
+        
+    @property
+    def loo_rms(self) -> float:
+        """RMS leave-one-out residual over the measured points"""
+        return float(self._interp.loo_rms)
+        
+    def error(self, xq, yq, k: int = ERROR_NEIGHBORS) -> np.ndarray:
+        """
+        Local error estimate at the query points
+        
+        RMS of the leave-one-out residuals of the k nearest measured points,
+        weighted by inverse squared distance: large where the data are
+        sparse or the metric bends faster than the method follows.
+        
+        Returns:
+            Estimated absolute error (shape of xq, yq broadcast), NaN where
+            fill_value is returned
+        """
+        return np.asarray(self._interp.error(self._complex(xq, yq), k), dtype=float)
+
+
+# ============================================================================
+# METHOD COMPARISON
+# ============================================================================
+
+@dataclass
+class MethodReport:
+    """Measured cost and accuracy of one interpolation method"""
+    method: str
+    setup_s: float
+    query_s: float
+    loo_rms: float
+    
+    def __str__(self) -> str:
+        return (f"{self.method:8s} setup {self.setup_s*1e3:8.2f} ms  "
+                f"query {self.query_s*1e3:8.2f} ms  LOO RMS {self.loo_rms:.4g}")
+
+
+def compare_methods(x: np.ndarray, y: np.ndarray, values: np.ndarray, xq, yq,
+                    methods: Sequence[str] = METHODS,
+                    neighbors: int = RBF_NEIGHBORS) -> List[MethodReport]:
+    """
+    Speed/accuracy trade-off of the interpolation methods on one data set
+    
+    Args:
+        x, y, values: Measured points and metric
+        xq, yq: Representative query points (e.g. a plot grid)
+        methods: Methods to compare
+        neighbors: Measured points per 'rbf' evaluation
+        
+    Returns:
+        One MethodReport per method
+    """
+    reports = []
+    for method in methods:
+        t0 = time.perf_counter()
+        interp = ScatteredInterpolator(x, y, values, method, neighbors=neighbors)
+        setup = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        interp(xq, yq)
+        query = time.perf_counter() - t0
+        reports.append(MethodReport(method, setup, query, interp.loo_rms))
+    return reports
+
+
+def main():
+    """Compare the methods on a synthetic Pout load-pull with known truth"""
+    rng = np.random.default_rng(0)
+    r, phi = 0.9 * np.sqrt(rng.random(200)), 2 * np.pi * rng.random(200)
+    gr, gi = r * np.cos(phi), r * np.sin(phi)
+    
+    def pout(x, y):
+        return 43 - 10 * ((x - 0.3)**2 + (y - 0.2)**2) + 0.8 * np.sin(4 * x) * np.cos(3 * y)
+        
+        
+    grid_X, grid_Y = np.meshgrid(np.linspace(-0.8, 0.8, 200), np.linspace(-0.8, 0.8, 200))
+    truth = pout(grid_X, grid_Y)
+    print(f"{len(gr)} load-pull points, {grid_X.size} query points\n")
+    for report in compare_methods(gr, gi, pout(gr, gi), grid_X, grid_Y):
+        interp = ScatteredInterpolator(gr, gi, pout(gr, gi), report.method)
+        actual = np.sqrt(np.nanmean((interp(grid_X, grid_Y) - truth)**2))
+        estimate = np.sqrt(np.nanmean(interp.error(grid_X, grid_Y)**2))
+        print(f"{report}  actual RMS {actual:.4g}  estimated {estimate:.4g}")
+    print("\nContours with the estimated error overlaid:")
+    print("  plot_loadpull_contours(gr, gi, pout, method='rbf', show_error=True)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+PA Portfolio Runner
+===================
+
+Sweet-spot sweep, Pareto analysis and multi-objective optimization for a
+whole table of PASpecs variants (band / power grades of a product line)
+in one batch run.
+
+Includes:
+- load_portfolio: read the specs table from CSV or YAML
+- StudySettings: sweep / Pareto / optimizer settings shared by all variants
+  (table columns with the same names override them per variant)
+- run_portfolio: runs the variants in a process pool with one shared
+  EvaluationCache file and writes one consolidated ResultStore
+- main: command-line entry point
+
+The table has one row (CSV) or one mapping (YAML list, or a list under a
+'specs' key) per variant: an optional 'name' plus PASpecs fields, e.g.
+
+    name,freq_ghz,pout_dbm,pae_min_percent,im3_max_dbc
+    n78_43dBm,3.5,43.0,45.0,-40.0
+    n77_40dBm,3.8,40.0,42.0,-42.0
+
+Cached results are keyed by the specs, so variants never share entries;
+the shared cache pays off when a portfolio is refreshed and unchanged
+variants are served from disk.
+
+Usage:
+    python pa_portfolio.py portfolio.csv --out portfolio_store --cache eval_cache.sqlite
+    store = ResultStore('portfolio_store')
+    summary = pd.DataFrame(store.metadata['summary'])
+
+Author: PA Design Reference Manual Project
+Date: February 1, 2026
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import MISSING, asdict, dataclass, field, fields, replace
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from linearity_optimizer import (MultiObjectiveOptimizer, ParetoAnalyzer, PASimulator,
+                                 PASpecs, RunTelemetry, SweetSpotFinder)
+from pa_eval_cache import CachedSimulator, EvaluationCache
+from pa_result_store import ResultStore
+
+SPEC_FIELDS = tuple(f.name for f in fields(PASpecs))
+
+# ============================================================================
+# PORTFOLIO TABLE
+# ============================================================================
+
+@dataclass
+class StudySettings:
+    """Study run for every variant of a portfolio"""
+    transistor_width: float = 200.0
+    iq_range: Tuple[float, float] = (10, 100)
+    zl_range: Tuple[float, float] = (20, 100)
+    n_samples: int = 50
+    pareto_objectives: Tuple[str, ...] = ('pae_percent', 'im3_dbc')
+    pareto_maximize: Tuple[bool, ...] = (True, False)
+    weights: Dict[str, float] = field(default_factory=lambda: {
+        'im3': 0.5, 'pae': 0.3, 'pout': 0.15, 'cost': 0.05})
+    generations: int = 50
+    population: int = 30
+    seed: int = 42
+    early_stop_tol: float = None
+
+# Settings a table column may override per variant
+OVERRIDABLE = ('transistor_width', 'n_samples', 'generations', 'population',
+               'seed', 'early_stop_tol')
+
+
+def load_portfolio(path: str) -> pd.DataFrame:
+    """
+    Read a specs table
+    
+    Args:
+        path: .csv, or .yaml / .yml (needs PyYAML)
+        
+    Returns:
+        DataFrame with a unique 'name' column, PASpecs fields and any
+        per-variant StudySettings overrides
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        table = pd.read_csv(path)
+    elif ext in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("Reading YAML portfolios needs PyYAML (pip install pyyaml)")
+        with open(path) as fh:
+            data = yaml.safe_load(fh)
+        if isinstance(data, dict):
+            data = data.get('specs')
+        if not isinstance(data, list):
+            raise ValueError(f"{path}: expected a list of specs (or a 'specs' list)")
+        table = pd.DataFrame(data)
+    else:
+        raise ValueError(f"Unsupported portfolio format '{ext}' (use .csv or .yaml)")
+        
+    unknown = set(table.columns) - set(SPEC_FIELDS) - set(OVERRIDABLE) - {'name'}
+    if unknown:
+        raise ValueError(f"{path}: unknown columns {sorted(unknown)}")
+    required = [f.name for f in fields(PASpecs) if f.default is MISSING]
+    missing = [c for c in required if c not in table or table[c].isna().any()]
+    if missing:
+        raise ValueError(f"{path}: every variant needs {missing}")
+        
+    if 'name' not in table:
+        table.insert(0, 'name', [f"spec_{i:03d}" for i in range(len(table))])
+    table['name'] = table['name'].astype(str)
+    if table['name'].duplicated().any():
+        raise ValueError(f"{path}: duplicate names "
+                         f"{sorted(set(table['name'][table['name'].duplicated()]))}")
+    return table.reset_index(drop=True)
+
+
+def _variant(row: pd.Series, base: StudySettings) -> Tuple[PASpecs, StudySettings]:
+    """PASpecs and settings of one table row (NaN cells use the defaults)"""
+    given = {k: v for k, v in row.items() if not pd.isna(v)}
+    specs = PASpecs(**{k: float(given[k]) for k in SPEC_FIELDS if k in given})
+    overrides = {k: int(given[k]) if isinstance(getattr(base, k), int) else float(given[k])
+                 for k in OVERRIDABLE if k in given}
+    return specs, replace(base, **overrides)
+
+# ============================================================================
+# ONE VARIANT
+# ============================================================================
+
+def run_variant(spec_id: int, name: str, specs: PASpecs, settings: StudySettings,
+                cache_path: str = None) -> Dict:
+    """
+    Sweep, Pareto front and optimization of one variant (process-pool job)
+    
+    Returns:
+        {'spec_id', 'name', 'sweep': DataFrame with a pareto_optimal
+        column, 'summary': dict, 'events': telemetry events}
+    """
+    simulator = PASimulator(specs)
+    cache = None
+    if cache_path is not None:
+        cache = EvaluationCache(cache_path)
+        simulator = CachedSimulator(simulator, cache)
+    telemetry = RunTelemetry(quiet=True, run=name)
+    
+    with telemetry.stage('variant', cache=cache) as stage:
+        design, perf, sweep = SweetSpotFinder(simulator, telemetry).find_sweet_spot(
+            transistor_width=settings.transistor_width,
+            iq_range=settings.iq_range,
+            zl_range=settings.zl_range,
+            n_samples=settings.n_samples
+        )
+        pareto = ParetoAnalyzer.find_pareto_front(
+            sweep, list(settings.pareto_objectives), list(settings.pareto_maximize),
+            telemetry=telemetry)
+        sweep['pareto_optimal'] = sweep.index.isin(pareto.index)
+        
+        optimizer = MultiObjectiveOptimizer(simulator, specs, telemetry)
+        ga_design, ga_perf = optimizer.optimize(
+            weights=settings.weights,
+            generations=settings.generations,
+            population=settings.population,
+            verbose=False,
+            seed=settings.seed,
+            early_stop_tol=settings.early_stop_tol
+        )
+        stage['evaluations'] = sum(e.get('evaluations') or 0 for e in telemetry.events
+                                   if e['event'] == 'stage')
+                                   
+    if cache is not None:
+        cache.close()
+        
+    summary = {
+        'spec_id': spec_id,
+        'name': name,
+        **{f"spec_{k}": v for k, v in asdict(specs).items()},
+        'sweet_iq_ma': design.bias_iq_ma,
+        'sweet_zl_ohm': design.load_z_real_ohm,
+        'sweet_pout_dbm': perf.pout_dbm,
+        'sweet_pae_percent': perf.pae_percent,
+        'sweet_im3_dbc': perf.im3_dbc,
+        'n_pareto': len(pareto),
+        'ga_width_um': ga_design.transistor_width_um,
+        'ga_iq_ma': ga_design.bias_iq_ma,
+        'ga_zl_ohm': ga_design.load_z_real_ohm,
+        'ga_zi_ohm': ga_design.load_z_imag_ohm,
+        'ga_pout_dbm': ga_perf.pout_dbm,
+        'ga_pae_percent': ga_perf.pae_percent,
+        'ga_im3_dbc': ga_perf.im3_dbc,
+        'ga_cost_usd': ga_perf.cost_usd,
+        'ga_yield_percent': ga_perf.yield_percent,
+        'ga_generations': len(optimizer.convergence),
+        'wall_s': telemetry.events[-1]['wall_s'],
+    }
+    summary = {k: v.item() if isinstance(v, np.generic) else v for k, v in summary.items()}
+    return {'spec_id': spec_id, 'name': name, 'sweep': sweep,
+            'summary': summary, 'events': telemetry.events}
+
+# ============================================================================
+# PORTFOLIO
+# ============================================================================
+
+def run_portfolio(table: pd.DataFrame,
+                  out_path: str,
+                  settings: StudySettings = None,
+                  cache_path: str = None,
+                  max_workers: int = None,
+                  telemetry: RunTelemetry = None,
+                  overwrite: bool = False) -> pd.DataFrame:
+    """
+    Run every variant of a portfolio and consolidate the results
+    
+    Args:
+        table: Output of load_portfolio
+        out_path: ResultStore directory; rows are the sweep points of all
+                  variants with 'spec_id' (row of table) and
+                  'pareto_optimal' columns, metadata holds the table,
+                  settings and per-variant summary
+        settings: Study settings (default StudySettings())
+        cache_path: SQLite EvaluationCache file shared by all workers
+        max_workers: Process count (default: one per variant, up to CPUs)
+        telemetry: Receives every worker's events plus one 'portfolio' stage
+        overwrite: Replace an existing store
+        
+    Returns:
+        Summary DataFrame, one row per variant in table order
+    """
+    settings = settings or StudySettings()
+    telemetry = telemetry if telemetry is not None else RunTelemetry()
+    jobs = [(i, row['name'], *_variant(row, settings)) for i, row in table.iterrows()]
+    
+    store = ResultStore.create(out_path, metadata={
+        'specs': table.to_dict(orient='records'),
+        'settings': settings,
+    }, overwrite=overwrite)
+    
+    summaries = []
+    
+    def collect(result):
+        telemetry.log(f"  [{len(summaries) + 1}/{len(jobs)}] {result['name']}: "
+                      f"{len(result['sweep'])} points, "
+                      f"{result['summary']['n_pareto']} Pareto-optimal, "
+                      f"{result['summary']['wall_s']:.1f} s")
+        sweep = result['sweep']
+        sweep.insert(0, 'spec_id', np.int32(result['spec_id']))
+        store.append(sweep)
+        summaries.append(result['summary'])
+        for event in result['events']:
+            telemetry.emit(event.pop('event'), **event)
+            
+    telemetry.log(f"\nPortfolio: {len(jobs)} variants -> {out_path}")
+    with telemetry.stage('portfolio', variants=len(jobs)) as stage:
+        max_workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+        if max_workers <= 1:
+            for job in jobs:
+                collect(run_variant(*job, cache_path))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [pool.submit(run_variant, *job, cache_path) for job in jobs]
+                for future in as_completed(futures):
+                    collect(future.result())
+        stage['rows'] = len(store)
+        
+    summary = pd.DataFrame(summaries).sort_values('spec_id').reset_index(drop=True)
+    store.update_metadata(summary=summary.to_dict(orient='records'))
+    telemetry.log(f"  {store.summary()}")
+    return summary
+
+
+def main():
+    """Command line: run a CSV/YAML portfolio overnight"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('table', help="Specs table (.csv, .yaml)")
+    parser.add_argument('--out', default='portfolio_store', help="ResultStore directory")
+    parser.add_argument('--cache', default=None, help="Shared SQLite evaluation cache")
+    parser.add_argument('--workers', type=int, default=None, help="Process count")
+    parser.add_argument('--n-samples', type=int, default=StudySettings.n_samples)
+    parser.add_argument('--generations', type=int, default=StudySettings.generations)
+    parser.add_argument('--population', type=int, default=StudySettings.population)
+    parser.add_argument('--telemetry', default=None, help="JSON-lines telemetry file")
+    parser.add_argument('--overwrite', action='store_true')
+    args = parser.parse_args()
+    
+    settings = StudySettings(n_samples=args.n_samples, generations=args.generations,
+                             population=args.population)
+    summary = run_portfolio(load_portfolio(args.table), args.out, settings,
+                            cache_path=args.cache, max_workers=args.workers,
+                            telemetry=RunTelemetry(args.telemetry),
+                            overwrite=args.overwrite)
+                            
+    print("\nPortfolio summary:")
+    print(summary[['name', 'spec_freq_ghz', 'spec_pout_dbm', 'sweet_iq_ma', 'sweet_zl_ohm',
+                   'sweet_im3_dbc', 'n_pareto', 'ga_pae_percent', 'ga_im3_dbc',
+                   'wall_s']].to_string(index=False, float_format='%.2f'))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+PA Result Store
+===============
+
+Chunked columnar on-disk store for sweep and optimization results, so
+large studies outlive the script and can be reopened without a reload.
+
+Includes:
+- ResultStore: one .npy file per typed column plus a JSON metadata file
+  (PASpecs, axes, seed, ...), append support and lazy column loading
+- save_sweep: write a SweepResult without building a DataFrame
+
+Columns are plain .npy files whose header is rewritten in place when rows
+are appended, so every column can be opened with np.load(mmap_mode='r')
+(zero-copy) by this module or any other NumPy code.
+
+Usage:
+    store = ResultStore.create('sweep_store', metadata={'specs': specs})
+    finder.sweep_streaming(axes, sink=store.append)
+    store = ResultStore('sweep_store')
+    iq, pae = store['iq_ma'], store['pae_percent']   # memory maps
+
+Author: PA Design Reference Manual Project
+Date: February 1, 2026
+"""
+
+import json
+import os
+import shutil
+from dataclasses import asdict, is_dataclass
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from linearity_optimizer import SweepResult
+
+META_FILE = 'metadata.json'
+
+
+def _to_json(value):
+    """JSON encoder for dataclasses (PASpecs, ...) and NumPy values"""
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+# ============================================================================
+# RESULT STORE
+# ============================================================================
+
+class ResultStore:
+    """Directory of memory-mappable .npy columns with shared row count"""
+    
+    def __init__(self, path: str):
+        """
+        Open an existing store
+        
+        Args:
+            path: Store directory (created by ResultStore.create)
+        """
+        self.path = path
+        meta_path = os.path.join(path, META_FILE)
+        if not os.path.exists(meta_path):
+            raise FileNotFoundError(f"No result store at {path}")
+        with open(meta_path) as fh:
+            meta = json.load(fh)
+        self.n_rows = meta['n_rows']
+        self.dtypes = {name: np.dtype(d) for name, d in meta['columns'].items()}
+        self.metadata = meta['metadata']
+        
+    @classmethod
+    def create(cls, path: str, metadata: Dict = None, overwrite: bool = False) -> 'ResultStore':
+        """
+        Create an empty store
+        
+        Args:
+            path: Store directory
+            metadata: JSON-serializable run description; dataclasses such
+                      as PASpecs and NumPy arrays are converted
+            overwrite: Replace an existing store at path
+            
+        Returns:
+            ResultStore opened on the new directory
+        """
+        if os.path.exists(path):
+            if not overwrite:
+                raise FileExistsError(f"Result store {path} already exists")
+            shutil.rmtree(path)
+        os.makedirs(path)
+        meta = json.loads(json.dumps(metadata or {}, default=_to_json))
+        cls._write_meta(path, {'n_rows': 0, 'columns': {}, 'metadata': meta})
+        return cls(path)
+        
+    @staticmethod
+    def _write_meta(path: str, meta: Dict) -> None:
+        tmp = os.path.join(path, META_FILE + '.tmp')
+        with open(tmp, 'w') as fh:
+            json.dump(meta, fh, indent=2)
+        os.replace(tmp, os.path.join(path, META_FILE))
+        
+    def _column_path(self, name: str) -> str:
+        return os.path.join(self.path, name + '.npy')
+        
+    def _flush_meta(self) -> None:
+        self._write_meta(self.path, {
+            'n_rows': self.n_rows,
+            'columns': {name: d.str for name, d in self.dtypes.items()},
+            'metadata': self.metadata,
+        })
+        
+    def update_metadata(self, **items) -> None:
+        """Add or replace metadata entries (e.g. results known after the run)"""
+        self.metadata.update(json.loads(json.dumps(items, default=_to_json)))
+        self._flush_meta()
+        
+    @property
+    def columns(self) -> List[str]:
+        return list(self.dtypes)
+        
+    def __len__(self) -> int:
+        return self.n_rows
+        
+    def append(self, rows) -> None:
+        """
+        Append rows to every column
+        
+        Args:
+            rows: DataFrame or {column: 1-D array} with equal lengths; the
+                  first append fixes the column set and dtypes
+        """
+        if isinstance(rows, pd.DataFrame):
+            rows = {c: rows[c].to_numpy() for c in rows.columns}
+        rows = {name: np.asarray(values) for name, values in rows.items()}
+        lengths = {len(v) for v in rows.values()}
+        if len(lengths) != 1:
+            raise ValueError(f"Columns have different lengths: {lengths}")
+        n = lengths.pop()
+        
+        if not self.dtypes:
+            for name, values in rows.items():
+                if values.dtype.kind not in 'biuf':
+                    raise TypeError(f"Column '{name}' has unsupported dtype {values.dtype}")
+                self.dtypes[name] = values.dtype
+                self._write_column(name, values[:0], create=True)
+        elif set(rows) != set(self.dtypes):
+            raise ValueError(f"Columns {sorted(rows)} do not match store columns "
+                             f"{sorted(self.dtypes)}")
+                             
+        # Data first, then headers, then the row count: a crash mid-append
+        # leaves trailing bytes that are ignored on the next open
+        for name, values in rows.items():
+            self._write_column(name, values.astype(self.dtypes[name], copy=False))
+        self.n_rows += n
+        for name in self.dtypes:
+            self._write_header(name, self.n_rows)
+        self._flush_meta()
+        
+    def _write_column(self, name: str, values: np.ndarray, create: bool = False) -> None:
+        if create:
+            with open(self._column_path(name), 'wb') as fh:
+                np.lib.format.write_array_header_1_0(fh, self._header(name, 0))
+            return
+        with open(self._column_path(name), 'r+b') as fh:
+            fh.seek(self._data_offset(name) + self.n_rows * self.dtypes[name].itemsize)
+            fh.truncate()
+            fh.write(np.ascontiguousarray(values).tobytes())
+            
+    def _header(self, name: str, n_rows: int) -> Dict:
+        return {'descr': np.lib.format.dtype_to_descr(self.dtypes[name]),
+                'fortran_order': False, 'shape': (n_rows,)}
+                
+    def _data_offset(self, name: str) -> int:
+        with open(self._column_path(name), 'rb') as fh:
+            np.lib.format.read_magic(fh)
+            np.lib.format.read_array_header_1_0(fh)
+            return fh.tell()
+            
+    def _write_header(self, name: str, n_rows: int) -> None:
+        # NumPy pads headers so the shape can grow without moving the data
+        offset = self._data_offset(name)
+        with open(self._column_path(name), 'r+b') as fh:
+            np.lib.format.write_array_header_1_0(fh, self._header(name, n_rows))
+            if fh.tell() != offset:
+                raise RuntimeError(f"Header of column '{name}' outgrew its padding")
+                
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Read-only memory map of one column (zero-copy)"""
+        if name not in self.dtypes:
+            raise KeyError(name)
+        return np.load(self._column_path(name), mmap_mode='r')
+        
+    def load(self, columns: List[str] = None, rows: slice = None) -> pd.DataFrame:
+        """
+        Load selected columns (and optionally a row slice) into a DataFrame
+        
+        Only the requested columns are touched on disk; use store[name]
+        instead when a memory map is enough.
+        """
+        columns = columns or self.columns
+        rows = rows if rows is not None else slice(None)
+        return pd.DataFrame({name: np.array(self[name][rows]) for name in columns})
+        
+    def iter_chunks(self, columns: List[str] = None, chunk_rows: int = 2**20):
+        """Yield DataFrames of chunk_rows rows (for find_pareto_front_chunked)"""
+        for start in range(0, self.n_rows, chunk_rows):
+            yield self.load(columns, slice(start, start + chunk_rows))
+            
+    def summary(self) -> str:
+        size = sum(os.path.getsize(self._column_path(n)) for n in self.dtypes)
+        return (f"{self.path}: {self.n_rows} rows x {len(self.dtypes)} columns, "
+                f"{size / 1e6:.1f} MB")
+
+
+def save_sweep(path: str, result: SweepResult, metadata: Dict = None,
+               chunk_points: int = 2**20, overwrite: bool = False) -> ResultStore:
+    """
+    Write a SweepResult as flat columns (axes, then metrics, C order)
+    
+    Args:
+        path: Store directory
+        result: Output of SweetSpotFinder.sweep
+        metadata: Extra run description (specs, seed, ...); the axes and
+                  fixed values are always recorded
+        chunk_points: Rows written per append
+        overwrite: Replace an existing store
+        
+    Returns:
+        The new ResultStore
+    """
+    meta = {'axes': result.axes, 'fixed': result.fixed, **(metadata or {})}
+    store = ResultStore.create(path, meta, overwrite=overwrite)
+    names = list(result.axes)
+    for start in range(0, result.size, chunk_points):
+        flat = np.arange(start, min(start + chunk_points, result.size))
+        index = np.unravel_index(flat, result.shape)
+        rows = {name: result.axes[name][i] for name, i in zip(names, index)}
+        rows.update({m: a.reshape(-1)[flat] for m, a in result.metrics.items()})
+        store.append(rows)
+    return store
+
+
+def main():
+    """Stream a 5M-point sweep to disk and reopen two columns"""
+    import tempfile
+    import time
+    from linearity_optimizer import PASimulator, PASpecs, SweetSpotFinder
+    
+    specs = PASpecs(freq_ghz=3.5, pout_dbm=43.0, pae_min_percent=45.0,
+                    im3_max_dbc=-40.0, acpr_max_dbc=-45.0, gain_db=15.0, vdd_v=28.0)
+    finder = SweetSpotFinder(PASimulator(specs))
+    axes = {'width_um': np.linspace(50, 500, 50),
+            'iq_ma': np.linspace(10, 100, 320),
+            'zl_ohm': np.linspace(20, 100, 320)}
+            
+    path = os.path.join(tempfile.mkdtemp(), 'sweep_store')
+    store = ResultStore.create(path, metadata={'specs': specs, 'axes': axes})
+    t0 = time.time()
+    finder.sweep_streaming(axes, metrics=['pout_dbm', 'pae_percent', 'im3_dbc', 'fom'],
+                           top_k=0, sink=store.append)
+    print(f"Wrote {store.summary()} in {time.time() - t0:.2f} s")
+    
+    t0 = time.time()
+    store = ResultStore(path)
+    iq, pae = store['iq_ma'], store['pae_percent']
+    print(f"Reopened {len(store)} rows in {1e3 * (time.time() - t0):.1f} ms "
+          f"(memmap: {isinstance(pae, np.memmap)}), max PAE {pae.max():.1f} % "
+          f"at Iq = {iq[np.argmax(pae)]:.1f} mA")
+    print(f"Specs: {store.metadata['specs']}")
+    shutil.rmtree(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+PA Global Sensitivity Analysis
+==============================
+
+Which design inputs (width, Iq, Zr, Zi, ...) actually drive IM3, PAE,
+yield and the other PASimulator metrics over the whole design space.
+
+Includes:
+- SensitivityAnalysis.sobol: Saltelli sampling with first-order (Saltelli
+  2010) and total (Jansen) Sobol indices
+- SensitivityAnalysis.morris: Elementary-effects screening (mu, mu*, sigma)
+  at a fraction of the Sobol cost
+- Bootstrap confidence intervals for every index
+- SensitivityResult.reduced_space: bounds of the influential axes and fixed
+  values for the rest, ready for sweeps and optimizers
+
+Every sample matrix is evaluated in broadcast simulate_batch calls of
+batch_size designs, so a Sobol study with N = 4096 base samples over four
+inputs (24576 designs) takes well under a second with PASimulator.
+
+Usage:
+    sa = SensitivityAnalysis(PASimulator(specs))
+    result = sa.sobol(n_base=4096)
+    print(result.pivot('ST'))
+    bounds, fixed = result.reduced_space(['im3_dbc', 'pae_percent'])
+
+Author: PA Design Reference Manual Project
+Date: February 1, 2026
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.stats import qmc
+
+from linearity_optimizer import (MultiObjectiveOptimizer, PASimulator, PASpecs,
+                                 PERFORMANCE_METRICS, SimulatorBackend, SweetSpotFinder,
+                                 SWEEP_AXES, SWEEP_DEFAULTS)
+
+# Design space of MultiObjectiveOptimizer
+DEFAULT_BOUNDS = dict(zip(MultiObjectiveOptimizer.DESIGN_VARIABLES,
+                          MultiObjectiveOptimizer.BOUNDS))
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+
+@dataclass
+class SensitivityResult:
+    """Sensitivity indices in long format (one row per metric and parameter)"""
+    method: str                               # 'sobol' or 'morris'
+    indices: pd.DataFrame
+    bounds: Dict[str, Tuple[float, float]]
+    evaluations: int
+    
+    # Index compared with the screening threshold (upper confidence bound)
+    SCREENING_INDEX = {'sobol': 'ST_high', 'morris': 'mu_star_rel_high'}
+    
+    def pivot(self, index: str = None) -> pd.DataFrame:
+        """Metric x parameter table of one index (default: ST or mu_star)"""
+        index = index or ('ST' if self.method == 'sobol' else 'mu_star')
+        table = self.indices.pivot(index='metric', columns='parameter', values=index)
+        return table.loc[self.indices['metric'].unique(), list(self.bounds)]
+        
+    def influential(self, metrics: Sequence[str] = None, threshold: float = 0.05) -> List[str]:
+        """
+        Parameters that matter for any of the given metrics
+        
+        A parameter is kept when the upper confidence bound of its total
+        index (Sobol) or relative mu* (Morris, mu* / largest mu* of the
+        metric) exceeds threshold, so poorly resolved inputs are not dropped.
+        
+        Args:
+            metrics: Metrics to consider (default: all analysed metrics)
+            threshold: Screening threshold
+            
+        Returns:
+            Parameter names in bounds order
+        """
+        rows = self.indices
+        if metrics is not None:
+            rows = rows[rows['metric'].isin(metrics)]
+        score = rows.groupby('parameter')[self.SCREENING_INDEX[self.method]].max()
+        return [p for p in self.bounds if score.get(p, 0.0) > threshold]
+        
+    def reduced_space(self,
+                      metrics: Sequence[str] = None,
+                      threshold: float = 0.05,
+                      nominal: Dict[str, float] = None
+                      ) -> Tuple[Dict[str, Tuple[float, float]], Dict[str, float]]:
+        """
+        Split the design space into axes worth sweeping and fixed inputs
+        
+        Args:
+            metrics, threshold: As in influential
+            nominal: Values of the dropped parameters (default: bounds midpoint)
+            
+        Returns:
+            (bounds of influential parameters, {dropped parameter: value})
+        """
+        keep = self.influential(metrics, threshold)
+        nominal = nominal or {}
+        bounds = {p: self.bounds[p] for p in keep}
+        fixed = {p: nominal.get(p, 0.5 * (lo + hi))
+                 for p, (lo, hi) in self.bounds.items() if p not in keep}
+        return bounds, fixed
+
+# ============================================================================
+# SENSITIVITY ANALYSIS
+# ============================================================================
+
+class SensitivityAnalysis:
+    """Variance-based (Sobol) and screening (Morris) sensitivity analysis"""
+    
+    def __init__(self,
+                 simulator: SimulatorBackend,
+                 bounds: Dict[str, Tuple[float, float]] = None,
+                 fixed: Dict[str, float] = None,
+                 metrics: Sequence[str] = None,
+                 batch_size: int = 2**16,
+                 n_bootstrap: int = 1000,
+                 confidence: float = 0.95,
+                 seed: int = 42):
+        """
+        Args:
+            simulator: Any SimulatorBackend (PASimulator, CachedSimulator, ...)
+            bounds: {sweep axis: (low, high)} of the uniformly varied inputs
+                    (default: MultiObjectiveOptimizer design space)
+            fixed: Values of the other inputs (default: SWEEP_DEFAULTS)
+            metrics: Analysed metrics (PERFORMANCE_METRICS and/or 'fom')
+            batch_size: Designs per simulate_batch call
+            n_bootstrap: Bootstrap resamples of the confidence intervals
+            confidence: Confidence level of the intervals
+            seed: Seed for sampling and bootstrapping
+        """
+        self.bounds = dict(bounds or DEFAULT_BOUNDS)
+        for axis in self.bounds:
+            if axis not in SWEEP_AXES or axis == 'harmonic_tuning':
+                raise ValueError(f"Cannot vary '{axis}'")
+        self.metrics = list(metrics or PERFORMANCE_METRICS + ('fom',))
+        unknown = set(self.metrics) - set(PERFORMANCE_METRICS) - {'fom'}
+        if unknown:
+            raise ValueError(f"Unknown metrics {sorted(unknown)}")
+            
+        self.sim = simulator
+        self.fixed = {**SWEEP_DEFAULTS, **(fixed or {})}
+        self.batch_size = batch_size
+        self.n_bootstrap = n_bootstrap
+        self.confidence = confidence
+        self.seed = seed
+        
+    @property
+    def parameters(self) -> List[str]:
+        return list(self.bounds)
+        
+    def evaluate(self, unit: np.ndarray) -> np.ndarray:
+        """
+        Simulate designs given in unit-cube coordinates
+        
+        Args:
+            unit: (n, n_parameters) samples in [0, 1]
+            
+        Returns:
+            (n, n_metrics) metric values
+        """
+        lo, hi = np.array(list(self.bounds.values()), dtype=float).T
+        values = lo + unit * (hi - lo)
+        out = np.empty((len(unit), len(self.metrics)))
+        
+        for start in range(0, len(unit), self.batch_size):
+            chunk = values[start:start + self.batch_size]
+            inputs = {SWEEP_AXES[axis]: value for axis, value in self.fixed.items()
+                      if value is not None}
+            inputs.update({SWEEP_AXES[axis]: chunk[:, i]
+                           for i, axis in enumerate(self.bounds)})
+            perf = self.sim.simulate_batch(**inputs)
+            for j, m in enumerate(self.metrics):
+                if m == 'fom':
+                    out[start:start + len(chunk), j] = SweetSpotFinder.figure_of_merit(
+                        perf.im3_dbc, perf.pae_percent, perf.pout_dbm)
+                else:
+                    out[start:start + len(chunk), j] = getattr(perf, m)
+        return out
+        
+    def _interval(self, draws: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Percentile interval over the leading (bootstrap) axis"""
+        alpha = (1 - self.confidence) / 2
+        with np.errstate(invalid='ignore'):
+            low, high = np.nanquantile(draws, [alpha, 1 - alpha], axis=0)
+        return low, high
+        
+    def _frame(self, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """Long-format table from (n_parameters, n_metrics) index arrays"""
+        d, m = len(self.bounds), len(self.metrics)
+        frame = pd.DataFrame({'metric': np.tile(self.metrics, d),
+                              'parameter': np.repeat(self.parameters, m)})
+        for name, values in columns.items():
+            frame[name] = values.reshape(-1)
+        return frame.sort_values(['metric', 'parameter'], key=lambda s: s.map(
+            {v: i for i, v in enumerate(self.metrics + self.parameters)})).reset_index(drop=True)
+            
+    # ------------------------------------------------------------------
+    # Sobol indices
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def sobol_indices(f_a: np.ndarray, f_b: np.ndarray, f_ab: np.ndarray,
+                      weights: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        First-order and total Sobol indices from Saltelli model outputs
+        
+        Bootstrap resamples are given as row counts, so all of them reduce
+        to one matrix product per estimator instead of gathered copies.
+        
+        Args:
+            f_a, f_b: (N, n_metrics) outputs at sample matrices A and B
+            f_ab: (n_parameters, N, n_metrics) outputs at A with column i
+                  taken from B
+            weights: (n_draws, N) resample counts of the base rows
+                     (default: each row once)
+                     
+        Returns:
+            (S1, ST), each (n_parameters, n_draws, n_metrics)
+        """
+        if weights is None:
+            weights = np.ones((1, len(f_a)))
+        total = weights.sum(axis=1)[:, None]
+        
+        # Centering leaves the indices unchanged but avoids cancellation for
+        # metrics with large offsets (dBc, dBm)
+        mean = 0.5 * (f_a.mean(axis=0) + f_b.mean(axis=0))
+        f_a, f_b, f_ab = f_a - mean, f_b - mean, f_ab - mean
+        mean = weights @ (f_a + f_b) / (2 * total)
+        variance = weights @ (f_a ** 2 + f_b ** 2) / (2 * total) - mean ** 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            s1 = weights @ (f_b * (f_ab - f_a)) / total / variance
+            st = 0.5 * (weights @ (f_a - f_ab) ** 2) / total / variance
+        return s1, st
+        
+    def sobol(self, n_base: int = 4096) -> SensitivityResult:
+        """
+        Sobol indices with bootstrap confidence intervals
+        
+        Costs n_base * (n_parameters + 2) simulations.
+        
+        Args:
+            n_base: Base samples N (rounded up to a power of two for the
+                    scrambled Sobol sequence)
+                    
+        Returns:
+            SensitivityResult with S1, S1_low, S1_high, ST, ST_low, ST_high
+        """
+        d = len(self.bounds)
+        rng = np.random.default_rng(self.seed)
+        m = int(np.ceil(np.log2(max(n_base, 2))))
+        base = qmc.Sobol(2 * d, scramble=True, seed=rng).random_base2(m)
+        a, b = base[:, :d], base[:, d:]
+        n = len(base)
+        
+        # A, B and the d matrices A_B^(i) evaluated in one pass
+        ab = np.repeat(a[None], d, axis=0)
+        ab[np.arange(d), :, np.arange(d)] = b.T
+        y = self.evaluate(np.concatenate([a, b, ab.reshape(-1, d)]))
+        f_a, f_b, f_ab = y[:n], y[n:2 * n], y[2 * n:].reshape(d, n, -1)
+        s1, st = self.sobol_indices(f_a, f_b, f_ab)
+        
+        # Bootstrap over base samples (resample counts per draw)
+        draws = np.arange(self.n_bootstrap)[:, None]
+        idx = rng.integers(0, n, (self.n_bootstrap, n))
+        weights = np.bincount((idx + n * draws).ravel(),
+                              minlength=self.n_bootstrap * n).reshape(-1, n).astype(float)
+        s1_draws, st_draws = self.sobol_indices(f_a, f_b, f_ab, weights)
+        s1_low, s1_high = self._interval(s1_draws.swapaxes(0, 1))
+        st_low, st_high = self._interval(st_draws.swapaxes(0, 1))
+        
+        indices = self._frame({'S1': s1[:, 0], 'S1_low': s1_low, 'S1_high': s1_high,
+                               'ST': st[:, 0], 'ST_low': st_low, 'ST_high': st_high})
+        return SensitivityResult('sobol', indices, dict(self.bounds), len(y))
+        
+    # ------------------------------------------------------------------
+    # Morris screening
+    # ------------------------------------------------------------------
+    
+    def morris_trajectories(self, trajectories: int, levels: int,
+                            rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        One-at-a-time trajectories on a levels-point grid of the unit cube
+        
+        Returns:
+            (points (r, d+1, d), order (r, d) of the moved parameters,
+            signed step (r, d) of every parameter)
+        """
+        d = len(self.bounds)
+        delta = levels / (2 * (levels - 1))
+        start = rng.integers(0, levels, (trajectories, d)) / (levels - 1)
+        step = np.where(start + delta <= 1 + 1e-12, delta, -delta)
+        order = np.argsort(rng.random((trajectories, d)), axis=1)
+        
+        points = np.repeat(start[:, None], d + 1, axis=1)
+        rows = np.arange(trajectories)
+        for k in range(d):
+            points[:, k + 1] = points[:, k]
+            points[rows, k + 1, order[:, k]] += step[rows, order[:, k]]
+        return points, order, step
+        
+    def morris(self, trajectories: int = 100, levels: int = 4) -> SensitivityResult:
+        """
+        Morris elementary effects with bootstrap intervals of mu*
+        
+        Costs trajectories * (n_parameters + 1) simulations. Effects are in
+        unit-cube coordinates, so mu* compares parameters on equal footing.
+        
+        Args:
+            trajectories: Number of one-at-a-time trajectories r
+            levels: Grid levels p per parameter (even)
+            
+        Returns:
+            SensitivityResult with mu, mu_star, mu_star_low, mu_star_high,
+            sigma and the relative mu_star_rel (_low, _high)
+        """
+        d = len(self.bounds)
+        rng = np.random.default_rng(self.seed)
+        points, order, step = self.morris_trajectories(trajectories, levels, rng)
+        y = self.evaluate(points.reshape(-1, d)).reshape(trajectories, d + 1, -1)
+        
+        # Effect of the parameter moved between consecutive points
+        effects = np.empty((trajectories, d, y.shape[-1]))
+        rows = np.arange(trajectories)[:, None]
+        effects[rows, order] = np.diff(y, axis=1) / step[rows, order][..., None]
+        
+        idx = rng.integers(0, trajectories, (self.n_bootstrap, trajectories))
+        mu_star_draws = np.abs(effects[idx]).mean(axis=1)
+        mu_star = np.abs(effects).mean(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rel_draws = mu_star_draws / mu_star_draws.max(axis=1, keepdims=True)
+            rel = mu_star / mu_star.max(axis=0)
+        mu_star_low, mu_star_high = self._interval(mu_star_draws)
+        rel_low, rel_high = self._interval(rel_draws)
+        
+        indices = self._frame({'mu': effects.mean(axis=0), 'mu_star': mu_star,
+                               'mu_star_low': mu_star_low, 'mu_star_high': mu_star_high,
+                               'sigma': effects.std(axis=0, ddof=1), 'mu_star_rel': rel,
+                               'mu_star_rel_low': rel_low, 'mu_star_rel_high': rel_high})
+        return SensitivityResult('morris', indices, dict(self.bounds), y.shape[0] * y.shape[1])
+
+
+def main():
+    """Morris screening and Sobol indices over the optimizer design space"""
+    specs = PASpecs(freq_ghz=3.5, pout_dbm=43.0, pae_min_percent=45.0,
+                    im3_max_dbc=-40.0, acpr_max_dbc=-45.0, gain_db=15.0, vdd_v=28.0)
+    sa = SensitivityAnalysis(PASimulator(specs),
+                             metrics=['im3_dbc', 'pae_percent', 'pout_dbm', 'yield_percent'])
+                             
+    t0 = time.time()
+    morris = sa.morris(trajectories=200)
+    print(f"Morris screening: {morris.evaluations} simulations in {time.time() - t0:.2f} s")
+    print(morris.pivot('mu_star_rel').to_string(float_format='%.3f'))
+    
+    t0 = time.time()
+    sobol = sa.sobol(n_base=4096)
+    print(f"\nSobol indices: {sobol.evaluations} simulations in {time.time() - t0:.2f} s")
+    print("Total indices ST:")
+    print(sobol.pivot('ST').to_string(float_format='%.3f'))
+    print("\nFirst-order S1 with 95 % bootstrap intervals:")
+    print(sobol.indices[['metric', 'parameter', 'S1', 'S1_low', 'S1_high']]
+          .to_string(index=False, float_format='%.3f'))
+          
+    bounds, fixed = sobol.reduced_space(['im3_dbc', 'pae_percent'])
+    print(f"\nIM3 / PAE depend on {list(bounds)}; fix {fixed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+PA Surrogate-Assisted Optimization
+==================================
+
+Bayesian optimization for expensive simulator backends: Gaussian-process
+models of the metrics are fitted to the designs simulated so far and an
+acquisition function picks the next batch, so the simulator only sees a
+few hundred proposals instead of the thousands of calls
+differential_evolution and NSGA-II need.
+
+Includes:
+- GaussianProcess: GP regression with an ARD Matern-5/2 kernel and
+  maximum-likelihood hyperparameters (analytic gradients)
+- SurrogateOptimizer.optimize: weighted-score optimum (constrained expected
+  improvement), drop-in for MultiObjectiveOptimizer.optimize
+- SurrogateOptimizer.optimize_pareto: Pareto set (ParEGO: random augmented
+  Tchebycheff scalarizations), drop-in for the NSGA-II version
+- Batches of proposals per simulate_batch call (kriging believer), so
+  parallel backends stay busy
+
+One GP per metric is enough for both modes: the weighted score, the spec
+constraints and any scalarization are evaluated on Monte Carlo samples of
+the predicted metrics.
+
+Usage:
+    optimizer = SurrogateOptimizer(simulator, specs)
+    design, perf = optimizer.optimize(weights, budget=200)
+    pareto_df = optimizer.optimize_pareto(budget=300)
+
+Author: PA Design Reference Manual Project
+Date: February 1, 2026
+"""
+
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.linalg import LinAlgError, cho_solve, cholesky, solve_triangular
+from scipy.optimize import minimize
+from scipy.stats import qmc
+
+from linearity_optimizer import (HypervolumeTracker, MultiObjectiveOptimizer, PADesign,
+                                 PAPerformance, PASimulator, PASpecs, PERFORMANCE_METRICS,
+                                 ParetoAnalyzer, RunTelemetry, SimulatorBackend,
+                                 WeightedFitness)
+
+# ============================================================================
+# GAUSSIAN PROCESS
+# ============================================================================
+
+class GaussianProcess:
+    """
+    GP regression on unit-cube inputs with an ARD Matern-5/2 kernel
+    
+    Hyperparameters theta = (log length scales, log signal variance, log
+    noise variance) maximize the marginal likelihood of the standardized
+    targets; refits start from the previous theta.
+    """
+    
+    LENGTH_BOUNDS = (1e-2, 2e1)
+    SIGNAL_BOUNDS = (1e-2, 1e2)
+    NOISE_BOUNDS = (1e-8, 1e-2)
+    JITTER = 1e-10
+    
+    def __init__(self, theta: np.ndarray = None):
+        self.theta = theta
+        
+    @staticmethod
+    def kernel(x1: np.ndarray, x2: np.ndarray, theta: np.ndarray, gradient: bool = False):
+        """
+        Matern-5/2 covariance between two point sets
+        
+        Returns:
+            (n1, n2) covariance, plus its (n1, n2, d) derivative with respect
+            to the log length scales when gradient is set
+        """
+        d = x1.shape[1]
+        a, b = x1 / np.exp(theta[:d]), x2 / np.exp(theta[:d])
+        if gradient:
+            diff2 = (a[:, None, :] - b[None, :, :]) ** 2
+            r2 = diff2.sum(axis=-1)
+        else:
+            # Matrix-product form, no (n1, n2, d) temporary
+            r2 = np.maximum((a ** 2).sum(axis=1)[:, None] + (b ** 2).sum(axis=1) - 2 * a @ b.T, 0.0)
+        sr = np.sqrt(5.0 * r2)
+        decay = np.exp(theta[d]) * np.exp(-sr)
+        k = (1 + sr + sr ** 2 / 3) * decay
+        if not gradient:
+            return k
+        return k, (5.0 / 3.0) * ((1 + sr) * decay)[..., None] * diff2
+        
+    def _neg_log_likelihood(self, theta: np.ndarray) -> Tuple[float, np.ndarray]:
+        n, d = self.x.shape
+        k, dk = self.kernel(self.x, self.x, theta, gradient=True)
+        noise = np.exp(theta[-1])
+        try:
+            L = cholesky(k + (noise + self.JITTER) * np.eye(n), lower=True)
+        except LinAlgError:
+            return 1e10, np.zeros_like(theta)
+        alpha = cho_solve((L, True), self.y)
+        nll = 0.5 * self.y @ alpha + np.log(np.diag(L)).sum() + 0.5 * n * np.log(2 * np.pi)
+        
+        # d nll / d theta = 0.5 tr((K^-1 - alpha alpha^T) dK / d theta)
+        W = cho_solve((L, True), np.eye(n)) - np.outer(alpha, alpha)
+        grad = np.empty_like(theta)
+        grad[:d] = 0.5 * np.einsum('ij,ijk->k', W, dk)
+        grad[d] = 0.5 * np.sum(W * k)
+        grad[d + 1] = 0.5 * np.trace(W) * noise
+        return nll, grad
+        
+    def fit(self, x: np.ndarray, y: np.ndarray, optimize: bool = True) -> 'GaussianProcess':
+        """
+        Condition on observations
+        
+        Args:
+            x: (n, d) inputs in the unit cube
+            y: (n,) targets
+            optimize: Refit the hyperparameters (False keeps theta)
+        """
+        self.x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self.y_mean = y.mean()
+        self.y_std = y.std() if y.std() > 0 else 1.0
+        self.y = (y - self.y_mean) / self.y_std
+        
+        d = self.x.shape[1]
+        if self.theta is None:
+            self.theta = np.r_[np.full(d, np.log(0.3)), 0.0, np.log(1e-6)]
+        if optimize:
+            bounds = ([tuple(np.log(self.LENGTH_BOUNDS))] * d
+                      + [tuple(np.log(self.SIGNAL_BOUNDS)), tuple(np.log(self.NOISE_BOUNDS))])
+            result = minimize(self._neg_log_likelihood, self.theta, jac=True,
+                              method='L-BFGS-B', bounds=bounds)
+            if np.isfinite(result.fun):
+                self.theta = result.x
+                
+        n = len(self.x)
+        k = self.kernel(self.x, self.x, self.theta)
+        self.L = cholesky(k + (np.exp(self.theta[-1]) + self.JITTER) * np.eye(n), lower=True)
+        self.alpha = cho_solve((self.L, True), self.y)
+        return self
+        
+    def predict(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Posterior mean and standard deviation at (m, d) points"""
+        k = self.kernel(np.atleast_2d(x), self.x, self.theta)
+        mean = k @ self.alpha
+        v = solve_triangular(self.L, k.T, lower=True)
+        var = np.maximum(np.exp(self.theta[self.x.shape[1]]) - np.sum(v ** 2, axis=0), 1e-12)
+        return self.y_mean + self.y_std * mean, self.y_std * np.sqrt(var)
+
+
+class KrigingBeliever:
+    """
+    Posterior of a GaussianProcess at fixed candidates, with fantasy points
+    
+    A fantasy observation at a candidate takes the predicted mean as its
+    value, so the posterior mean is unchanged and only the variance
+    shrinks: every added point is a rank-one update of
+    O(candidates x observations) instead of a refit and a new prediction.
+    """
+    
+    def __init__(self, gp: GaussianProcess, cand: np.ndarray):
+        self.gp = gp
+        self.cand = cand
+        k = gp.kernel(cand, gp.x, gp.theta)
+        self.mean = gp.y_mean + gp.y_std * (k @ gp.alpha)
+        self.v = solve_triangular(gp.L, k.T, lower=True)
+        self.var = np.maximum(np.exp(gp.theta[gp.x.shape[1]]) - np.sum(self.v ** 2, axis=0), 1e-12)
+        self.updates = []
+        
+    @property
+    def std(self) -> np.ndarray:
+        return self.gp.y_std * np.sqrt(self.var)
+        
+    def add(self, i: int) -> None:
+        """Observe candidate i at its predicted mean"""
+        gp = self.gp
+        cov = gp.kernel(self.cand, self.cand[i:i + 1], gp.theta)[:, 0] - self.v.T @ self.v[:, i]
+        for u in self.updates:
+            cov -= u * u[i]
+        u = cov / np.sqrt(self.var[i] + np.exp(gp.theta[-1]))
+        self.var = np.maximum(self.var - u ** 2, 1e-12)
+        self.updates.append(u)
+
+# ============================================================================
+# SURROGATE OPTIMIZER
+# ============================================================================
+
+class SurrogateOptimizer(MultiObjectiveOptimizer):
+    """
+    Batched Bayesian optimization over the MultiObjectiveOptimizer design space
+    
+    Each iteration refits one GP per modeled metric, then picks batch_size
+    proposals one at a time: the acquisition is maximized over a candidate
+    set (Sobol points plus perturbations of the best designs), and the
+    chosen point is added to the GPs at its predicted value (kriging
+    believer) so the rest of the batch moves elsewhere. The batch is
+    simulated with one simulate_batch call.
+    """
+    
+    # Metrics needed by constraint_violation and WeightedFitness.score
+    CONSTRAINT_METRICS = ('pout_dbm', 'pae_percent', 'im3_dbc')
+    WEIGHTED_METRICS = ('pae_percent', 'im3_dbc', 'pout_dbm', 'cost_usd')
+    
+    def __init__(self, simulator: SimulatorBackend, specs: PASpecs,
+                 telemetry: RunTelemetry = None,
+                 candidates: int = 2048,
+                 mc_samples: int = 128):
+        """
+        Args:
+            simulator: Any SimulatorBackend (expensive ones benefit most)
+            specs: Design specifications (constraints)
+            telemetry: Progress and stage events
+            candidates: Candidate points per acquisition maximization
+            mc_samples: Monte Carlo samples of the predicted metrics
+        """
+        super().__init__(simulator, specs, telemetry)
+        self.candidates = candidates
+        self.mc_samples = mc_samples
+        
+    def _evaluate(self, x: np.ndarray) -> Dict[str, np.ndarray]:
+        """Simulate (n, 4) designs, return {metric: (n,) array}"""
+        perf = self.evaluate_population(x)
+        return {m: np.asarray(getattr(perf, m), dtype=float).ravel() for m in PERFORMANCE_METRICS}
+        
+    def _candidates(self, rng: np.random.Generator, unit: np.ndarray,
+                    rankings: List[np.ndarray]) -> np.ndarray:
+        """Global Sobol points plus local perturbations of the 5 best designs per ranking"""
+        d = unit.shape[1]
+        n_global = self.candidates // 2
+        points = [qmc.Sobol(d, seed=rng).random(n_global)]
+        centers = unit[np.unique(np.concatenate([r[:5] for r in rankings]))]
+        n_local = (self.candidates - n_global) // 2
+        for scale in (0.1, 0.02):
+            base = centers[rng.integers(0, len(centers), n_local)]
+            points.append(base + scale * rng.standard_normal((n_local, d)))
+        return np.clip(np.vstack(points), 0.0, 1.0)
+        
+    def _search(self,
+                stage_name: str,
+                metrics: List[str],
+                scalarization: Callable,
+                budget: int,
+                batch_size: int,
+                n_initial: int,
+                seed: int,
+                verbose: bool,
+                tracker: HypervolumeTracker = None,
+                objectives: Tuple[List[str], List[bool]] = None) -> Tuple[np.ndarray, Dict]:
+        """
+        Shared optimization loop
+        
+        Args:
+            scalarization: (rng, evaluated metrics) -> g, where g maps a
+                           metric namespace to values to minimize; called
+                           once per proposal (ParEGO draws new weights)
+            tracker: Hypervolume of objectives over all evaluated designs
+            
+        Returns:
+            (x, metrics) of every simulated design, x in real units
+        """
+        rng = np.random.default_rng(seed)
+        lower, upper = np.array(self.BOUNDS, dtype=float).T
+        d = len(lower)
+        n_initial = n_initial or min(10 * d, budget // 2)
+        
+        unit = qmc.LatinHypercube(d, seed=rng).random(n_initial)
+        values = self._evaluate(lower + unit * (upper - lower))
+        z = rng.standard_normal((self.mc_samples, len(metrics), 1))  # common random numbers
+        models = {m: GaussianProcess() for m in metrics}
+        history = []
+        seen = 0
+        
+        def record(batch: int):
+            nonlocal seen
+            evaluated = SimpleNamespace(**values)
+            feasible = self.constraint_violation(evaluated) <= 0
+            entry = {'batch': batch, 'evaluations': len(unit),
+                     'feasible': int(feasible.sum())}
+            if tracker is not None:
+                entry['hypervolume'] = tracker.update(
+                    self._objective_matrix(values, *objectives)[seen:])
+            else:
+                g = scalarization(rng, values)(evaluated)
+                entry['best_score'] = -float(g[feasible].min()) if feasible.any() else None
+            seen = len(unit)
+            history.append(entry)
+            self.telemetry.generation(stage_name, batch, **{k: v for k, v in entry.items()
+                                                            if k != 'batch'})
+            if verbose:
+                if tracker is not None:
+                    best = f"hypervolume {entry['hypervolume']:.4g}"
+                elif entry['best_score'] is not None:
+                    best = f"best score {entry['best_score']:.4f}"
+                else:
+                    best = "no feasible design yet"
+                print(f"  Batch {batch}: {len(unit)} evaluations, "
+                      f"{entry['feasible']} feasible, {best}")
+                      
+        with self.telemetry.stage(stage_name, cache=getattr(self.sim, 'cache', None),
+                                  budget=budget, batch_size=batch_size) as stage:
+            record(0)
+            batch_no = 0
+            while len(unit) < budget:
+                batch_no += 1
+                for m in metrics:
+                    models[m].fit(unit, values[m])
+                evaluated = SimpleNamespace(**values)
+                violation = self.constraint_violation(evaluated)
+                scalarizations = [scalarization(rng, values)
+                                  for _ in range(min(batch_size, budget - len(unit)))]
+                cand = self._candidates(rng, unit, [np.lexsort((g(evaluated), violation))
+                                                    for g in scalarizations])
+                believers = {m: KrigingBeliever(models[m], cand) for m in metrics}
+                chosen = []
+                for g in scalarizations:
+                    acq = self._acquisition(believers, metrics, g, evaluated, violation, z)
+                    acq[chosen] = -np.inf
+                    chosen.append(int(np.argmax(acq)))
+                    for believer in believers.values():
+                        believer.add(chosen[-1])
+                        
+                proposals = cand[chosen]
+                new = self._evaluate(lower + proposals * (upper - lower))
+                unit = np.vstack([unit, proposals])
+                values = {m: np.concatenate([values[m], new[m]]) for m in values}
+                record(batch_no)
+            stage['evaluations'] = len(unit)
+            stage['batches'] = batch_no
+            
+        self.convergence = pd.DataFrame(history)
+        return lower + unit * (upper - lower), values
+        
+    def _acquisition(self, believers: Dict[str, KrigingBeliever], metrics: List[str],
+                     g: Callable, evaluated: SimpleNamespace,
+                     violation: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """
+        Constrained expected improvement of g (Monte Carlo)
+        
+        Improvement counts only in samples that meet the specs; while no
+        simulated design is feasible, the expected violation is minimized
+        instead.
+        """
+        samples = SimpleNamespace(**{m: believers[m].mean + believers[m].std * z[:, i]
+                                     for i, m in enumerate(metrics)})
+        sample_violation = self.constraint_violation(samples)
+        feasible = violation <= 0
+        if not feasible.any():
+            return -sample_violation.mean(axis=0)
+        best = g(evaluated)[feasible].min()
+        improvement = np.maximum(best - g(samples), 0.0) * (sample_violation <= 0)
+        return improvement.mean(axis=0)
+        
+    @staticmethod
+    def _objective_matrix(values: Dict[str, np.ndarray], objectives: List[str],
+                          maximize: List[bool]) -> np.ndarray:
+        """Larger-is-better (n, k) matrix of evaluated objectives"""
+        sign = np.where(maximize, 1.0, -1.0)
+        return np.column_stack([values[m] for m in objectives]) * sign
+        
+    def optimize(self,
+                 weights: Dict[str, float],
+                 budget: int = 200,
+                 batch_size: int = 8,
+                 n_initial: int = None,
+                 seed: int = 42,
+                 verbose: bool = True) -> Tuple[PADesign, PAPerformance]:
+        """
+        Weighted-score optimum within a simulation budget
+        
+        Args:
+            weights: Objective weights as in MultiObjectiveOptimizer.optimize
+            budget: Total simulated designs (initial design included)
+            batch_size: Proposals per simulate_batch call
+            n_initial: Latin hypercube designs before the first fit
+                       (default: 10 per design variable)
+            seed: Random seed
+            verbose: Print progress (unless the telemetry is quiet)
+            
+        Returns:
+            optimal_design, optimal_performance (best simulated design
+            under WeightedFitness; no extra simulation)
+        """
+        verbose = verbose and not self.telemetry.quiet
+        if verbose:
+            print("\n" + "=" * 60)
+            print("SURROGATE-ASSISTED OPTIMIZATION (GP, expected improvement)")
+            print("=" * 60)
+            print(f"  Budget:      {budget} simulations")
+            print(f"  Batch size:  {batch_size}")
+            print(f"  Weights:     {weights}")
+            print("=" * 60 + "\n")
+            
+        fitness = WeightedFitness(self.sim, self.specs, weights)
+        x, values = self._search(
+            'optimize_surrogate', list(dict.fromkeys(self.WEIGHTED_METRICS + self.CONSTRAINT_METRICS)),
+            lambda rng, values: lambda perf: -fitness.score(perf),
+            budget, batch_size, n_initial, seed, verbose)
+            
+        evaluated = SimpleNamespace(**values)
+        best = int(np.argmin(fitness.penalty(evaluated) - fitness.score(evaluated)))
+        optimal_design = PADesign(
+            transistor_width_um=x[best, 0],
+            bias_iq_ma=x[best, 1],
+            load_z_real_ohm=x[best, 2],
+            load_z_imag_ohm=x[best, 3],
+            harmonic_tuning=False,
+            input_match_optimize=True
+        )
+        optimal_perf = PAPerformance(**{m: values[m][best] for m in PERFORMANCE_METRICS})
+        
+        if verbose:
+            print("\n" + "=" * 60)
+            print("OPTIMIZATION COMPLETE")
+            print("=" * 60)
+            print(f"  Transistor Width:  {optimal_design.transistor_width_um:.1f} μm")
+            print(f"  Bias Current:      {optimal_design.bias_iq_ma:.1f} mA")
+            print(f"  Load Impedance:    {optimal_design.load_z_real_ohm:.1f} + j{optimal_design.load_z_imag_ohm:.1f} Ω")
+            print("\n  Performance:")
+            print(f"    Pout:  {optimal_perf.pout_dbm:.2f} dBm")
+            print(f"    PAE:   {optimal_perf.pae_percent:.1f} %")
+            print(f"    IM3:   {optimal_perf.im3_dbc:.1f} dBc")
+            print(f"    Cost:  ${optimal_perf.cost_usd:.2f}")
+            print(f"    Yield: {optimal_perf.yield_percent:.1f} %")
+            print("=" * 60 + "\n")
+            
+        return optimal_design, optimal_perf
+        
+    def optimize_pareto(self,
+                        objectives: List[str] = None,
+                        maximize: List[bool] = None,
+                        budget: int = 300,
+                        batch_size: int = 8,
+                        n_initial: int = None,
+                        seed: int = 42,
+                        verbose: bool = True) -> pd.DataFrame:
+        """
+        Pareto set within a simulation budget (ParEGO)
+        
+        Every proposal minimizes the expected improvement of an augmented
+        Tchebycheff scalarization of the normalized objectives under fresh
+        random weights, so successive proposals spread along the front.
+        
+        Args:
+            objectives: Metric names (default PAE, IM3, Pout, cost)
+            maximize: One flag per objective (True = maximize)
+            budget, batch_size, n_initial, seed, verbose: As in optimize
+            
+        Returns:
+            DataFrame of the Pareto-optimal simulated designs, with the
+            columns of MultiObjectiveOptimizer.optimize_pareto
+        """
+        if objectives is None:
+            objectives = ['pae_percent', 'im3_dbc', 'pout_dbm', 'cost_usd']
+            maximize = [True, False, True, False]
+        if maximize is None or len(maximize) != len(objectives):
+            raise ValueError("maximize must give one flag per objective")
+            
+        verbose = verbose and not self.telemetry.quiet
+        if verbose:
+            print("\n" + "=" * 60)
+            print("SURROGATE-ASSISTED OPTIMIZATION (GP, ParEGO)")
+            print("=" * 60)
+            print(f"  Budget:      {budget} simulations")
+            print(f"  Batch size:  {batch_size}")
+            print(f"  Objectives:  {objectives}")
+            print("=" * 60 + "\n")
+            
+        sign = np.where(maximize, -1.0, 1.0)
+        
+        def tchebycheff(rng, values):
+            lam = rng.dirichlet(np.ones(len(objectives)))
+            F = np.column_stack([values[m] for m in objectives]) * sign
+            lo, hi = F.min(axis=0), F.max(axis=0)
+            scale = np.where(hi > lo, hi - lo, 1.0)
+            
+            def g(perf):
+                f = np.stack([(getattr(perf, m) * s - l) / w
+                              for m, s, l, w in zip(objectives, sign, lo, scale)])
+                weighted = lam.reshape((-1,) + (1,) * (f.ndim - 1)) * f
+                return weighted.max(axis=0) + 0.05 * weighted.sum(axis=0)
+            return g
+            
+        x, values = self._search(
+            'optimize_pareto_surrogate', list(dict.fromkeys(list(objectives) + list(self.CONSTRAINT_METRICS))),
+            tchebycheff, budget, batch_size, n_initial, seed, verbose,
+            tracker=HypervolumeTracker(), objectives=(objectives, maximize))
+            
+        F = np.column_stack([values[m] for m in objectives]) * sign
+        violation = self.constraint_violation(SimpleNamespace(**values))
+        rank = self.non_dominated_sort(F, violation)
+        crowding = self.crowding_distance(F, rank)
+        front = rank == 0
+        
+        pareto_df = pd.DataFrame(x[front], columns=self.DESIGN_VARIABLES)
+        pareto_df = pd.concat([pareto_df, pd.DataFrame({m: values[m][front]
+                                                        for m in PERFORMANCE_METRICS})], axis=1)
+        pareto_df['constraint_violation'] = violation[front]
+        pareto_df['crowding_distance'] = crowding[front]
+        pareto_df['pareto_optimal'] = True
+        
+        if verbose:
+            print("\n" + "=" * 60)
+            print("OPTIMIZATION COMPLETE")
+            print("=" * 60)
+            print(f"  Pareto-optimal designs: {len(pareto_df)}")
+            print(f"  Feasible:               {np.sum(violation[front] <= 0)}")
+            for m in objectives:
+                print(f"  {m:<22}[{pareto_df[m].min():.2f}, {pareto_df[m].max():.2f}]")
+            print("=" * 60 + "\n")
+            
+        return pareto_df
+
+
+def main():
+    """Surrogate vs differential evolution / NSGA-II on PASimulator"""
+    specs = PASpecs(freq_ghz=3.5, pout_dbm=43.0, pae_min_percent=45.0,
+                    im3_max_dbc=-40.0, acpr_max_dbc=-45.0, gain_db=15.0, vdd_v=28.0)
+    simulator = PASimulator(specs)
+    weights = {'im3': 0.5, 'pae': 0.3, 'pout': 0.15, 'cost': 0.05}
+    fitness = WeightedFitness(simulator, specs, weights)
+    
+    def design_score(design):
+        return -fitness(np.array([design.transistor_width_um, design.bias_iq_ma,
+                                  design.load_z_real_ohm, design.load_z_imag_ohm]))
+                                  
+    quiet = RunTelemetry(quiet=True)
+    t0 = time.time()
+    reference = MultiObjectiveOptimizer(simulator, specs, quiet)
+    design, _ = reference.optimize(weights, generations=50, population=30, verbose=False)
+    de_evals = quiet.events[-1]['evaluations']
+    print(f"Differential evolution: score {design_score(design):.4f} "
+          f"after {de_evals} simulations ({time.time() - t0:.1f} s)")
+          
+    t0 = time.time()
+    surrogate = SurrogateOptimizer(simulator, specs, RunTelemetry(quiet=True))
+    design, _ = surrogate.optimize(weights, budget=200)
+    print(f"Surrogate (GP):         score {design_score(design):.4f} "
+          f"after {surrogate.convergence['evaluations'].iloc[-1]} simulations "
+          f"({time.time() - t0:.1f} s)")
+          
+    objectives = list(MultiObjectiveOptimizer.HYPERVOLUME_OBJECTIVES)
+    maximize = list(MultiObjectiveOptimizer.HYPERVOLUME_MAXIMIZE)
+    nsga = reference.optimize_pareto(objectives, maximize, generations=100, population=100,
+                                     verbose=False)
+    front = surrogate.optimize_pareto(objectives, maximize, budget=300, verbose=False)
+    sign = np.where(maximize, 1.0, -1.0)
+    both = np.vstack([nsga[objectives].to_numpy(), front[objectives].to_numpy()]) * sign
+    reference_point = both.min(axis=0) - 0.1 * (both.max(axis=0) - both.min(axis=0))
+    hv_nsga = ParetoAnalyzer.hypervolume(nsga[objectives].to_numpy() * sign, reference_point)
+    hv_front = ParetoAnalyzer.hypervolume(front[objectives].to_numpy() * sign, reference_point)
+    print(f"\nPareto hypervolume: NSGA-II {hv_nsga:.4g} ({100 * 101} simulations), "
+          f"surrogate {hv_front:.4g} (300 simulations, {100 * hv_front / hv_nsga:.1f} %)")
+
+
+if __name__ == "__main__":
+    main()
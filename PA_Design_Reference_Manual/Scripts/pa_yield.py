@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+PA Monte Carlo Yield Engine
+===========================
+
+Manufacturing yield from sampled process variation instead of the
+heuristic margin factors in PASimulator.yield_from_margins.
+
+Includes:
+- ProcessVariation: distribution of one design input around its nominal
+- MonteCarloYield: Sobol / Latin hypercube / random sampling, evaluated
+  for all candidate designs in one broadcast simulate_batch call per batch
+- Streaming estimates with Wilson confidence intervals and per-design
+  early stopping once the interval is tight enough
+
+All designs see the same sample block (common random numbers), so yield
+differences between candidates are not masked by sampling noise.
+
+Usage:
+    mc = MonteCarloYield(PASimulator(specs))
+    yields = mc.estimate(pareto_df, max_samples=10_000, ci_halfwidth=1.0)
+    pareto_df = mc.apply(pareto_df)     # replace yield_percent in place
+
+Author: PA Design Reference Manual Project
+Date: February 1, 2026
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm, qmc
+
+from linearity_optimizer import (PADesign, PASimulator, PASpecs, SimulatorBackend,
+                                 SWEEP_AXES, SWEEP_DEFAULTS)
+
+# ============================================================================
+# PROCESS VARIATION
+# ============================================================================
+
+@dataclass
+class ProcessVariation:
+    """Statistical spread of one design input (axis names as in SWEEP_AXES)"""
+    axis: str
+    sigma: float
+    distribution: str = 'normal'  # 'normal', 'uniform' or 'lognormal'
+    relative: bool = True         # sigma as a fraction of the nominal value
+    
+    def sample(self, u: np.ndarray, nominal: np.ndarray) -> np.ndarray:
+        """
+        Map uniform samples to perturbed values of this input
+        
+        Args:
+            u: Uniform samples in (0, 1), shape (1, n_samples)
+            nominal: Nominal values, shape (n_designs, 1)
+            
+        Returns:
+            (n_designs, n_samples) perturbed values
+        """
+        if self.distribution == 'normal':
+            z = norm.ppf(u)
+        elif self.distribution == 'uniform':
+            z = np.sqrt(3.0) * (2.0 * u - 1.0)  # unit standard deviation
+        elif self.distribution == 'lognormal':
+            # Multiplicative spread, sigma is the standard deviation of ln(x)
+            return nominal * np.exp(self.sigma * norm.ppf(u) - 0.5 * self.sigma ** 2)
+        else:
+            raise ValueError(f"Unknown distribution '{self.distribution}'")
+            
+        spread = self.sigma * np.abs(nominal) if self.relative else self.sigma
+        return nominal + spread * z
+
+# Typical spreads: device periphery, bias setting, matching-network tolerance
+DEFAULT_VARIATIONS = (
+    ProcessVariation('width_um', 0.02),
+    ProcessVariation('iq_ma', 0.05),
+    ProcessVariation('zl_ohm', 0.05),
+    ProcessVariation('zi_ohm', 1.0, relative=False),
+)
+
+
+def spec_limits(specs: PASpecs) -> Dict[str, Tuple[float, float]]:
+    """Pass/fail window (low, high) per metric; same specs as yield_from_margins"""
+    return {
+        'pout_dbm': (specs.pout_dbm, None),
+        'pae_percent': (specs.pae_min_percent, None),
+        'im3_dbc': (None, specs.im3_max_dbc),
+    }
+
+# ============================================================================
+# YIELD ESTIMATES
+# ============================================================================
+
+@dataclass
+class YieldEstimate:
+    """Running pass counts per design with Wilson score intervals"""
+    n_samples: np.ndarray
+    n_pass: np.ndarray
+    confidence: float = 0.95
+    
+    @property
+    def yield_percent(self) -> np.ndarray:
+        return 100.0 * self.n_pass / np.maximum(self.n_samples, 1)
+        
+    def interval(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(low, high) Wilson score interval in percent"""
+        z = norm.ppf(0.5 + self.confidence / 2)
+        n = np.maximum(self.n_samples, 1)
+        p = self.n_pass / n
+        denom = 1 + z ** 2 / n
+        center = (p + z ** 2 / (2 * n)) / denom
+        half = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denom
+        return 100.0 * (center - half), 100.0 * (center + half)
+        
+    @property
+    def halfwidth(self) -> np.ndarray:
+        low, high = self.interval()
+        return (high - low) / 2
+        
+    def to_frame(self) -> pd.DataFrame:
+        low, high = self.interval()
+        return pd.DataFrame({
+            'yield_percent': self.yield_percent,
+            'yield_ci_low': low,
+            'yield_ci_high': high,
+            'yield_samples': self.n_samples,
+        })
+
+# ============================================================================
+# MONTE CARLO ENGINE
+# ============================================================================
+
+class MonteCarloYield:
+    """Batched Monte Carlo yield of many candidate designs"""
+    
+    SAMPLERS = ('sobol', 'lhs', 'random')
+    
+    def __init__(self,
+                 simulator: SimulatorBackend,
+                 variations: Sequence[ProcessVariation] = DEFAULT_VARIATIONS,
+                 limits: Dict[str, Tuple[float, float]] = None,
+                 sampler: str = 'sobol',
+                 confidence: float = 0.95,
+                 seed: int = 42):
+        """
+        Args:
+            simulator: Any SimulatorBackend (PASimulator, CachedSimulator, ...)
+            variations: Process variations (one sample dimension each)
+            limits: {metric: (low, high)} pass window, None = open side
+                    (default: spec_limits(simulator.specs))
+            sampler: 'sobol' (scrambled), 'lhs' or 'random'
+            confidence: Confidence level of the reported intervals
+            seed: Seed for scrambling / sampling
+        """
+        if sampler not in self.SAMPLERS:
+            raise ValueError(f"Unknown sampler '{sampler}' (use one of {self.SAMPLERS})")
+        for v in variations:
+            if v.axis not in SWEEP_AXES or v.axis == 'harmonic_tuning':
+                raise ValueError(f"Cannot vary '{v.axis}'")
+                
+        self.sim = simulator
+        self.specs = simulator.specs
+        self.variations = list(variations)
+        self.limits = limits if limits is not None else spec_limits(self.specs)
+        self.sampler = sampler
+        self.confidence = confidence
+        self.seed = seed
+        
+    def _uniform_source(self):
+        """Callable n -> (n, d) uniforms continuing one sample sequence"""
+        d = len(self.variations)
+        rng = np.random.default_rng(self.seed)
+        if self.sampler == 'sobol':
+            engine = qmc.Sobol(d, scramble=True, seed=rng)
+            draw = engine.random
+        elif self.sampler == 'lhs':
+            engine = qmc.LatinHypercube(d, seed=rng)
+            draw = engine.random
+        else:
+            draw = lambda n: rng.random((n, d))
+        eps = np.finfo(float).eps
+        return lambda n: np.clip(draw(n), eps, 1 - eps)
+        
+    def nominal_inputs(self, designs) -> Dict[str, np.ndarray]:
+        """
+        Nominal design inputs keyed by sweep axis name
+        
+        Args:
+            designs: DataFrame with SWEEP_AXES columns (missing columns take
+                     SWEEP_DEFAULTS) or a list of PADesign
+                     
+        Returns:
+            {axis: (n_designs,) array}
+        """
+        if isinstance(designs, PADesign):
+            designs = [designs]
+        if isinstance(designs, (list, tuple)):
+            designs = pd.DataFrame({
+                'width_um': [d.transistor_width_um for d in designs],
+                'iq_ma': [d.bias_iq_ma for d in designs],
+                'zl_ohm': [d.load_z_real_ohm for d in designs],
+                'zi_ohm': [d.load_z_imag_ohm for d in designs],
+                'harmonic_tuning': [d.harmonic_tuning for d in designs],
+            })
+            
+        defaults = {**SWEEP_DEFAULTS, 'vdd_v': self.specs.vdd_v}
+        n = len(designs)
+        return {axis: (designs[axis].to_numpy() if axis in designs
+                       else np.full(n, defaults[axis]))
+                for axis in SWEEP_AXES}
+                
+    def pass_mask(self, perf) -> np.ndarray:
+        """True where every limited metric lies inside its window"""
+        ok = True
+        for metric, (low, high) in self.limits.items():
+            values = getattr(perf, metric)
+            if low is not None:
+                ok = ok & (values >= low)
+            if high is not None:
+                ok = ok & (values <= high)
+        return np.asarray(ok)
+        
+    def stream(self,
+               designs,
+               max_samples: int = 10_000,
+               batch_samples: int = 1024,
+               ci_halfwidth: float = 1.0,
+               min_samples: int = 256) -> Iterator[YieldEstimate]:
+        """
+        Yield running estimates after each sample batch
+        
+        Designs whose interval half-width (in yield percentage points)
+        drops below ci_halfwidth stop drawing samples; the stream ends when
+        all designs have converged or reached max_samples.
+        
+        Args:
+            designs: Candidate designs (see nominal_inputs)
+            max_samples: Sample budget per design
+            batch_samples: Samples per batch (powers of 2 suit Sobol)
+            ci_halfwidth: Target interval half-width (percentage points)
+            min_samples: Samples drawn before early stopping is allowed
+            
+        Returns:
+            Iterator of YieldEstimate snapshots (arrays are updated in place)
+        """
+        nominal = self.nominal_inputs(designs)
+        n_designs = len(nominal['width_um'])
+        estimate = YieldEstimate(np.zeros(n_designs, dtype=np.int64),
+                                 np.zeros(n_designs, dtype=np.int64),
+                                 self.confidence)
+        active = np.arange(n_designs)
+        draw = self._uniform_source()
+        
+        while active.size:
+            n = min(batch_samples, max_samples - int(estimate.n_samples[active].max()))
+            u = draw(n)
+            
+            # (n_active, 1) nominal x (1, n) perturbation -> one broadcast batch
+            inputs = {axis: values[active, None] for axis, values in nominal.items()}
+            for j, variation in enumerate(self.variations):
+                inputs[variation.axis] = variation.sample(u[None, :, j],
+                                                          inputs[variation.axis])
+            perf = self.sim.simulate_batch(**{SWEEP_AXES[a]: v for a, v in inputs.items()})
+            
+            estimate.n_pass[active] += self.pass_mask(perf).sum(axis=1)
+            estimate.n_samples[active] += n
+            
+            done = estimate.n_samples[active] >= max_samples
+            tight = ((estimate.n_samples[active] >= min_samples) &
+                     (estimate.halfwidth[active] <= ci_halfwidth))
+            active = active[~(done | tight)]
+            yield estimate
+            
+    def estimate(self,
+                 designs,
+                 max_samples: int = 10_000,
+                 batch_samples: int = 1024,
+                 ci_halfwidth: float = 1.0,
+                 min_samples: int = 256,
+                 verbose: bool = True) -> pd.DataFrame:
+        """
+        Run the stream to completion
+        
+        Returns:
+            DataFrame with yield_percent, yield_ci_low, yield_ci_high and
+            yield_samples per design (same row order as designs)
+        """
+        start = time.time()
+        for estimate in self.stream(designs, max_samples, batch_samples,
+                                    ci_halfwidth, min_samples):
+            if verbose:
+                n_open = np.sum(estimate.halfwidth > ci_halfwidth)
+                print(f"  {int(estimate.n_samples.max()):>6} samples: "
+                      f"{n_open} of {len(estimate.n_samples)} designs above "
+                      f"±{ci_halfwidth:.1f}% interval")
+                      
+        result = estimate.to_frame()
+        if verbose:
+            evaluations = int(estimate.n_samples.sum())
+            elapsed = time.time() - start
+            print(f"  {evaluations} evaluations in {elapsed:.2f} s "
+                  f"({evaluations / max(elapsed, 1e-9):,.0f} evals/s)")
+        return result
+        
+    def apply(self, designs: pd.DataFrame, **kwargs) -> pd.DataFrame:
+        """Copy of designs with yield_percent replaced by the Monte Carlo estimate"""
+        result = self.estimate(designs, **kwargs)
+        out = designs.copy()
+        for column in result:
+            out[column] = result[column].to_numpy()
+        return out
+
+
+def main():
+    """Monte Carlo yield of a few hundred sweet-spot candidates"""
+    from linearity_optimizer import SweetSpotFinder
+    
+    specs = PASpecs(freq_ghz=3.5, pout_dbm=43.0, pae_min_percent=45.0,
+                    im3_max_dbc=-40.0, acpr_max_dbc=-45.0, gain_db=15.0, vdd_v=28.0)
+    simulator = PASimulator(specs)
+    
+    sweep = SweetSpotFinder(simulator).sweep(
+        axes={'iq_ma': np.linspace(20, 40, 20), 'zl_ohm': np.linspace(30, 80, 20)},
+        fixed={'width_um': 200.0, 'zi_ohm': 0.0},
+        metrics=['pout_dbm', 'pae_percent', 'im3_dbc', 'yield_percent']
+    )
+    candidates = sweep.to_frame()
+    
+    print(f"Monte Carlo yield of {len(candidates)} candidate designs")
+    mc = MonteCarloYield(simulator)
+    candidates = candidates.rename(columns={'yield_percent': 'yield_heuristic'})
+    candidates = mc.apply(candidates, max_samples=10_000, ci_halfwidth=1.0)
+    
+    print("\nHighest-yield designs:")
+    print(candidates.nlargest(5, 'yield_percent')[
+        ['iq_ma', 'zl_ohm', 'yield_heuristic', 'yield_percent',
+         'yield_ci_low', 'yield_ci_high', 'yield_samples']
+    ].to_string(index=False, float_format='%.1f'))
+
+
+if __name__ == "__main__":
+    main()
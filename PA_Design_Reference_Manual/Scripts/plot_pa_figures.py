@@ -10,9 +10,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import Circle
-from scipy.interpolate import griddata
 import seaborn as sns
 
+from pa_interpolation import ScatteredInterpolator
+
 # Set style
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
@@ -128,7 +129,8 @@ def gamma_to_impedance(gamma, z0=50):
 
 def plot_loadpull_contours(gamma_real, gamma_imag, performance, 
                            levels=None, title="Load-Pull Contours",
-                           metric_name="Pout (dBm)", optimal_point=None):
+                           metric_name="Pout (dBm)", optimal_point=None,
+                           method='cubic', show_error=False, error_levels=None):
     """
     Plot load-pull contours on Smith chart
     
@@ -140,6 +142,11 @@ def plot_loadpull_contours(gamma_real, gamma_imag, performance,
         title: Plot title
         metric_name: Name of performance metric
         optimal_point: (gamma_real, gamma_imag) of optimal impedance
+        method: Interpolation method ('linear', 'cubic', 'natural', 'rbf',
+                'nearest'; see pa_interpolation)
+        show_error: Overlay dashed contours of the estimated interpolation
+                    error and report the leave-one-out RMS error
+        error_levels: Error contour levels (if None, auto-generate)
     
     Returns:
         fig, ax: Matplotlib figure and axis objects
@@ -153,8 +160,8 @@ def plot_loadpull_contours(gamma_real, gamma_imag, performance,
     grid_X, grid_Y = np.meshgrid(grid_x, grid_y)
     
     # Interpolate performance data onto grid
-    grid_perf = griddata((gamma_real, gamma_imag), performance, 
-                         (grid_X, grid_Y), method='cubic')
+    interp = ScatteredInterpolator(gamma_real, gamma_imag, performance, method=method)
+    grid_perf = interp(grid_X, grid_Y)
     
     # Mask points outside Smith chart
     mask = grid_X**2 + grid_Y**2 > 1
@@ -175,6 +182,18 @@ def plot_loadpull_contours(gamma_real, gamma_imag, performance,
                         colors='black', linewidths=0.8, alpha=0.7)
     ax.clabel(contour, inline=True, fontsize=8, fmt='%.1f')
     
+    # Estimated interpolation error (leave-one-out, same units as the metric)
+    if show_error:
+        grid_err = interp.error(grid_X, grid_Y)
+        grid_err[mask] = np.nan
+        error_contour = ax.contour(grid_X, grid_Y, grid_err,
+                                   levels=error_levels if error_levels is not None else 4,
+                                   colors='purple', linestyles='dashed', linewidths=0.8)
+        ax.clabel(error_contour, inline=True, fontsize=7, fmt='±%.2f')
+        ax.text(0.02, 0.02, f"{method} interpolation, LOO RMS error {interp.loo_rms:.2f}",
+                transform=ax.transAxes, fontsize=9,
+                bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='purple'))
+    
     # Colorbar
     cbar = plt.colorbar(contourf, ax=ax, fraction=0.046, pad=0.04)
     cbar.set_label(metric_name, fontsize=11, fontweight='bold')
@@ -199,7 +218,7 @@ def plot_loadpull_contours(gamma_real, gamma_imag, performance,
 # ============================================================================
 
 def plot_performance_surface_3d(gamma_real, gamma_imag, performance,
-                                title="PA Performance Surface"):
+                                title="PA Performance Surface", method='cubic'):
     """
     Create 3D surface plot of PA performance vs impedance
     
@@ -222,8 +241,8 @@ def plot_performance_surface_3d(gamma_real, gamma_imag, performance,
         grid_y = np.linspace(-1, 1, grid_res)
         grid_X, grid_Y = np.meshgrid(grid_x, grid_y)
         
-        grid_perf = griddata((gamma_real, gamma_imag), performance,
-                            (grid_X, grid_Y), method='cubic')
+        grid_perf = ScatteredInterpolator(gamma_real, gamma_imag, performance,
+                                          method=method)(grid_X, grid_Y)
         
         # Mask outside Smith chart
         mask = grid_X**2 + grid_Y**2 > 1